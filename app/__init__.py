@@ -1,24 +1,29 @@
+import gc
 import os
-from flask import Flask, request, redirect, session
+import time
+from flask import Flask, g, request, redirect
 from flask_login import LoginManager
 from flask_wtf.csrf import CSRFProtect
 
-import dmapiclient
 import dmcontent.govuk_frontend
-from dmutils import init_app
-from dmutils.user import User
+from dmutils import init_app, formats
+from dmutils.timing import logged_duration
 
 from govuk_frontend_jinja.flask_ext import init_govuk_frontend
 
 from config import configs
 
+from .api_client import RequestMemoizingDataAPIClient
+from .user_cache import user_cache
+
 
 login_manager = LoginManager()
-data_api_client = dmapiclient.DataAPIClient()
+data_api_client = RequestMemoizingDataAPIClient()
 csrf = CSRFProtect()
 
 
 def create_app(config_name):
+    created_at = time.monotonic()
     application = Flask(__name__,
                         static_folder='static/',
                         static_url_path=configs[config_name].STATIC_URL_PATH)
@@ -33,14 +38,23 @@ def create_app(config_name):
         login_manager=login_manager,
     )
 
-    from .metrics import metrics as metrics_blueprint, gds_metrics
+    from .metrics import create_metrics_blueprint
     from .create_buyer.views.create_buyer import create_buyer as create_buyer_blueprint
     from .main import dos as dos_blueprint
     from dmutils.external import external as external_blueprint
     from .main import main as main_blueprint
     from .status import status as status_blueprint
     from .healthcheck import healthcheck as healthcheck_blueprint
-
+    from .main.helpers.framework_cache import framework_cache
+    from .concurrent_fetch import concurrent_fetcher
+    from .main.helpers.response_exports import response_exports
+    from .main.helpers.page_cache import brief_preview_cache
+    from .main.helpers.dates import parsing_timestamps
+    from .session_refresh import session_refresh
+    from .instrumentation import request_instrumentation
+    from . import template_cache
+
+    metrics_blueprint, gds_metrics = create_metrics_blueprint()
     application.register_blueprint(metrics_blueprint, url_prefix='/buyers')
     application.register_blueprint(create_buyer_blueprint, url_prefix='/buyers')
     application.register_blueprint(dos_blueprint, url_prefix='/buyers')
@@ -58,6 +72,26 @@ def create_app(config_name):
     login_manager.login_message = None  # don't flash message to user
     gds_metrics.init_app(application)
     csrf.init_app(application)
+    framework_cache.init_app(application)
+    concurrent_fetcher.init_app(application)
+    response_exports.init_app(application)
+    brief_preview_cache.init_app(application)
+    session_refresh.init_app(application)
+    user_cache.init_app(application)
+    request_instrumentation.init_app(application)
+    template_cache.init_app(application)
+
+    # Replace the date filters registered by dmutils with ones parsing API timestamps through our memoized parser
+    for date_filter in (
+        formats.dateformat,
+        formats.datetimeformat,
+        formats.displaytimeformat,
+        formats.shortdateformat,
+        formats.timeformat,
+        formats.utcdatetimeformat,
+        formats.utctoshorttimelongdateformat,
+    ):
+        application.add_template_filter(parsing_timestamps(date_filter))
 
     # We want to be able to access this function from within all templates
     application.jinja_env.globals["render_question"] = (
@@ -78,14 +112,63 @@ def create_app(config_name):
             else:
                 return redirect(request.path[:-1], code=301)
 
-    @application.before_request
-    def refresh_session():
-        session.permanent = True
-        session.modified = True
+    if application.config['DM_PRECOMPILE_TEMPLATES']:
+        template_cache.precompile_templates(application)
+
+    application.logger.info(
+        "Spent {duration_real}s in create_app",
+        extra={'duration_real': round(time.monotonic() - created_at, 6)},
+    )
+    log_first_request_duration(application, created_at)
+
+    if application.config['DM_PREFORK_WARM_UP']:
+        prefork_warm_up(application)
 
     return application
 
 
+def log_first_request_duration(application, created_at):
+    """Log how long each process's first request took, and how long after the app was created it was finished"""
+    logged_pids = set()
+
+    @application.before_request
+    def start_first_request():
+        if os.getpid() not in logged_pids:
+            g._first_request_started_at = time.monotonic()
+
+    @application.after_request
+    def finish_first_request(response):
+        started_at = g.pop('_first_request_started_at', None)
+        if started_at is not None and os.getpid() not in logged_pids:
+            logged_pids.add(os.getpid())
+            finished_at = time.monotonic()
+            application.logger.info(
+                "Spent {duration_real}s on first request, {since_created}s after create_app",
+                extra={
+                    'duration_real': round(finished_at - started_at, 6),
+                    'since_created': round(finished_at - created_at, 6),
+                },
+            )
+        return response
+
+
+def prefork_warm_up(application):
+    """Prepare a fully loaded application to be forked into worker processes
+
+    Framework content is loaded when the app is created (see `app.main`), so by the time this is called from the
+    master process everything the workers need is already in memory. Freezing the garbage collector moves all of those
+    objects out of its reach, so workers' collections no longer write to (and so copy) the pages they share with the
+    master.
+    """
+    with logged_duration(
+        logger=application.logger,
+        message="Spent {duration_real}s in prefork_warm_up",
+        condition=True,
+    ):
+        gc.collect()
+        gc.freeze()
+
+
 @login_manager.user_loader
 def load_user(user_id):
-    return User.load_user(data_api_client, user_id)
+    return user_cache.load_user(data_api_client, user_id)
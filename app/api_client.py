@@ -0,0 +1,135 @@
+import inspect
+import re
+import threading
+from copy import deepcopy
+from functools import wraps
+
+from flask import g, has_app_context, has_request_context, request
+
+import dmapiclient
+
+from .api_transport import PooledTransport
+from .instrumentation import request_instrumentation
+from .metrics import DATA_API_CALLS_SAVED_TOTAL
+
+
+BRIEF_URL_PATTERN = re.compile(r"^/briefs/(?P<brief_id>[^/?]+)")
+
+# reads which aren't addressed by brief id but can still reflect a brief's state
+BRIEF_LISTING_URLS = ("/briefs", "/brief-responses")
+
+
+class RequestMemoizingDataAPIClient(dmapiclient.DataAPIClient):
+    """A DataAPIClient which remembers the results of GET requests for the lifetime of the current request
+
+    Views commonly fetch the same framework and brief more than once while handling a single request (e.g. once in
+    `get_framework_and_lot` and again in a helper). Identical reads made within one request are answered from a memo
+    stored on `flask.g` rather than making another round-trip to the API. Callers always receive their own copy of the
+    result so are free to mutate it.
+
+    Any write made through the client drops memoized reads which could have been affected by it: a write to
+    `/briefs/<brief_id>/...` drops everything read for that brief along with any brief or brief response listings,
+    any other write drops the whole memo.
+
+    Outside of a request context this behaves exactly like a plain DataAPIClient.
+
+    Requests are made through a `PooledTransport`, so connections to the API are reused - see app/api_transport.py.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.transport = PooledTransport()
+
+    def init_app(self, app):
+        super().init_app(app)
+        self._timeout = (app.config['DM_DATA_API_CONNECT_TIMEOUT'], app.config['DM_DATA_API_READ_TIMEOUT'])
+        self.transport.init_app(app)
+
+    def _requests_retry_session(self, *, retry_read_timeouts=True):
+        return self.transport.session(retry_read_timeouts=retry_read_timeouts)
+
+    def _request(self, method, url, data=None, params=None, *, client_wait_for_response=True):
+        if not (has_app_context() and has_request_context()):
+            return super()._request(
+                method, url, data=data, params=params, client_wait_for_response=client_wait_for_response
+            )
+
+        memo = self._get_memo()
+
+        if method != "GET":
+            self._invalidate(memo, url)
+            request_instrumentation.record_api_call()
+            return super()._request(
+                method, url, data=data, params=params, client_wait_for_response=client_wait_for_response
+            )
+
+        key = (url, repr(sorted((params or {}).items())))
+        if key in memo:
+            DATA_API_CALLS_SAVED_TOTAL.labels(request.endpoint or "No endpoint").inc()
+            # the request's `g` may be shared by several threads (see app/concurrent_fetch.py)
+            with g._data_api_memo_lock:
+                g._data_api_calls_saved += 1
+            return deepcopy(memo[key])
+
+        request_instrumentation.record_api_call()
+        result = super()._request(
+            method, url, data=data, params=params, client_wait_for_response=client_wait_for_response
+        )
+        if client_wait_for_response and result is not None:
+            memo[key] = deepcopy(result)
+        return result
+
+    @staticmethod
+    def prepare_memo():
+        """Create the current request's memo if it hasn't been already
+
+        This must be done before the request's `g` is shared with other threads, so they can't each create their own.
+        """
+        if "_data_api_memo" not in g:
+            g._data_api_memo = {}
+            g._data_api_memo_lock = threading.Lock()
+            g._data_api_calls_saved = 0
+
+    @classmethod
+    def _get_memo(cls):
+        cls.prepare_memo()
+        return g._data_api_memo
+
+    @staticmethod
+    def _invalidate(memo, url):
+        brief_match = BRIEF_URL_PATTERN.match(url)
+        if not brief_match:
+            memo.clear()
+            return
+
+        brief_url = "/briefs/{}".format(brief_match.group("brief_id"))
+        for key in list(memo):
+            memo_url = key[0]
+            if (
+                memo_url in BRIEF_LISTING_URLS
+                or memo_url.startswith("/brief-responses/")
+                or memo_url == brief_url
+                or memo_url.startswith(brief_url + "/")
+            ):
+                del memo[key]
+
+    @staticmethod
+    def calls_saved():
+        """The number of API calls avoided so far during the current request"""
+        return g.get("_data_api_calls_saved", 0) if has_app_context() else 0
+
+
+def _timed_api_method(method_name, method):
+    @wraps(method)
+    def timed_api_method(self, *args, **kwargs):
+        with request_instrumentation.timed_api_method(method_name):
+            return method(self, *args, **kwargs)
+
+    return timed_api_method
+
+
+# time each of the client's API methods (see app/instrumentation.py) - the `_iter` methods are generators, so only the
+# methods they call for each page are timed
+for _method_name, _method in inspect.getmembers(dmapiclient.DataAPIClient, inspect.isfunction):
+    if not (_method_name.startswith("_") or _method_name == "init_app" or inspect.isgeneratorfunction(_method)):
+        setattr(RequestMemoizingDataAPIClient, _method_name, _timed_api_method(_method_name, _method))
@@ -0,0 +1,153 @@
+import os
+import socket
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+from .metrics import (
+    DATA_API_CONNECTIONS_IN_USE,
+    DATA_API_CONNECTIONS_OPENED_TOTAL,
+    DATA_API_POOL_MAX_SIZE,
+)
+
+# failed reads and 5xx responses are only retried for requests which are safe to repeat - a request which couldn't
+# connect at all is retried whatever its method, as it never reached the API
+RETRIED_METHODS = frozenset(('GET', 'HEAD'))
+RETRIED_STATUS_CODES = (500, 502, 503, 504)
+
+
+class _MeteredPoolMixin(object):
+    """Counts the connections a urllib3 connection pool opens and how many are in use"""
+
+    def _new_conn(self):
+        DATA_API_CONNECTIONS_OPENED_TOTAL.inc()
+        return super()._new_conn()
+
+    def _get_conn(self, timeout=None):
+        conn = super()._get_conn(timeout=timeout)
+        DATA_API_CONNECTIONS_IN_USE.inc()
+        return conn
+
+    def _put_conn(self, conn):
+        # every connection taken from the pool is put back (as None if it was closed), keeping its slot
+        DATA_API_CONNECTIONS_IN_USE.dec()
+        return super()._put_conn(conn)
+
+
+class _MeteredHTTPConnectionPool(_MeteredPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class _MeteredHTTPSConnectionPool(_MeteredPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """An `HTTPAdapter` whose connection pools are metered, optionally enabling TCP keep-alive on their connections"""
+
+    __attrs__ = HTTPAdapter.__attrs__ + ['tcp_keepalive_idle']
+
+    def __init__(self, *args, tcp_keepalive_idle=0, **kwargs):
+        self.tcp_keepalive_idle = tcp_keepalive_idle
+        super().__init__(*args, **kwargs)
+
+    def _socket_options(self):
+        options = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+        if self.tcp_keepalive_idle > 0:
+            options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+            # not every platform lets the idle time be set
+            if hasattr(socket, 'TCP_KEEPIDLE'):
+                options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, self.tcp_keepalive_idle))
+        return options
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        super().init_poolmanager(
+            connections, maxsize, block=block, socket_options=self._socket_options(), **pool_kwargs
+        )
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _MeteredHTTPConnectionPool,
+            'https': _MeteredHTTPSConnectionPool,
+        }
+
+
+class PooledTransport(object):
+    """The HTTP sessions used by a data API client, whose connections are kept open and reused between API calls
+
+    `dmapiclient` creates a new `requests.Session` for every API call, so each call opens (and for HTTPS, negotiates) a
+    new connection. Instead one session is kept for each process and shared between its threads, holding at most
+    `DM_DATA_API_POOL_SIZE` idle connections to each host. With `DM_DATA_API_POOL_BLOCK` set, threads wait for a
+    connection rather than opening more than that.
+
+    GETs are retried with backoff after timeouts and 5xx responses, and any request which failed to connect is retried,
+    up to `DM_DATA_API_RETRIES` times.
+
+    Sessions are created on first use and again after a fork, so worker processes never share connections.
+    """
+
+    def __init__(self, pool_size=10, pool_block=False, tcp_keepalive_idle=0, retries=5, retry_backoff_factor=0.3):
+        self.pool_size = pool_size
+        self.pool_block = pool_block
+        self.tcp_keepalive_idle = tcp_keepalive_idle
+        self.retries = retries
+        self.retry_backoff_factor = retry_backoff_factor
+        self._sessions = {}
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.pool_size = app.config['DM_DATA_API_POOL_SIZE']
+        self.pool_block = app.config['DM_DATA_API_POOL_BLOCK']
+        self.tcp_keepalive_idle = app.config['DM_DATA_API_TCP_KEEPALIVE_IDLE']
+        self.retries = app.config['DM_DATA_API_RETRIES']
+        self.retry_backoff_factor = app.config['DM_DATA_API_RETRY_BACKOFF_FACTOR']
+        self.close()
+
+    def close(self):
+        """Close every pooled connection - sessions will be created again when next needed"""
+        with self._lock:
+            sessions, self._sessions = self._sessions, {}
+        for session in sessions.values():
+            session.close()
+
+    def session(self, *, retry_read_timeouts=True):
+        """The shared session for this process, retrying read timeouts or not"""
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    # the parent's sockets must be left alone rather than closed
+                    self._sessions = {}
+                    self._pid = os.getpid()
+
+        session = self._sessions.get(retry_read_timeouts)
+        if session is None:
+            with self._lock:
+                session = self._sessions.get(retry_read_timeouts)
+                if session is None:
+                    session = self._sessions[retry_read_timeouts] = self._new_session(retry_read_timeouts)
+        return session
+
+    def _new_session(self, retry_read_timeouts):
+        retry = Retry(
+            total=self.retries,
+            read=self.retries if retry_read_timeouts else 0,
+            connect=self.retries,
+            status=self.retries,
+            backoff_factor=self.retry_backoff_factor,
+            status_forcelist=RETRIED_STATUS_CODES,
+            allowed_methods=RETRIED_METHODS,
+            raise_on_status=False,
+        )
+        adapter = PooledHTTPAdapter(
+            pool_maxsize=self.pool_size,
+            pool_block=self.pool_block,
+            max_retries=retry,
+            tcp_keepalive_idle=self.tcp_keepalive_idle,
+        )
+        DATA_API_POOL_MAX_SIZE.set(self.pool_size)
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
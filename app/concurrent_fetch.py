@@ -0,0 +1,106 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+
+from flask import copy_current_request_context, current_app, g, has_request_context
+
+from .api_client import RequestMemoizingDataAPIClient
+
+
+class ConcurrentFetcher(object):
+    """A bounded pool of threads, shared by the whole app, for making independent API reads in parallel
+
+    Each call is run within the request context it was made from: the worker shares the request's `g` (so the data
+    API client's request memo and the logged in user) and a copy of the request itself (so onward request id headers
+    are still sent).
+
+    Outside of a request, from within one of the pool's own threads or if the pool is configured with no workers, calls
+    are simply made one after the other.
+
+    Calls never queue for the pool: any which can't be given a free worker straight away are made in the calling thread
+    instead, so under load a request is no slower than if it made its calls one after the other.
+    """
+
+    def __init__(self, max_workers=0):
+        self.max_workers = max_workers
+        self._executor = None
+        self._free_workers = None
+        self._executor_lock = threading.Lock()
+        self._local = threading.local()
+
+    def init_app(self, app):
+        self.max_workers = app.config['DM_CONCURRENT_FETCH_MAX_WORKERS']
+        self.shutdown()
+
+    def shutdown(self):
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+            self._free_workers = None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _get_executor(self):
+        """Return the pool, along with a semaphore counting its workers which aren't busy"""
+        # created on first use rather than in `init_app` so that the pool's threads are started in each forked worker
+        # process rather than (uselessly) in the master
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix='concurrent-fetch',
+                )
+                self._free_workers = threading.BoundedSemaphore(self.max_workers)
+            return self._executor, self._free_workers
+
+    def _run_in_app_context(self, app_context, free_workers, fetch):
+        self._local.in_pool = True
+        try:
+            with app_context:
+                return fetch()
+        finally:
+            self._local.in_pool = False
+            free_workers.release()
+
+    @staticmethod
+    def _run_inline(fetch):
+        future = Future()
+        try:
+            future.set_result(fetch())
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def fetch_all(self, *fetches):
+        """Call each of `fetches` (functions taking no arguments) concurrently and return their results in order
+
+        If any call raises, the exception from the first of them (in argument order) is re-raised once all calls have
+        finished.
+        """
+        if not (self.max_workers and has_request_context()) or getattr(self._local, 'in_pool', False):
+            return [fetch() for fetch in fetches]
+
+        # created here, before `g` is shared, so that every thread uses the same memo
+        RequestMemoizingDataAPIClient.prepare_memo()
+
+        executor, free_workers = self._get_executor()
+        futures = [None] * len(fetches)
+        inline = []
+        for i, fetch in enumerate(fetches):
+            if not free_workers.acquire(blocking=False):
+                inline.append(i)
+                continue
+            app_context = current_app._get_current_object().app_context()
+            app_context.g = g._get_current_object()
+            futures[i] = executor.submit(
+                self._run_in_app_context, app_context, free_workers, copy_current_request_context(fetch),
+            )
+
+        # made while the pool works on the others
+        for i in inline:
+            futures[i] = self._run_inline(fetches[i])
+
+        # wait for everything, even after a failure, so nothing is left running once the request has finished
+        wait(futures)
+        return [future.result() for future in futures]
+
+
+concurrent_fetcher = ConcurrentFetcher()
@@ -0,0 +1,123 @@
+import threading
+from contextlib import contextmanager
+from time import perf_counter
+
+from flask import before_render_template, g, has_request_context, request, template_rendered
+
+from .metrics import (
+    DATA_API_CALLS_PER_REQUEST,
+    DATA_API_METHOD_DURATION_SECONDS,
+    TEMPLATE_RENDER_DURATION_SECONDS,
+)
+
+
+class RequestTimings(object):
+    """How much of a request's time has gone on data API calls and rendering templates so far"""
+
+    def __init__(self):
+        self.api_calls = 0
+        self.api_seconds = 0.0
+        self.render_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def add_api_call(self):
+        with self._lock:
+            self.api_calls += 1
+
+    def add_api_seconds(self, seconds):
+        with self._lock:
+            self.api_seconds += seconds
+
+    def add_render_seconds(self, seconds):
+        with self._lock:
+            self.render_seconds += seconds
+
+    def server_timing(self):
+        return 'api;desc="{} data API calls";dur={:.1f}, render;dur={:.1f}'.format(
+            self.api_calls, self.api_seconds * 1e3, self.render_seconds * 1e3,
+        )
+
+
+class RequestInstrumentation(object):
+    """Records, for each endpoint, the data API calls made, the time spent in each API client method and in rendering
+
+    The figures are exported as Prometheus histograms labelled by endpoint and, when `DM_SERVER_TIMING_HEADER` is set,
+    each response's totals are sent in a `Server-Timing` header so they show up in the browser's developer tools.
+
+    Only the outermost API client method is timed when methods call one another. API calls made from threads sharing
+    the request's `g` (see app/concurrent_fetch.py) are counted towards the request, so its total API time can be more
+    than its duration.
+    """
+
+    def __init__(self):
+        self.server_timing_header = False
+        self._local = threading.local()
+
+    def init_app(self, app):
+        self.server_timing_header = app.config['DM_SERVER_TIMING_HEADER']
+        app.before_request(self.before_request)
+        app.after_request(self.after_request)
+        before_render_template.connect(self.before_render_template, sender=app)
+        template_rendered.connect(self.template_rendered, sender=app)
+
+    @staticmethod
+    def _endpoint():
+        return (request.endpoint if has_request_context() else None) or "No endpoint"
+
+    @staticmethod
+    def _timings():
+        return g.get('_request_timings') if has_request_context() else None
+
+    def before_request(self):
+        g._request_timings = RequestTimings()
+
+    def after_request(self, response):
+        timings = self._timings()
+        if timings is None:
+            return response
+
+        DATA_API_CALLS_PER_REQUEST.labels(self._endpoint()).observe(timings.api_calls)
+        if self.server_timing_header:
+            response.headers.add('Server-Timing', timings.server_timing())
+        return response
+
+    def record_api_call(self):
+        """Count a request made to the data API during the current request"""
+        timings = self._timings()
+        if timings is not None:
+            timings.add_api_call()
+
+    @contextmanager
+    def timed_api_method(self, method_name):
+        if getattr(self._local, 'in_api_method', False):
+            yield
+            return
+
+        self._local.in_api_method = True
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self._local.in_api_method = False
+            duration = perf_counter() - start
+            DATA_API_METHOD_DURATION_SECONDS.labels(self._endpoint(), method_name).observe(duration)
+            timings = self._timings()
+            if timings is not None:
+                timings.add_api_seconds(duration)
+
+    def before_render_template(self, sender, template, context, **extra):
+        g.setdefault('_render_starts', []).append(perf_counter())
+
+    def template_rendered(self, sender, template, context, **extra):
+        starts = g.get('_render_starts')
+        if not starts:
+            return
+
+        duration = perf_counter() - starts.pop()
+        TEMPLATE_RENDER_DURATION_SECONDS.labels(self._endpoint()).observe(duration)
+        timings = self._timings()
+        if timings is not None:
+            timings.add_render_seconds(duration)
+
+
+request_instrumentation = RequestInstrumentation()
@@ -1,4 +1,3 @@
-from copy import deepcopy
 from functools import partial
 
 from flask import Blueprint
@@ -8,6 +7,9 @@ from dmcontent.content_loader import ContentLoader
 from dmutils.access_control import require_login
 from dmutils.timing import logged_duration
 
+from .helpers.content import CopyOnWriteContentLoader, FilteredManifestCache
+from .helpers.task_list import framework_urls
+
 
 main = Blueprint('buyers', __name__)
 dos = Blueprint('dos', __name__)
@@ -17,7 +19,7 @@ dos = Blueprint('dos', __name__)
 _local = Local()
 
 
-def _make_content_loader_factory():
+def _load_primary_content_loader():
     primary_cl = ContentLoader('app/content')
     primary_cl.load_manifest('digital-outcomes-and-specialists', 'briefs', 'edit_brief')
     primary_cl.load_manifest('digital-outcomes-and-specialists', 'brief-responses', 'output_brief_response')
@@ -47,8 +49,20 @@ def _make_content_loader_factory():
     primary_cl.load_manifest('digital-outcomes-and-specialists-5', 'clarification_question', 'clarification_question')
     primary_cl.load_manifest('digital-outcomes-and-specialists-5', 'briefs', 'award_brief')
 
-    # seal primary_cl in a closure by returning a function which will only ever return an independent copy of it
-    return lambda: deepcopy(primary_cl)
+    for framework_slug in list(primary_cl._content):
+        primary_cl.load_messages(framework_slug, ['urls'])
+    framework_urls.preload(primary_cl, list(primary_cl._content))
+
+    return primary_cl
+
+
+def _make_content_loader_factory():
+    primary_cl = _load_primary_content_loader()
+
+    # seal primary_cl in a closure by returning a function which will only ever return an independent copy-on-write
+    # view of it, so all threads share a single copy of the loaded content and a single cache of manifests filtered
+    # by lot
+    return partial(CopyOnWriteContentLoader, primary_cl, FilteredManifestCache())
 
 
 _content_loader_factory = _make_content_loader_factory()
@@ -69,6 +83,8 @@ main.before_request(partial(require_login, role='buyer'))
 
 @main.after_request
 def add_cache_control(response):
+    # pages are only for the logged in user, and may only be reused once checked with us (see helpers/page_cache.py)
+    response.cache_control.private = True
     response.cache_control.no_cache = True
     return response
 
@@ -16,18 +16,12 @@ class AwardedBriefResponseForm(FlaskForm):
     def __init__(self, brief_responses, *args, **kwargs):
         """
             Requires extra argument:
-             - `brief_responses` - list of BriefResponses for the multiple choice
+             - `brief_responses` - list of BriefResponses for the multiple choice, in the order they should be offered
+               (see `BriefResponses.by_supplier_name`)
         """
         super(AwardedBriefResponseForm, self).__init__(*args, **kwargs)
 
-        brief_responses = list(
-            sorted(
-                [{'id': b['id'], 'name': b['supplierName']} for b in brief_responses],
-                key=lambda x: x['name']
-            )
-        )
-
-        self.brief_response.choices = [(br['id'], br['name']) for br in brief_responses]
+        self.brief_response.choices = [(br['id'], br['supplierName']) for br in brief_responses]
         self.brief_response.govuk_options = govuk_options(
-            [{"value": br['id'], "label": br['name']} for br in brief_responses]
+            [{"value": br['id'], "label": br['supplierName']} for br in brief_responses]
         )
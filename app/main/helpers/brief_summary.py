@@ -0,0 +1,73 @@
+from flask import g, has_request_context
+
+from .buyers_helpers import count_unanswered_questions
+
+
+class BriefSummary(object):
+    """A brief's answers summarised against one (already filtered) manifest, with its sections and questions indexed
+
+    `manifest.summary(brief)` builds a summary object for every question of the manifest, and looking a question or
+    section up in it walks every section in turn. This builds the summary once, indexes its sections by slug and its
+    questions (including each question of a multiquestion) by id, and counts the unanswered questions the first time
+    they're asked for.
+
+    Use `for_request` to share one summary between everything handling a request. The summary must be treated as
+    read-only, apart from adding display attributes (e.g. `summary_list`) to its sections.
+    """
+
+    def __init__(self, manifest, brief):
+        self.manifest = manifest
+        self.brief = brief
+        self.sections = manifest.summary(brief)
+        self._sections_by_slug = {}
+        self._questions_by_id = {}
+        for section in self.sections:
+            self._sections_by_slug.setdefault(section.id, section)
+            for question in section.questions:
+                self._questions_by_id.setdefault(question.id, (section, question))
+                for sub_question in getattr(question, 'questions', ()):
+                    self._questions_by_id.setdefault(sub_question.id, (section, sub_question))
+        self._unanswered_counts = None
+
+    @classmethod
+    def for_request(cls, manifest, brief):
+        """The summary of `brief` against `manifest`, built at most once during the current request"""
+        if not has_request_context():
+            return cls(manifest, brief)
+
+        summaries = g.setdefault('_brief_summaries', {})
+        # the manifest is kept alive by the summary, so its id can't be reused while the summary is stored
+        key = (id(manifest), brief['id'], brief.get('updatedAt'))
+        if key not in summaries:
+            summaries[key] = cls(manifest, brief)
+        return summaries[key]
+
+    def __iter__(self):
+        return iter(self.sections)
+
+    def get_section(self, section_slug):
+        """The summarised section with `section_slug`, or None"""
+        return self._sections_by_slug.get(section_slug)
+
+    def get_question(self, question_id):
+        """The summarised question with `question_id`, or None"""
+        return self._questions_by_id.get(question_id, (None, None))[1]
+
+    def section_for_question(self, question_id):
+        """The summarised section containing the question with `question_id`, or None"""
+        return self._questions_by_id.get(question_id, (None, None))[0]
+
+    @property
+    def unanswered_counts(self):
+        """A tuple of the numbers of unanswered required and unanswered optional questions"""
+        if self._unanswered_counts is None:
+            self._unanswered_counts = count_unanswered_questions(self.sections)
+        return self._unanswered_counts
+
+    @property
+    def unanswered_required(self):
+        return self.unanswered_counts[0]
+
+    @property
+    def unanswered_optional(self):
+        return self.unanswered_counts[1]
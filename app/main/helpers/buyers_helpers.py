@@ -1,11 +1,18 @@
+from functools import partial
+from typing import NamedTuple
+
 from flask import abort
 
+from ...concurrent_fetch import concurrent_fetcher
+from .framework_cache import framework_cache
+from .response_analysis import BriefResponses
+from .unanswered_questions import RequiredQuestionChecker
+
 
 def get_framework_and_lot(framework_slug, lot_slug, data_api_client, allowed_statuses=None, must_allow_brief=False):
-    framework = data_api_client.get_framework(framework_slug)['frameworks']
-    try:
-        lot = next(lot for lot in framework['lots'] if lot['slug'] == lot_slug)
-    except StopIteration:
+    framework, lots_by_slug = framework_cache.get(framework_slug, data_api_client)
+    lot = lots_by_slug.get(lot_slug)
+    if lot is None:
         abort(404)
 
     if allowed_statuses and framework['status'] not in allowed_statuses:
@@ -31,6 +38,48 @@ def is_brief_associated_with_user(brief, current_user_id):
     return current_user_id in user_ids
 
 
+class BriefContext(NamedTuple):
+    framework: dict
+    lot: dict
+    brief: dict
+
+
+def load_brief_context(
+    framework_slug,
+    lot_slug,
+    brief_id,
+    data_api_client,
+    current_user_id,
+    allowed_framework_statuses=('live', 'expired'),
+    allowed_brief_statuses=None,
+    must_be_editable=False,
+):
+    """Load the framework, lot and brief for a brief-scoped view, aborting with a 404 if any of them aren't right
+
+    The framework and brief are fetched concurrently. The lot must allow briefs and the brief must belong to the user,
+    and to this framework and lot, as checked by `is_brief_correct`.
+    """
+    (framework, lot), brief_response = concurrent_fetcher.fetch_all(
+        partial(
+            get_framework_and_lot,
+            framework_slug,
+            lot_slug,
+            data_api_client,
+            allowed_statuses=allowed_framework_statuses,
+            must_allow_brief=True,
+        ),
+        partial(data_api_client.get_brief, brief_id),
+    )
+    brief = brief_response["briefs"]
+
+    if not is_brief_correct(brief, framework_slug, lot_slug, current_user_id, allowed_statuses=allowed_brief_statuses):
+        abort(404)
+    if must_be_editable and not brief_can_be_edited(brief):
+        abort(404)
+
+    return BriefContext(framework, lot, brief)
+
+
 def brief_can_be_edited(brief):
     return brief.get('status') == 'draft'
 
@@ -61,24 +110,30 @@ def add_unanswered_counts_to_briefs(briefs, content_loader):
         content = content_loader.get_manifest(brief.get('frameworkSlug'), 'edit_brief').filter(
             {'lot': brief.get('lotSlug')}
         )
-        sections = content.summary(brief)
-        unanswered_required, unanswered_optional = count_unanswered_questions(sections)
+        unanswered_required, unanswered_optional = RequiredQuestionChecker.for_manifest(content).count_unanswered(brief)
         brief['unanswered_required'] = unanswered_required
         brief['unanswered_optional'] = unanswered_optional
 
     return briefs
 
 
+class BriefsPage(NamedTuple):
+    briefs: list
+    number: int
+    total_pages: int
+    total: int
+
+
+def paginate_briefs(briefs, page_number, page_size):
+    """Return the `page_number`th page (counting from 1) of `briefs`, or the nearest page to it there is"""
+    total_pages = max(1, -(-len(briefs) // page_size))
+    number = min(max(page_number, 1), total_pages)
+    start = (number - 1) * page_size
+    return BriefsPage(briefs[start:start + page_size], number, total_pages, len(briefs))
+
+
 def get_sorted_responses_for_brief(brief, data_api_client):
-    brief_responses = data_api_client.find_brief_responses(brief['id'])['briefResponses']
-    if brief.get("niceToHaveRequirements"):
-        return sorted(
-            brief_responses,
-            key=lambda k: len([nice for nice in k['niceToHaveRequirements'] if nice is True]),
-            reverse=True
-        )
-    else:
-        return brief_responses
+    return BriefResponses(brief, data_api_client.find_brief_responses(brief['id'])['briefResponses'])
 
 
 def is_legacy_brief_response(brief_response, brief=None):
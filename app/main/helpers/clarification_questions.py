@@ -0,0 +1,31 @@
+from functools import lru_cache
+
+from dmcontent.html import text_to_html
+
+# enough for every question and answer on the live briefs being looked at, many times over
+RENDERED_TEXT_CACHE_SIZE = 2048
+
+
+@lru_cache(maxsize=RENDERED_TEXT_CACHE_SIZE)
+def clarification_text_to_html(text):
+    """A clarification question or answer as HTML, with its links formatted and its line breaks kept
+
+    Questions and answers can't be changed once they're published, but they were all converted again on every view of
+    a brief's questions. Converted text is memoized by its content, the least recently used being dropped once the
+    cache is full. The returned `Markup` is shared so mustn't be changed.
+    """
+    return text_to_html(text, format_links=True, preserve_line_breaks=True)
+
+
+def numbered_clarification_questions(questions):
+    """Copies of a brief's clarification questions, each with its `number` as shown to users (starting from 1)"""
+    return [dict(question, number=number) for number, question in enumerate(questions, start=1)]
+
+
+def clarification_question_rows(questions):
+    """A brief's numbered clarification questions, each with the `key` and `value` of a govukSummaryList row"""
+    rows = numbered_clarification_questions(questions)
+    for row in rows:
+        row['key'] = {'html': f"{row['number']}. {clarification_text_to_html(row['question'])}"}
+        row['value'] = {'html': clarification_text_to_html(row['answer'])}
+    return rows
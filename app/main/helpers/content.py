@@ -0,0 +1,137 @@
+from collections import ChainMap, OrderedDict, defaultdict
+from functools import partial
+from threading import Lock
+from types import MappingProxyType
+
+from dmcontent.content_loader import ContentLoader, ContentManifest, ContentSection
+
+from app.metrics import FILTERED_MANIFEST_CACHE_TOTAL
+
+
+class FilteredManifestCache(object):
+    """A bounded, thread-safe LRU cache of filtered manifests, shared between all the content loaders of a process
+
+    Entries are keyed on (framework slug, manifest name, dynamic, filter context), so a manifest filtered for one lot is
+    only ever built once however many requests (or threads) ask for it.
+    """
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_or_create(self, key, create):
+        manifest_name = key[1]
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                FILTERED_MANIFEST_CACHE_TOTAL.labels(manifest_name, 'hit').inc()
+                return self._entries[key]
+
+        FILTERED_MANIFEST_CACHE_TOTAL.labels(manifest_name, 'miss').inc()
+        # build outside the lock - two threads racing for the same key will build equivalent manifests and the
+        # second one stored wins, which is harmless
+        value = create()
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class _MemoizedFilterManifest(ContentManifest):
+    """The ContentManifest returned by a CopyOnWriteContentLoader for manifests shared from its primary
+
+    Its sections are only built when first needed, and filtering it by lot alone is answered from the shared
+    FilteredManifestCache, so the common `get_manifest(...).filter({'lot': ...})` does no work on a cache hit.
+
+    Manifests returned from the cache are shared between threads and must be treated as read-only - anything that
+    needs to modify one (e.g. `.summary(brief)`) should be given a new copy, as `summary` and `filter` already do unless
+    `inplace_allowed` is passed.
+    """
+
+    _cacheable_context_keys = frozenset(('lot',))
+
+    def __init__(self, sections, cache_key, filtered_manifest_cache):
+        self._raw_sections = sections
+        self._sections = None
+        self._cache_key = cache_key
+        self._filtered_manifest_cache = filtered_manifest_cache
+
+    @property
+    def sections(self):
+        if self._sections is None:
+            self._sections = [ContentSection.create(section) for section in self._raw_sections]
+            self._assign_question_numbers()
+        return self._sections
+
+    @sections.setter
+    def sections(self, sections):
+        self._sections = sections
+
+    def filter(self, context, dynamic=True, inplace_allowed=False):
+        if inplace_allowed or not self._cacheable_context_keys.issuperset(context):
+            return super().filter(context, dynamic=dynamic, inplace_allowed=inplace_allowed)
+
+        return self._filtered_manifest_cache.get_or_create(
+            self._cache_key + (dynamic, tuple(sorted(context.items()))),
+            lambda: ContentManifest.filter(self, context, dynamic=dynamic),
+        )
+
+
+class _CopyOnWriteMapping(dict):
+    """A per-framework mapping whose reads fall through to a read-only view of a shared mapping
+
+    Writes (e.g. a `load_messages` call) only ever land in the framework's local layer."""
+
+    def __init__(self, shared):
+        super().__init__()
+        self._shared = shared
+
+    def __missing__(self, framework_slug):
+        value = self[framework_slug] = ChainMap({}, MappingProxyType(self._shared.get(framework_slug, {})))
+        return value
+
+
+class CopyOnWriteContentLoader(ContentLoader):
+    """A cheap, independent view of a fully loaded "primary" ContentLoader
+
+    Rather than each thread taking a deepcopy of every loaded manifest, all threads read the primary loader's
+    manifests, messages and metadata directly. Anything a thread loads itself is kept in its own layer so the primary
+    is never modified and can be shared freely. Manifests returned by `get_manifest` (and anything derived from them by
+    `filter` or `summary`) are already fresh objects, so don't need copying either.
+
+    If given a `filtered_manifest_cache`, manifests from the primary filtered by lot are memoized in it - see
+    `_MemoizedFilterManifest`.
+    """
+
+    def __init__(self, primary, filtered_manifest_cache=None):
+        super().__init__(primary.content_path)
+        self._primary_content = primary._content
+        self._filtered_manifest_cache = filtered_manifest_cache
+        self._content = _CopyOnWriteMapping(primary._content)
+        self._messages = _CopyOnWriteMapping(primary._messages)
+        self._metadata = _CopyOnWriteMapping(primary._metadata)
+        # questions are only needed while loading a manifest, which the primary has already done for every manifest
+        # we use
+        self._questions = defaultdict(partial(defaultdict, dict))
+
+    def get_manifest(self, framework_slug, manifest):
+        if self._filtered_manifest_cache is None or manifest not in self._primary_content.get(framework_slug, {}):
+            return super().get_manifest(framework_slug, manifest)
+
+        return _MemoizedFilterManifest(
+            self._primary_content[framework_slug][manifest],
+            (framework_slug, manifest),
+            self._filtered_manifest_cache,
+        )
+
+    get_builder = get_manifest
@@ -0,0 +1,142 @@
+import logging
+import os
+import re
+import threading
+import time
+
+# only slugs like these are used to name invalidation stamps - nothing is ever cached under any other
+FRAMEWORK_SLUG_PATTERN = re.compile(r"^[a-z0-9-]+$")
+
+
+class FrameworkCache(object):
+    """A process-wide cache of framework documents, keyed by framework slug
+
+    Framework documents only change a handful of times a year but are needed by almost every buyer page. Each entry is
+    stored alongside a dict of the framework's lots keyed by slug so lot lookups don't need to scan the lots list.
+
+    Entries are fresh for `DM_FRAMEWORK_CACHE_TTL` seconds. For a further `DM_FRAMEWORK_CACHE_STALE_TTL` seconds an
+    expired entry will still be served while it is refreshed in a background thread, after which a request will wait
+    for the framework to be fetched again. A TTL of 0 disables the cache entirely.
+
+    Invalidating a framework drops this process's copy and, with an `invalidation_directory` shared by an instance's
+    worker processes, updates a stamp file there which every process checks before serving an entry - any entry
+    fetched before its framework (or every framework) was last invalidated is fetched again.
+
+    Returned framework and lot dicts are shared between requests so must be treated as read-only.
+    """
+
+    ALL_FRAMEWORKS_STAMP = 'all-frameworks'
+
+    def __init__(self, ttl=0, stale_ttl=0, invalidation_directory=None, clock=time.monotonic):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.invalidation_directory = invalidation_directory
+        self.logger = logging.getLogger(__name__)
+        self._clock = clock
+        self._entries = {}
+        self._refreshing = set()
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.ttl = app.config['DM_FRAMEWORK_CACHE_TTL']
+        self.stale_ttl = app.config['DM_FRAMEWORK_CACHE_STALE_TTL']
+        self.invalidation_directory = app.config['DM_FRAMEWORK_CACHE_INVALIDATION_DIRECTORY']
+        self.logger = app.logger
+        self._clear()
+
+    def get(self, framework_slug, data_api_client):
+        """Return a tuple of the framework and a dict of its lots by slug"""
+        if self.ttl <= 0:
+            return self._fetch(framework_slug, data_api_client)
+
+        entry = self._entries.get(framework_slug)
+        if entry is not None and not self._invalidated_since(framework_slug, entry[1]):
+            age = self._clock() - entry[0]
+            if age < self.ttl:
+                return entry[2]
+            if age < self.ttl + self.stale_ttl:
+                self._refresh_in_background(framework_slug, data_api_client)
+                return entry[2]
+
+        fetched_at = time.time_ns()
+        value = self._fetch(framework_slug, data_api_client)
+        self._store(framework_slug, fetched_at, value)
+        return value
+
+    def invalidate(self, framework_slug=None):
+        """Drop the cached copy of `framework_slug`, or of every framework if no slug is given, in every process"""
+        if self.invalidation_directory is not None:
+            if framework_slug is None:
+                self._stamp(self.ALL_FRAMEWORKS_STAMP)
+            elif FRAMEWORK_SLUG_PATTERN.match(framework_slug):
+                self._stamp(framework_slug)
+
+        with self._lock:
+            if framework_slug is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(framework_slug, None)
+
+    def _clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _stamp_path(self, name):
+        return os.path.join(self.invalidation_directory, '{}.invalidated'.format(name))
+
+    def _stamp(self, name):
+        os.makedirs(self.invalidation_directory, exist_ok=True)
+        path = self._stamp_path(name)
+        with open(path, 'a'):
+            pass
+        # the stamp is its modification time, set from the same clock as entries' fetch times
+        now = time.time_ns()
+        os.utime(path, ns=(now, now))
+
+    def _invalidated_since(self, framework_slug, fetched_at):
+        """Whether `framework_slug` has been invalidated by any process since `fetched_at` (in ns since the epoch)"""
+        if self.invalidation_directory is None:
+            return False
+        for name in (self.ALL_FRAMEWORKS_STAMP, framework_slug):
+            try:
+                if os.stat(self._stamp_path(name)).st_mtime_ns >= fetched_at:
+                    return True
+            except FileNotFoundError:
+                pass
+        return False
+
+    @staticmethod
+    def _fetch(framework_slug, data_api_client):
+        framework = data_api_client.get_framework(framework_slug)['frameworks']
+        return framework, {lot['slug']: lot for lot in framework['lots']}
+
+    def _store(self, framework_slug, fetched_at, value):
+        with self._lock:
+            self._entries[framework_slug] = (self._clock(), fetched_at, value)
+
+    def _refresh_in_background(self, framework_slug, data_api_client):
+        with self._lock:
+            if framework_slug in self._refreshing:
+                return
+            self._refreshing.add(framework_slug)
+
+        threading.Thread(
+            target=self._refresh,
+            args=(framework_slug, data_api_client),
+            name="framework-cache-refresh-{}".format(framework_slug),
+            daemon=True,
+        ).start()
+
+    def _refresh(self, framework_slug, data_api_client):
+        try:
+            fetched_at = time.time_ns()
+            self._store(framework_slug, fetched_at, self._fetch(framework_slug, data_api_client))
+        except Exception:
+            # keep serving the stale copy until it expires completely
+            self.logger.exception("Failed to refresh cached framework {}".format(framework_slug))
+        finally:
+            with self._lock:
+                self._refreshing.discard(framework_slug)
+
+
+framework_cache = FrameworkCache()
@@ -0,0 +1,122 @@
+import hashlib
+import json
+from collections import OrderedDict
+from threading import Lock
+
+from flask import Response, current_app, request, session
+from flask_login import current_user
+
+from app.metrics import CONDITIONAL_PAGE_TOTAL, RENDERED_PAGE_CACHE_TOTAL
+
+
+def page_key(*parts):
+    """A hash of everything a page's content depends on, for use as its ETag"""
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def brief_page_key(brief, *parts):
+    """The key of the current user's view of a page about `brief`, given anything else its content depends on
+
+    Covers the app version, the page's URL (including its query string), the user, and the brief's status and
+    `updatedAt` - a brief's status can change with the time of day without it being updated.
+    """
+    return page_key(
+        current_app.config['VERSION'],
+        request.full_path,
+        current_user.id,
+        brief['id'],
+        brief['status'],
+        brief['updatedAt'],
+        *parts
+    )
+
+
+def is_not_modified(key):
+    """Whether the browser making the current request already has the page with `key`"""
+    return key in request.if_none_match
+
+
+def _validated_response(key, body, headers):
+    response = Response(body, status=200 if body is not None else 304, headers=headers)
+    response.set_etag(key)
+    # the browser must come back to check the page each time it's used, so access to it is still checked
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+
+def conditional_response(page_name, key, render, headers=None):
+    """A response for a page whose content only depends on `key`, calling `render` for its HTML only if the browser
+    making the request doesn't already have it
+
+    Callers must have checked the user can see the page first, and `key` must include the user's id if the page differs
+    between users. A page rendered while the session has flashed messages to show isn't given an ETag, as they'll only
+    be shown once.
+    """
+    if '_flashes' in session:
+        CONDITIONAL_PAGE_TOTAL.labels(page_name, 'rendered').inc()
+        return Response(render(), headers=headers)
+
+    if is_not_modified(key):
+        CONDITIONAL_PAGE_TOTAL.labels(page_name, 'not_modified').inc()
+        return _validated_response(key, None, headers)
+
+    CONDITIONAL_PAGE_TOTAL.labels(page_name, 'rendered').inc()
+    return _validated_response(key, render(), headers)
+
+
+class RenderedPageCache(object):
+    """A bounded, thread-safe LRU cache of rendered pages, keyed by a hash of everything a page's content depends on
+
+    As a page's key changes whenever its content would, the key doubles as the page's ETag: a browser which already has
+    the page is answered with a 304 without it being looked up or rendered.
+
+    The size of the cache is read from the `size_config_key` config setting - a size of 0 disables it.
+    """
+
+    def __init__(self, page_name, size_config_key, maxsize=0):
+        self.page_name = page_name
+        self.size_config_key = size_config_key
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def init_app(self, app):
+        self.maxsize = app.config[self.size_config_key]
+        self.clear()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_or_render(self, key, render):
+        """Return the page for `key`, calling `render` (a function taking no arguments) to render it if needed"""
+        if self.maxsize <= 0:
+            return render()
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                RENDERED_PAGE_CACHE_TOTAL.labels(self.page_name, 'hit').inc()
+                return self._entries[key]
+
+        RENDERED_PAGE_CACHE_TOTAL.labels(self.page_name, 'miss').inc()
+        # rendered outside the lock - two threads rendering the same page store the same thing
+        html = render()
+        with self._lock:
+            self._entries[key] = html
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return html
+
+    def response(self, key, render, headers=None):
+        """A response for the page with `key`, only rendering it if it isn't cached and the browser doesn't have it"""
+        if is_not_modified(key):
+            RENDERED_PAGE_CACHE_TOTAL.labels(self.page_name, 'not_modified').inc()
+            return _validated_response(key, None, headers)
+
+        return _validated_response(key, self.get_or_render(key, render), headers)
+
+
+brief_preview_cache = RenderedPageCache('preview_brief_source', 'DM_BRIEF_PREVIEW_CACHE_SIZE')
@@ -0,0 +1,57 @@
+from functools import cached_property
+from itertools import compress
+from operator import itemgetter
+
+
+class BriefResponses(list):
+    """A brief's responses, those meeting the most nice-to-have requirements first
+
+    Whether each response met all the essential requirements and how many nice-to-have requirements it met are worked
+    out together in a single pass over the responses, and kept alongside them so the responses page, the download and
+    the award form don't each go back over every response to work them out again. If the brief has no nice-to-have
+    requirements the responses are kept in the order they were given.
+
+    Only DOS1 responses answer the requirements with booleans. Later frameworks' answers are dicts of evidence, none
+    of which are counted as a nice-to-have met - as has always been the case.
+
+    The list must be treated as read-only.
+    """
+
+    def __init__(self, brief, responses):
+        count_nice_to_haves = bool(brief.get('niceToHaveRequirements'))
+
+        analysed = [
+            (
+                response.get('niceToHaveRequirements', ()).count(True) if count_nice_to_haves else 0,
+                all(response.get('essentialRequirements', ())),
+                response,
+            )
+            for response in responses
+        ]
+        if count_nice_to_haves:
+            # sorts are stable, so responses meeting the same number keep their order
+            analysed.sort(key=itemgetter(0), reverse=True)
+
+        super().__init__(response for _, _, response in analysed)
+        self.nice_to_have_counts = [nice_to_have_count for nice_to_have_count, _, _ in analysed]
+        self.eligibility = [eligible for _, eligible, _ in analysed]
+
+    @cached_property
+    def eligible_responses(self):
+        return list(compress(self, self.eligibility))
+
+    @cached_property
+    def counts(self):
+        eligible = len(self.eligible_responses)
+        return {"eligible": eligible, "failed": len(self) - eligible}
+
+    @cached_property
+    def by_supplier_name(self):
+        return sorted(self, key=itemgetter('supplierName'))
+
+
+def iter_eligible_responses(responses):
+    """Yield each of `responses` which met all the essential requirements"""
+    if isinstance(responses, BriefResponses):
+        return iter(responses.eligible_responses)
+    return (response for response in responses if all(response['essentialRequirements']))
@@ -0,0 +1,205 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+
+from ...metrics import RESPONSE_EXPORT_TOTAL
+
+
+class ExportArtifactStore(object):
+    """Exported files kept on local disk, each named by a hash of everything which determines its content
+
+    As a file's name changes whenever its content would, a stored file never needs to be updated or invalidated. Files
+    are written under a temporary name and moved into place, so a partially written file is never served and several
+    processes can share one directory.
+
+    With no `directory` a new temporary directory is made the first time a file is stored.
+
+    The files hold suppliers' contact details, so with a `max_age` they're only kept for that many seconds: older files
+    are no longer served, and are deleted whenever another file is stored.
+    """
+
+    def __init__(self, directory=None, max_age=0):
+        self.directory = directory
+        self.max_age = max_age
+        self._directory_lock = threading.Lock()
+
+    @staticmethod
+    def key_for(*parts):
+        return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+    def _path(self, key, extension):
+        return os.path.join(self.directory, '{}.{}'.format(key, extension))
+
+    def get(self, key, extension):
+        """Return the path of the stored file for `key` if there is one"""
+        if self.directory is None:
+            return None
+        path = self._path(key, extension)
+        try:
+            if self._expired(os.stat(path).st_mtime):
+                return None
+        except FileNotFoundError:
+            return None
+        return path
+
+    def _expired(self, modified_at):
+        return bool(self.max_age) and modified_at < time.time() - self.max_age
+
+    def sweep(self):
+        """Delete every file in the directory (including any left half written) older than `max_age` seconds"""
+        if not self.max_age or self.directory is None:
+            return
+        for entry in os.scandir(self.directory):
+            try:
+                if entry.is_file() and self._expired(entry.stat().st_mtime):
+                    os.unlink(entry.path)
+            except FileNotFoundError:
+                # already deleted by another process
+                pass
+
+    def put(self, key, extension, write):
+        """Store the file for `key`, written by `write` (a function taking a binary file), and return its path"""
+        with self._directory_lock:
+            if self.directory is None:
+                self.directory = tempfile.mkdtemp(prefix='response-exports-')
+            else:
+                os.makedirs(self.directory, exist_ok=True)
+
+        fd, temporary_path = tempfile.mkstemp(dir=self.directory, prefix='.{}.'.format(key))
+        try:
+            with os.fdopen(fd, 'wb') as temporary_file:
+                write(temporary_file)
+            os.replace(temporary_path, self._path(key, extension))
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+        self.sweep()
+        return self._path(key, extension)
+
+
+class ResponseExports(object):
+    """Brief response files built by a pool of background threads and kept in an `ExportArtifactStore`
+
+    A build is only ever queued once per key at a time in each process: asking for a file which is already being built
+    returns the existing job. Finished jobs are forgotten, as their files can be found in the store, except for
+    failures which are kept so they can be reported (and are retried the next time they're asked for).
+
+    Requests wait up to `wait` seconds for a new file to be built before giving up and asking the user to come back.
+    With no workers, files are built in the requesting thread.
+    """
+
+    PENDING = 'pending'
+    READY = 'ready'
+    FAILED = 'failed'
+
+    def __init__(self, directory=None, max_workers=0, wait=0):
+        self.store = ExportArtifactStore(directory)
+        self.max_workers = max_workers
+        self.wait = wait
+        self.logger = logging.getLogger(__name__)
+        self._app = None
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def init_app(self, app):
+        self.store = ExportArtifactStore(
+            app.config['DM_RESPONSE_EXPORT_DIRECTORY'], app.config['DM_RESPONSE_EXPORT_MAX_AGE'],
+        )
+        self.max_workers = app.config['DM_RESPONSE_EXPORT_MAX_WORKERS']
+        self.wait = app.config['DM_RESPONSE_EXPORT_WAIT']
+        self.logger = app.logger
+        self._app = app
+        self.shutdown()
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._jobs.clear()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def find(self, key, extensions):
+        """Return a tuple of the path and extension of the stored file for `key`, trying each of `extensions` in turn"""
+        for extension in extensions:
+            path = self.store.get(key, extension)
+            if path is not None:
+                return path, extension
+        return None
+
+    def get_job(self, key):
+        """Return the job building the file for `key` in this process, if there is one, or which last failed to"""
+        with self._lock:
+            return self._jobs.get(key)
+
+    @staticmethod
+    def _failed(job):
+        return job.done() and job.exception() is not None
+
+    def job_status(self, job):
+        if not job.done():
+            return self.PENDING
+        return self.FAILED if job.exception() is not None else self.READY
+
+    def submit(self, key, extension, build):
+        """Queue a job to store the file for `key`, written by `build` (a function taking a binary file to write to)
+
+        Returns a `Future` for a tuple of the stored file's path and extension, as returned by `find`. A job which is
+        already building the file is returned rather than queueing another.
+        """
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None and not self._failed(job):
+                return job
+
+            if not self.max_workers:
+                job = Future()
+            else:
+                # created on first use rather than in `init_app` so that the pool's threads are started in each forked
+                # worker process rather than (uselessly) in the master
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix='response-export',
+                    )
+                job = self._executor.submit(self._run, key, extension, build)
+            self._jobs[key] = job
+
+        if not self.max_workers:
+            try:
+                job.set_result(self._run(key, extension, build))
+            except Exception as e:
+                job.set_exception(e)
+
+        return job
+
+    def wait_for(self, job):
+        """Wait up to `wait` seconds for `job` to finish and return whether it has"""
+        wait([job], timeout=self.wait)
+        return job.done()
+
+    def _run(self, key, extension, build):
+        try:
+            if self._app is not None:
+                with self._app.app_context():
+                    path = self.store.put(key, extension, build)
+            else:
+                path = self.store.put(key, extension, build)
+        except Exception:
+            RESPONSE_EXPORT_TOTAL.labels(result='failed').inc()
+            self.logger.exception("Failed to build response export {}".format(key))
+            raise
+
+        RESPONSE_EXPORT_TOTAL.labels(result='built').inc()
+        with self._lock:
+            self._jobs.pop(key, None)
+        return path, extension
+
+
+response_exports = ResponseExports()
@@ -0,0 +1,85 @@
+from threading import Lock
+from typing import NamedTuple
+
+from dmcontent.errors import ContentNotFoundError
+
+# the framework's links shown on the requirements task list
+FRAMEWORK_URL_KEYS = ('call_off_contract_url', 'framework_agreement_url')
+
+
+class TaskListStatus(NamedTuple):
+    """The status of each section of a brief on its requirements task list, and whether it can be previewed and
+    published yet
+
+    Each section's status is one of 'to_do', 'in_progress', 'optional' or 'done', keyed by section slug - an empty
+    section with nothing left to answer has no status.
+    """
+    sections: dict
+    previewable: bool
+    publishable: bool
+
+
+def task_list_status(sections):
+    """Work out the task list status of a brief's summarised `sections` in one pass over their questions
+
+    Gives the same statuses as checking each section's `is_empty` and calling `count_unanswered_questions([section])`,
+    but looks at each question's answer only once.
+    """
+    statuses = {}
+    all_required_answered = True
+    for section in sections:
+        is_empty = True
+        unanswered_required, unanswered_optional = (0, 0)
+        for question in section.questions:
+            if question.answer_required:
+                unanswered_required += 1
+            elif question.value in ['', [], None]:
+                unanswered_optional += 1
+            if is_empty and not question.is_empty:
+                is_empty = False
+
+        if unanswered_required > 0:
+            statuses[section.slug] = 'to_do' if is_empty else 'in_progress'
+            all_required_answered = False
+        elif not is_empty:
+            statuses[section.slug] = 'done'
+        elif unanswered_optional > 0:
+            statuses[section.slug] = 'optional'
+
+    return TaskListStatus(statuses, previewable=all_required_answered, publishable=all_required_answered)
+
+
+class FrameworkUrls(object):
+    """The framework URLs shown on the requirements task list, looked up once for each framework at startup
+
+    Loading a framework's `urls` messages reads and parses its YAML file, which used to happen on every view of the
+    task list. Frameworks which weren't preloaded have their messages loaded into the given content loader as before.
+    """
+
+    def __init__(self):
+        self._urls = {}
+        self._lock = Lock()
+
+    def preload(self, content_loader, framework_slugs):
+        for framework_slug in framework_slugs:
+            try:
+                urls = self._load(content_loader, framework_slug)
+            except ContentNotFoundError:
+                continue
+            with self._lock:
+                self._urls[framework_slug] = urls
+
+    def get(self, content_loader, framework_slug):
+        """A dict of the URLs in `FRAMEWORK_URL_KEYS` for `framework_slug`"""
+        urls = self._urls.get(framework_slug)
+        if urls is None:
+            content_loader.load_messages(framework_slug, ['urls'])
+            urls = self._load(content_loader, framework_slug)
+        return urls
+
+    @staticmethod
+    def _load(content_loader, framework_slug):
+        return {key: content_loader.get_message(framework_slug, 'urls', key) for key in FRAMEWORK_URL_KEYS}
+
+
+framework_urls = FrameworkUrls()
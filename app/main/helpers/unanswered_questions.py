@@ -0,0 +1,123 @@
+from weakref import WeakKeyDictionary
+
+from dmcontent.questions import Date, Hierarchy, List, Multiquestion, Pricing
+
+_EMPTY_VALUES = ('', [], None)
+
+
+def _compile_raw_value(question):
+    question_id = question.id
+    if question.has_assurance():
+        return lambda brief: brief.get(question_id, {}).get('value', '')
+    return lambda brief: brief.get(question_id, '')
+
+
+def _compile_is_empty(question):
+    """Return a function of a brief equivalent to `question.summary(brief).is_empty`"""
+    if isinstance(question, Multiquestion):
+        sub_questions_are_empty = [_compile_is_empty(sub_question) for sub_question in question.questions]
+        return lambda brief: all(is_empty(brief) for is_empty in sub_questions_are_empty)
+
+    if isinstance(question, Pricing):
+        price_fields = [question.fields.get(key) for key in ('price', 'minimum_price', 'maximum_price')]
+        return lambda brief: not any(brief.get(field) for field in price_fields)
+
+    if isinstance(question, Hierarchy):
+        option_values = set()
+        options = list(question._data.get('options', []))
+        while options:
+            option = options.pop()
+            option_values.add(option.get('value', option.get('label')))
+            options.extend(option.get('options', []))
+
+        question_id = question.id
+        return lambda brief: option_values.isdisjoint(brief.get(question_id, []))
+
+    raw_value = _compile_raw_value(question)
+
+    if isinstance(question, List):
+        if question.get('before_summary_value'):
+            return lambda brief: False
+        return lambda brief: raw_value(brief) in _EMPTY_VALUES
+
+    if isinstance(question, Date):
+        return lambda brief: raw_value(brief) in _EMPTY_VALUES
+
+    if question.type == 'number' and question.get('unit'):
+        # any answer at all is displayed with its unit
+        return lambda brief: raw_value(brief) == ''
+
+    labels = [
+        (option['value'], option['label']) for option in question.get('options') or []
+        if 'label' in option and 'value' in option
+    ]
+    if any(label in _EMPTY_VALUES for _, label in labels):
+        def is_empty(brief):
+            value = raw_value(brief)
+            if value:
+                value = next((label for option_value, label in labels if option_value == value), value)
+            return value in _EMPTY_VALUES
+
+        return is_empty
+
+    return lambda brief: raw_value(brief) in _EMPTY_VALUES
+
+
+def _compile_answer_required(question, is_empty):
+    """Return a function of a brief equivalent to `question.summary(brief).answer_required`"""
+    if question.get('optional'):
+        return lambda brief: False
+
+    if isinstance(question, Multiquestion):
+        if any(sub_question.get('followup') for sub_question in question.questions):
+            # whether a followup needs answering depends on the displayed value of the question it follows, so leave
+            # these (rare) multiquestions to dmcontent
+            return lambda brief: question.summary(brief).answer_required
+
+        sub_questions_answer_required = [
+            _compile_answer_required(sub_question, _compile_is_empty(sub_question))
+            for sub_question in question.questions
+        ]
+        return lambda brief: any(answer_required(brief) for answer_required in sub_questions_answer_required)
+
+    return is_empty
+
+
+class RequiredQuestionChecker(object):
+    """Counts the unanswered questions in a brief for one (already filtered) manifest
+
+    Gives the same results as `count_unanswered_questions(manifest.summary(brief))` but the manifest's questions are
+    compiled once into plain functions of the brief dict, so no summary objects are built for each brief.
+    """
+
+    _checkers_by_manifest = WeakKeyDictionary()
+
+    def __init__(self, manifest):
+        self._questions = []
+        for section in manifest.sections:
+            for question in section.questions:
+                is_empty = _compile_is_empty(question)
+                self._questions.append((_compile_answer_required(question, is_empty), is_empty))
+
+    @classmethod
+    def for_manifest(cls, manifest):
+        """Return the checker for `manifest`, compiling it the first time it's needed
+
+        Checkers live as long as their manifest, so a manifest held in the filtered manifest cache is only compiled
+        once.
+        """
+        try:
+            return cls._checkers_by_manifest[manifest]
+        except KeyError:
+            checker = cls._checkers_by_manifest[manifest] = cls(manifest)
+            return checker
+
+    def count_unanswered(self, brief):
+        unanswered_required, unanswered_optional = (0, 0)
+        for answer_required, is_empty in self._questions:
+            if answer_required(brief):
+                unanswered_required += 1
+            elif is_empty(brief):
+                unanswered_optional += 1
+
+        return unanswered_required, unanswered_optional
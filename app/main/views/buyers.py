@@ -1,39 +1,50 @@
 # coding: utf-8
 from __future__ import unicode_literals
 
-from flask import abort
+from functools import partial
+
+from flask import current_app, request, url_for
 from flask_login import current_user
 
 from app import data_api_client
+from app.concurrent_fetch import concurrent_fetcher
 from .. import main, content_loader
 from ..helpers.buyers_helpers import (
     add_unanswered_counts_to_briefs,
-    get_framework_and_lot,
-    is_brief_correct,
     is_legacy_brief_response,
+    load_brief_context,
+    paginate_briefs,
 )
+from ..helpers.dates import parse_datetime
+from ..helpers.page_cache import brief_page_key, conditional_response
+from ..helpers.response_analysis import BriefResponses
 
 from dmutils.flask import timed_render_template as render_template
-from dmutils.formats import DATETIME_FORMAT
-from datetime import datetime
-
-from collections import Counter
 
 CLOSED_BRIEF_STATUSES = ['closed', 'withdrawn', 'awarded', 'cancelled', 'unsuccessful']
 CLOSED_PUBLISHED_BRIEF_STATUSES = ['closed', 'awarded', 'cancelled', 'unsuccessful']
 
+# the lists of briefs on the requirements dashboard: their name, the statuses of the briefs in them and the date their
+# briefs are ordered by (newest first)
+DASHBOARD_BRIEF_LISTS = (
+    ('draft', ['draft'], 'createdAt'),
+    ('live', ['live'], 'publishedAt'),
+    ('closed', CLOSED_BRIEF_STATUSES, 'applicationsClosedAt'),
+)
+
 
 @main.route('')
 def buyer_dashboard():
-    user_projects_awaiting_outcomes_total = data_api_client.find_direct_award_projects(
-        current_user.id,
-        locked=True,
-        having_outcome=False,
-    )["meta"]["total"]
+    # these are independent so are fetched in parallel
+    user_briefs, user_projects_awaiting_outcomes = concurrent_fetcher.fetch_all(
+        partial(data_api_client.find_briefs, current_user.id),
+        partial(data_api_client.find_direct_award_projects, current_user.id, locked=True, having_outcome=False),
+    )
+    user_projects_awaiting_outcomes_total = user_projects_awaiting_outcomes["meta"]["total"]
 
     return render_template(
         'buyers/index.html',
-        user_briefs_total=data_api_client.find_briefs(current_user.id)["meta"]["total"],
+        user_briefs_total=user_briefs["meta"]["total"],
         user_projects_awaiting_outcomes_total=user_projects_awaiting_outcomes_total,
         # calculating it this way allows us to avoid the extra api call if we already know the user has projects
         # from user_projects_awaiting_outcomes_total
@@ -46,49 +57,73 @@ def buyer_dashboard():
 
 @main.route('/requirements/digital-outcomes-and-specialists')
 def buyer_dos_requirements():
-    user_briefs = data_api_client.find_briefs(current_user.id).get('briefs', [])
-
-    draft_briefs = sorted(
-        add_unanswered_counts_to_briefs([brief for brief in user_briefs if brief['status'] == 'draft'], content_loader),
-        key=lambda i: datetime.strptime(i['createdAt'], DATETIME_FORMAT),
-        reverse=True
-    )
-    live_briefs = sorted(
-        [brief for brief in user_briefs if brief['status'] == 'live'],
-        key=lambda i: datetime.strptime(i['publishedAt'], DATETIME_FORMAT),
-        reverse=True
-    )
-    closed_briefs = sorted(
-        [brief for brief in user_briefs if brief['status'] in CLOSED_BRIEF_STATUSES],
-        key=lambda i: datetime.strptime(i['applicationsClosedAt'], DATETIME_FORMAT),
-        reverse=True
-    )
+    # the API returns all of a user's briefs at once, but only a page of each list is counted up and shown
+    briefs_by_list = {list_name: [] for list_name, _, _ in DASHBOARD_BRIEF_LISTS}
+    list_names_by_status = {
+        status: list_name for list_name, statuses, _ in DASHBOARD_BRIEF_LISTS for status in statuses
+    }
+    for brief in data_api_client.find_briefs(current_user.id).get('briefs', []):
+        list_name = list_names_by_status.get(brief['status'])
+        if list_name is not None:
+            briefs_by_list[list_name].append(brief)
+
+    pages = {}
+    for list_name, _, date_key in DASHBOARD_BRIEF_LISTS:
+        # sort keys are worked out once for each brief, not for each comparison
+        pages[list_name] = paginate_briefs(
+            sorted(
+                briefs_by_list[list_name],
+                key=lambda brief: parse_datetime(brief[date_key]),
+                reverse=True,
+            ),
+            request.args.get('{}_page'.format(list_name), 1, type=int),
+            current_app.config['DM_REQUIREMENTS_PAGE_SIZE'],
+        )
+
+    add_unanswered_counts_to_briefs(pages['draft'].briefs, content_loader)
+
+    def page_url(list_name, page_number):
+        page_numbers = {other_list_name: page.number for other_list_name, page in pages.items()}
+        page_numbers[list_name] = page_number
+        return url_for('.buyer_dos_requirements', **{
+            '{}_page'.format(other_list_name): number for other_list_name, number in page_numbers.items() if number > 1
+        })
 
     return render_template(
         'buyers/dashboard.html',
-        draft_briefs=draft_briefs,
-        live_briefs=live_briefs,
-        closed_briefs=closed_briefs,
+        draft_briefs=pages['draft'].briefs,
+        live_briefs=pages['live'].briefs,
+        closed_briefs=pages['closed'].briefs,
+        pages=pages,
+        page_url=page_url,
     )
 
 
 @main.route('/frameworks/<framework_slug>/requirements/<lot_slug>/<brief_id>/responses', methods=['GET'])
 def view_brief_responses(framework_slug, lot_slug, brief_id):
-    get_framework_and_lot(
+    brief = load_brief_context(
         framework_slug,
         lot_slug,
+        brief_id,
         data_api_client,
-        allowed_statuses=['live', 'expired'],
-        must_allow_brief=True,
+        current_user.id,
+        allowed_brief_statuses=CLOSED_PUBLISHED_BRIEF_STATUSES,
+    ).brief
+
+    brief_responses_json = data_api_client.find_brief_responses(brief_id)['briefResponses']
+
+    # responses can't be changed once the brief has closed
+    page_key = brief_page_key(brief, len(brief_responses_json))
+
+    return conditional_response(
+        'view_brief_responses',
+        page_key,
+        lambda: render_brief_responses(brief, brief_responses_json),
     )
-    brief = data_api_client.get_brief(brief_id)["briefs"]
 
-    if not is_brief_correct(
-        brief, framework_slug, lot_slug, current_user.id, allowed_statuses=CLOSED_PUBLISHED_BRIEF_STATUSES
-    ):
-        abort(404)
 
-    brief_responses = data_api_client.find_brief_responses(brief_id)['briefResponses']
+def render_brief_responses(brief, brief_responses_json):
+    brief_responses = BriefResponses(brief, brief_responses_json)
 
     brief_responses_required_evidence = (
         None
@@ -96,14 +131,9 @@ def view_brief_responses(framework_slug, lot_slug, brief_id):
         not is_legacy_brief_response(brief_responses[0], brief=brief)
     )
 
-    counter = Counter()
-
-    for response in brief_responses:
-        counter[all(response['essentialRequirements'])] += 1
-
     return render_template(
         "buyers/brief_responses.html",
-        response_counts={"failed": counter[False], "eligible": counter[True]},
+        response_counts=brief_responses.counts,
         brief_responses_required_evidence=brief_responses_required_evidence,
         brief=brief
-    ), 200
+    )
@@ -8,23 +8,23 @@ from dmcontent.html import to_summary_list_row
 
 from app import data_api_client
 from ... import main, content_loader
-from ...helpers.buyers_helpers import (
-    brief_can_be_edited,
-    count_unanswered_questions,
-    get_framework_and_lot,
-    is_brief_correct,
-)
+from ...helpers.brief_summary import BriefSummary
+from ...helpers.buyers_helpers import load_brief_context
 
 
 @main.route(
     '/frameworks/<framework_slug>/requirements/<lot_slug>/<brief_id>/edit/<section_slug>/<question_id>',
     methods=['GET'])
 def edit_brief_question(framework_slug, lot_slug, brief_id, section_slug, question_id):
-    get_framework_and_lot(framework_slug, lot_slug, data_api_client, allowed_statuses=['live'], must_allow_brief=True)
-    brief = data_api_client.get_brief(brief_id)["briefs"]
-
-    if not is_brief_correct(brief, framework_slug, lot_slug, current_user.id) or not brief_can_be_edited(brief):
-        abort(404)
+    brief = load_brief_context(
+        framework_slug,
+        lot_slug,
+        brief_id,
+        data_api_client,
+        current_user.id,
+        allowed_framework_statuses=['live'],
+        must_be_editable=True,
+    ).brief
 
     content = content_loader.get_manifest(brief['frameworkSlug'], 'edit_brief').filter(
         {'lot': brief['lotSlug']}
@@ -49,11 +49,15 @@ def edit_brief_question(framework_slug, lot_slug, brief_id, section_slug, questi
     '/frameworks/<framework_slug>/requirements/<lot_slug>/<brief_id>/edit/<section_id>/<question_id>',
     methods=['POST'])
 def update_brief_submission(framework_slug, lot_slug, brief_id, section_id, question_id):
-    get_framework_and_lot(framework_slug, lot_slug, data_api_client, allowed_statuses=['live'], must_allow_brief=True)
-    brief = data_api_client.get_brief(brief_id)["briefs"]
-
-    if not is_brief_correct(brief, framework_slug, lot_slug, current_user.id) or not brief_can_be_edited(brief):
-        abort(404)
+    brief = load_brief_context(
+        framework_slug,
+        lot_slug,
+        brief_id,
+        data_api_client,
+        current_user.id,
+        allowed_framework_statuses=['live'],
+        must_be_editable=True,
+    ).brief
 
     content = content_loader.get_manifest(brief['frameworkSlug'], 'edit_brief').filter({'lot': brief['lotSlug']})
     section = content.get_section(section_id)
@@ -110,20 +114,17 @@ def update_brief_submission(framework_slug, lot_slug, brief_id, section_id, ques
 
 @main.route('/frameworks/<framework_slug>/requirements/<lot_slug>/<brief_id>/<section_slug>', methods=['GET'])
 def view_brief_section_summary(framework_slug, lot_slug, brief_id, section_slug):
-    get_framework_and_lot(
+    brief = load_brief_context(
         framework_slug,
         lot_slug,
+        brief_id,
         data_api_client,
-        allowed_statuses=['live', 'expired'],
-        must_allow_brief=True
-    )
-    brief = data_api_client.get_brief(brief_id)["briefs"]
-
-    if not is_brief_correct(brief, framework_slug, lot_slug, current_user.id) or not brief_can_be_edited(brief):
-        abort(404)
+        current_user.id,
+        must_be_editable=True,
+    ).brief
 
     content = content_loader.get_manifest(brief['frameworkSlug'], 'edit_brief').filter({'lot': brief['lotSlug']})
-    sections = content.summary(brief)
+    sections = BriefSummary.for_request(content, brief)
     section = sections.get_section(section_slug)
 
     if not section:
@@ -146,8 +147,7 @@ def view_brief_section_summary(framework_slug, lot_slug, brief_id, section_slug)
         )
 
     # Show preview link if all mandatory questions have been answered
-    unanswered_required, unanswered_optional = count_unanswered_questions(sections)
-    show_dos_preview_link = (unanswered_required == 0)
+    show_dos_preview_link = (sections.unanswered_required == 0)
 
     return render_template(
         "buyers/section_summary.html",
@@ -1,37 +1,43 @@
-from flask import abort, request, redirect, url_for
+from datetime import datetime
+
+from flask import abort, current_app, request, redirect, url_for
 from flask_login import current_user
 
 from dmcontent.html import to_summary_list_rows
-from dmutils.dates import get_publishing_dates
 from dmutils.flask import timed_render_template as render_template
 
 from app import data_api_client
 from ... import main, content_loader
-from ...helpers.buyers_helpers import (
-    brief_can_be_edited,
-    count_unanswered_questions,
-    get_framework_and_lot,
-    is_brief_correct,
-)
+from ...helpers.brief_summary import BriefSummary
+from ...helpers.buyers_helpers import load_brief_context
+from ...helpers.dates import get_publishing_dates
+from ...helpers.page_cache import brief_preview_cache, page_key
 
 
 @main.route('/frameworks/<framework_slug>/requirements/<lot_slug>/<brief_id>/preview', methods=['GET'])
 def preview_brief(framework_slug, lot_slug, brief_id):
     # Displays draft content in tabs for the user to see what their published brief will look like
-    get_framework_and_lot(framework_slug, lot_slug, data_api_client, allowed_statuses=['live'], must_allow_brief=True)
-    brief = data_api_client.get_brief(brief_id)["briefs"]
-
-    if not is_brief_correct(brief, framework_slug, lot_slug, current_user.id) or not brief_can_be_edited(brief):
-        abort(404)
+    brief = load_brief_context(
+        framework_slug,
+        lot_slug,
+        brief_id,
+        data_api_client,
+        current_user.id,
+        allowed_framework_statuses=['live'],
+        must_be_editable=True,
+    ).brief
 
     content = content_loader.get_manifest(brief['frameworkSlug'], 'edit_brief').filter({'lot': brief['lotSlug']})
 
+    sections = BriefSummary.for_request(content, brief)
+
     # Check that all questions have been answered
-    unanswered_required, unanswered_optional = count_unanswered_questions(content.summary(brief))
+    unanswered_required = sections.unanswered_required
     if unanswered_required > 0:
         return render_template(
             "buyers/preview_brief.html",
             content=content,
+            sections=sections,
             unanswered_required=unanswered_required,
             brief=brief
         ), 400
@@ -39,6 +45,7 @@ def preview_brief(framework_slug, lot_slug, brief_id):
     return render_template(
         "buyers/preview_brief.html",
         content=content,
+        sections=sections,
         unanswered_required=unanswered_required,
         brief=brief
     ), 200
@@ -47,17 +54,39 @@ def preview_brief(framework_slug, lot_slug, brief_id):
 @main.route('/frameworks/<framework_slug>/requirements/<lot_slug>/<brief_id>/preview-source', methods=['GET'])
 def preview_brief_source(framework_slug, lot_slug, brief_id):
     # This view's response currently is what will populate the iframes in the view above
-    get_framework_and_lot(framework_slug, lot_slug, data_api_client, allowed_statuses=['live'], must_allow_brief=True)
-    brief = data_api_client.get_brief(brief_id)["briefs"]
+    brief = load_brief_context(
+        framework_slug,
+        lot_slug,
+        brief_id,
+        data_api_client,
+        current_user.id,
+        allowed_framework_statuses=['live'],
+        must_be_editable=True,
+    ).brief
+
+    # The page only changes when the brief does, or (as its publishing dates are worked out from today's date) at the
+    # end of the day
+    cache_key = page_key(
+        current_app.config['VERSION'],
+        brief['id'],
+        brief['updatedAt'],
+        datetime.utcnow().date(),
+    )
+    response_headers = {"X-Frame-Options": "sameorigin"}
+
+    return brief_preview_cache.response(
+        cache_key,
+        lambda: render_preview_brief_source(brief),
+        headers=response_headers,
+    )
 
-    if not is_brief_correct(brief, framework_slug, lot_slug, current_user.id) or not brief_can_be_edited(brief):
-        abort(404)
 
+def render_preview_brief_source(brief):
     # Check that all questions have been answered
     editable_content = content_loader.get_manifest(brief['frameworkSlug'], 'edit_brief').filter(
         {'lot': brief['lotSlug']}
     )
-    unanswered_required, unanswered_optional = count_unanswered_questions(editable_content.summary(brief))
+    unanswered_required = BriefSummary.for_request(editable_content, brief).unanswered_required
     if unanswered_required > 0:
         abort(400, 'There are still unanswered required questions')
 
@@ -79,7 +108,7 @@ def preview_brief_source(framework_slug, lot_slug, brief_id):
         )
 
     # TODO: move preview_brief_source templates/includes into shared FE toolkit pattern to ensure it's kept in sync
-    html = render_template(
+    return render_template(
         "buyers/preview_brief_source.html",
         content=display_content,
         content_summary=brief_summary,
@@ -87,34 +116,32 @@ def preview_brief_source(framework_slug, lot_slug, brief_id):
         brief=brief,
         important_dates=important_dates
     )
-    response_headers = {"X-Frame-Options": "sameorigin"}
-
-    return html, 200, response_headers
 
 
 @main.route('/frameworks/<framework_slug>/requirements/<lot_slug>/<brief_id>/publish', methods=['GET', 'POST'])
 def publish_brief(framework_slug, lot_slug, brief_id):
-    get_framework_and_lot(framework_slug, lot_slug, data_api_client, allowed_statuses=['live'], must_allow_brief=True)
-    brief = data_api_client.get_brief(brief_id)["briefs"]
-
-    if not is_brief_correct(brief, framework_slug, lot_slug, current_user.id) or not brief_can_be_edited(brief):
-        abort(404)
+    brief = load_brief_context(
+        framework_slug,
+        lot_slug,
+        brief_id,
+        data_api_client,
+        current_user.id,
+        allowed_framework_statuses=['live'],
+        must_be_editable=True,
+    ).brief
 
     content = content_loader.get_manifest(brief['frameworkSlug'], 'edit_brief').filter({'lot': brief['lotSlug']})
     brief_users = brief['users'][0]
     brief_user_name = brief_users['name']
 
-    sections = content.summary(brief)
-    question_and_answers = {}
-    question_and_answers_content = sections.get_question('questionAndAnswerSessionDetails')
-    question_and_answers['id'] = question_and_answers_content['id']
+    sections = BriefSummary.for_request(content, brief)
+    # The question's id and section slug/id, to construct the Edit link in the template
+    question_and_answers = {
+        'id': sections.get_question('questionAndAnswerSessionDetails')['id'],
+        'slug': sections.section_for_question('questionAndAnswerSessionDetails')['id'],
+    }
 
-    # Annotate the section data with the section slug/id, to construct the Edit link in the template
-    for section in sections:
-        if section.get_question('questionAndAnswerSessionDetails') == question_and_answers_content:
-            question_and_answers['slug'] = section['id']
-
-    unanswered_required, unanswered_optional = count_unanswered_questions(sections)
+    unanswered_required = sections.unanswered_required
 
     if request.method == 'POST':
         if unanswered_required > 0:
@@ -127,10 +154,8 @@ def publish_brief(framework_slug, lot_slug, brief_id):
     else:
         #  requirements length is a required question but is handled separately to other
         #  required questions on the publish page if it's unanswered.
-        if (
-            sections.get_section('set-how-long-your-requirements-will-be-open-for') and
-            sections.get_section('set-how-long-your-requirements-will-be-open-for').questions[0].answer_required
-        ):
+        requirements_length_section = sections.get_section('set-how-long-your-requirements-will-be-open-for')
+        if requirements_length_section and requirements_length_section.questions[0].answer_required:
             unanswered_required -= 1
 
         email_address = brief_users['emailAddress']
@@ -149,16 +174,14 @@ def publish_brief(framework_slug, lot_slug, brief_id):
 
 @main.route('/frameworks/<framework_slug>/requirements/<lot_slug>/<brief_id>/timeline', methods=['GET'])
 def view_brief_timeline(framework_slug, lot_slug, brief_id):
-    get_framework_and_lot(
+    brief = load_brief_context(
         framework_slug,
         lot_slug,
+        brief_id,
         data_api_client,
-        allowed_statuses=['live', 'expired'],
-        must_allow_brief=True
-    )
-    brief = data_api_client.get_brief(brief_id)["briefs"]
-    if not is_brief_correct(brief, framework_slug, lot_slug, current_user.id) or brief.get('status') != 'live':
-        abort(404)
+        current_user.id,
+        allowed_brief_statuses=['live'],
+    ).brief
 
     dates = get_publishing_dates(brief)
 
@@ -1,17 +1,34 @@
 # coding: utf-8
 from __future__ import unicode_literals
+import csv
+from functools import partial
+
 import inflection
 
-from flask import abort
+from flask import Response, current_app, jsonify, request, url_for
 from flask_login import current_user
+from werkzeug.wsgi import wrap_file
 
 from app import data_api_client
 from .buyers import CLOSED_PUBLISHED_BRIEF_STATUSES
 from .. import main, content_loader
-from ..helpers.buyers_helpers import get_framework_and_lot, get_sorted_responses_for_brief, is_brief_correct
+from ..helpers.buyers_helpers import get_sorted_responses_for_brief, load_brief_context
+from ..helpers.response_analysis import iter_eligible_responses
+from ..helpers.response_exports import ExportArtifactStore, response_exports
+from ...metrics import RESPONSE_EXPORT_TOTAL
 
+from dmutils.csv_generator import iter_csv
+from dmutils.flask import timed_render_template as render_template
 from dmutils.views import DownloadFileView
 
+MIMETYPES = {
+    DownloadFileView.FILETYPES.CSV: 'text/csv; header=present',
+    DownloadFileView.FILETYPES.ODS: 'application/vnd.oasis.opendocument.spreadsheet',
+}
+EXPORT_EXTENSIONS = [file_type.name.lower() for file_type in DownloadFileView.FILETYPES]
+# seconds the browser is asked to wait before trying a download again while its file is being built
+EXPORT_RETRY_AFTER = 5
+
 
 class DownloadBriefResponsesView(DownloadFileView):
     """
@@ -23,6 +40,11 @@ class DownloadBriefResponsesView(DownloadFileView):
     If the opportunity was on DOS1 this view will generate a CSV, at some
     point it would be nice to remove the CSV code, however currently users can
     still download their old responses.
+
+    Files are built by the background export jobs in `response_exports` and
+    kept, so each brief's file is only built once. If a file takes longer than
+    `DM_RESPONSE_EXPORT_WAIT` seconds to build the user is asked to come back
+    for it rather than holding on to a worker.
     """
 
     def get_responses(self, brief):
@@ -41,32 +63,104 @@ class DownloadBriefResponsesView(DownloadFileView):
 
         return DownloadFileView.FILETYPES.CSV
 
-    def get_file_context(self, **kwargs):
-        get_framework_and_lot(
+    def get_brief(self, **kwargs):
+        return load_brief_context(
             kwargs['framework_slug'],
             kwargs['lot_slug'],
+            kwargs['brief_id'],
             self.data_api_client,
-            allowed_statuses=['live', 'expired'],
-            must_allow_brief=True,
-        )
+            current_user.id,
+            allowed_brief_statuses=CLOSED_PUBLISHED_BRIEF_STATUSES,
+        ).brief
 
-        brief = self.data_api_client.get_brief(kwargs['brief_id'])["briefs"]
-
-        if not is_brief_correct(brief, kwargs['framework_slug'],
-                                kwargs['lot_slug'], current_user.id):
-            abort(404)
-
-        if brief['status'] not in CLOSED_PUBLISHED_BRIEF_STATUSES:
-            abort(404)
+    def get_file_context(self, brief=None, **kwargs):
+        if brief is None:
+            brief = self.get_brief(**kwargs)
 
         file_context = {
             'brief': brief,
             'responses': self.get_responses(brief),
-            'filename': 'supplier-responses-{0}'.format(inflection.parameterize(str(brief['title']))),
+            'filename': self.get_filename(brief),
         }
 
         return file_context
 
+    def get_filename(self, brief):
+        return 'supplier-responses-{0}'.format(inflection.parameterize(str(brief['title'])))
+
+    def get_export_key(self, brief):
+        # No responses can be made or changed once a brief has closed (and only closed briefs' responses can be
+        # downloaded), so when it closed stands in for the state of its responses. The app version covers changes to
+        # how the file is laid out.
+        return ExportArtifactStore.key_for(
+            current_app.config['VERSION'], brief['id'], brief.get('applicationsClosedAt'),
+        )
+
+    def get_export(self, brief, retry_failed=True, **kwargs):
+        """Return the stored file for `brief` as a tuple of its path and extension, or else the job building it
+
+        A job is queued if there isn't one already, or if the last one failed and `retry_failed` is set.
+        """
+        key = self.get_export_key(brief)
+
+        stored = response_exports.find(key, EXPORT_EXTENSIONS)
+        if stored is not None:
+            return stored, None
+
+        job = response_exports.get_job(key)
+        if job is None or (retry_failed and response_exports.job_status(job) == response_exports.FAILED):
+            # only now are the responses themselves needed
+            file_context = self.get_file_context(brief=brief, **kwargs)
+            file_type = self.determine_filetype(file_context, **kwargs)
+            job = response_exports.submit(
+                key, file_type.name.lower(), partial(self.render_file, file_context, file_type),
+            )
+        return None, job
+
+    def render_file(self, file_context, file_type, file):
+        """Write the file to `file` (a binary file object)"""
+        if file_type == DownloadFileView.FILETYPES.CSV:
+            # a row at a time, so the whole CSV is never held in memory
+            for line in iter_csv(self.generate_csv_rows(file_context), quoting=csv.QUOTE_ALL):
+                file.write(line)
+            return
+
+        self.populate_styled_ods_with_data(self.create_blank_ods_with_styles(), file_context).save(file)
+
+    def dispatch_request(self, **kwargs):
+        self._init_hook(**kwargs)
+        brief = self.get_brief(**kwargs)
+
+        stored, job = self.get_export(brief, **kwargs)
+        if stored is not None:
+            RESPONSE_EXPORT_TOTAL.labels(result='stored').inc()
+        elif response_exports.wait_for(job):
+            stored = job.result()
+        else:
+            RESPONSE_EXPORT_TOTAL.labels(result='pending').inc()
+            # ask the browser to come back for the file (which is served straight away once it's been built) rather
+            # than holding on to this worker
+            return render_template(
+                'buyers/brief_responses_download_pending.html',
+                brief=brief,
+                download_url=url_for('.download_brief_responses', **kwargs),
+                status_url=url_for('.download_brief_responses_status', **kwargs),
+                retry_after=EXPORT_RETRY_AFTER,
+            ), 202, {'Retry-After': str(EXPORT_RETRY_AFTER)}
+
+        path, extension = stored
+        mimetype = MIMETYPES[DownloadFileView.FILETYPES[extension.upper()]]
+
+        return Response(
+            wrap_file(request.environ, open(path, 'rb')),
+            mimetype=mimetype,
+            headers={
+                "Content-Disposition": 'attachment;filename={}.{}'.format(self.get_filename(brief), extension),
+                "Content-Type": mimetype
+            },
+            direct_passthrough=True,
+        ), 200
+
     def get_questions(self, framework_slug, lot_slug, manifest):
         section = 'view-response-to-requirements'
         result = self.content_loader.get_manifest(framework_slug, manifest)\
@@ -77,18 +171,17 @@ class DownloadBriefResponsesView(DownloadFileView):
 
     def generate_csv_rows(self, file_context):
         # This method works for DOS1 only
-
+        # Rows are generated as the file is written rather than all being built up front
         column_headings = []
         question_key_sequence = []
         boolean_list_questions = []
-        csv_rows = []
         brief, responses = file_context['brief'], file_context['responses']
 
         questions = self.get_questions(brief['frameworkSlug'],
                                        brief['lotSlug'],
                                        'legacy_output_brief_response')
 
-        # Build header row from manifest and add it to the list of rows
+        # Build header row from manifest
         for question in questions:
             question_key_sequence.append(question.id)
             if question['type'] == 'boolean_list' and brief.get(question.id):
@@ -96,20 +189,17 @@ class DownloadBriefResponsesView(DownloadFileView):
                 boolean_list_questions.append(question.id)
             else:
                 column_headings.append(question.name)
-        csv_rows.append(column_headings)
-
-        # Add a row for each eligible response received
-        for brief_response in responses:
-            if all(brief_response['essentialRequirements']):
-                row = []
-                for key in question_key_sequence:
-                    if key in boolean_list_questions:
-                        row.extend(brief_response.get(key))
-                    else:
-                        row.append(brief_response.get(key))
-                csv_rows.append(row)
-
-        return csv_rows
+        yield column_headings
+
+        # A row for each eligible response received
+        for brief_response in iter_eligible_responses(responses):
+            row = []
+            for key in question_key_sequence:
+                if key in boolean_list_questions:
+                    row.extend(brief_response.get(key))
+                else:
+                    row.append(brief_response.get(key))
+            yield row
 
     def populate_styled_ods_with_data(self, spreadsheet, file_context):
         sheet = spreadsheet.sheet("Supplier evidence")
@@ -127,51 +217,68 @@ class DownloadBriefResponsesView(DownloadFileView):
         row = sheet.create_row("header", stylename="row-tall")
         row.write_cell(brief['title'], stylename="cell-header", numbercolumnsspanned=str(len(responses) + 2))
 
-        # QUESTIONS
+        # QUESTIONS AND RESPONSES
+        # Each row is written in full, question then answers, in a single pass. Which answer (if any) goes in a row
+        # is worked out once per question rather than looking rows up by name for every cell.
         for question in questions:
             if question._data['type'] in ('boolean_list', 'dynamic_list'):
-                length = len(brief[question.id])
+                requirements = brief[question.id]
+                if not requirements:
+                    continue
+
+                if question._data['type'] == 'dynamic_list':
+                    # TODO this is stupid, fix it (key should not be hard coded)
+                    answers = [
+                        [item.get('evidence') or '' for item in response[question.id]] for response in responses
+                    ]
+                else:
+                    answers = [[str(bool(item)).lower() for item in response[question.id]] for response in responses]
 
-                for i, requirement in enumerate(brief[question.id]):
+                for i, requirement in enumerate(requirements):
                     row = sheet.create_row("{0}[{1}]".format(question.id, i))
                     if i == 0:
-                        row.write_cell(question.name, stylename="cell-header", numberrowsspanned=str(length))
+                        row.write_cell(question.name, stylename="cell-header", numberrowsspanned=str(len(requirements)))
                     else:
                         row.write_covered_cell()
                     row.write_cell(requirement, stylename="cell-default")
+
+                    for answer in answers:
+                        if i < len(answer):
+                            row.write_cell(answer[i], stylename="cell-default")
             else:
                 row = sheet.create_row(question.id, stylename="row-tall-optimal")
                 row.write_cell(question.name, stylename="cell-header", numbercolumnsspanned="2")
                 row.write_covered_cell()
 
-        # RESPONSES
+                for response in responses:
+                    row.write_cell(response.get(question.id, ''), stylename="cell-default")
+
+        # a column for each response, following the rows as they always have in the document
         for response in responses:
             sheet.create_column(stylename="col-extra-wide", defaultcellstylename="cell-default")
 
-            for question in questions:
-                if question._data['type'] == 'dynamic_list':
-                    if not brief.get(question.id):
-                        continue
-
-                    for i, item in enumerate(response[question.id]):
-                        row = sheet.get_row("{0}[{1}]".format(question.id, i))
-                        # TODO this is stupid, fix it (key should not be hard coded)
-                        row.write_cell(item.get('evidence') or '', stylename="cell-default")
-
-                elif question.type == 'boolean_list' and brief.get(question.id):
-                    if not brief.get(question.id):
-                        continue
-
-                    for i, item in enumerate(response[question.id]):
-                        row = sheet.get_row("{0}[{1}]".format(question.id, i))
-                        row.write_cell(str(bool(item)).lower(), stylename="cell-default")
-
-                else:
-                    sheet.get_row(question.id).write_cell(response.get(question.id, ''), stylename="cell-default")
-
         return spreadsheet
 
 
 main.add_url_rule('/frameworks/<framework_slug>/requirements/<lot_slug>/<brief_id>/responses/download',
                   view_func=DownloadBriefResponsesView.as_view(str('download_brief_responses')),
                   methods=['GET'])
+
+
+@main.route('/frameworks/<framework_slug>/requirements/<lot_slug>/<brief_id>/responses/download/status',
+            methods=['GET'])
+def download_brief_responses_status(framework_slug, lot_slug, brief_id):
+    """Report whether the responses file for a brief is ready to download, starting to build it if needed"""
+    view = DownloadBriefResponsesView()
+    view._init_hook()
+    kwargs = {'framework_slug': framework_slug, 'lot_slug': lot_slug, 'brief_id': brief_id}
+    brief = view.get_brief(**kwargs)
+
+    # a failed export is only retried when the file is actually asked for
+    stored, job = view.get_export(brief, retry_failed=False, **kwargs)
+    status = response_exports.READY if stored is not None else response_exports.job_status(job)
+
+    return jsonify(
+        status=status,
+        downloadUrl=url_for('.download_brief_responses', **kwargs),
+    ), 200
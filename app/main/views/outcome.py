@@ -7,7 +7,8 @@ from flask_login import current_user
 
 from app import data_api_client
 from .. import main, content_loader
-from ..helpers.buyers_helpers import get_framework_and_lot, is_brief_correct
+from ..helpers.buyers_helpers import load_brief_context
+from ..helpers.response_analysis import BriefResponses
 
 from ..forms.awards import AwardedBriefResponseForm
 from ..forms.cancel import CancelBriefForm
@@ -23,20 +24,14 @@ BRIEF_UPDATED_MESSAGE = "You’ve updated ‘{brief[title]}’"
 
 @main.route('/frameworks/<framework_slug>/requirements/<lot_slug>/<brief_id>/award', methods=['GET', 'POST'])
 def award_or_cancel_brief(framework_slug, lot_slug, brief_id):
-    get_framework_and_lot(
+    brief = load_brief_context(
         framework_slug,
         lot_slug,
+        brief_id,
         data_api_client,
-        allowed_statuses=['live', 'expired'],
-        must_allow_brief=True,
-    )
-    brief = data_api_client.get_brief(brief_id)["briefs"]
-
-    if not is_brief_correct(
-        brief, framework_slug, lot_slug, current_user.id,
-        allowed_statuses=["awarded", "cancelled", "unsuccessful", "closed"]
-    ):
-        abort(404)
+        current_user.id,
+        allowed_brief_statuses=["awarded", "cancelled", "unsuccessful", "closed"],
+    ).brief
 
     form = AwardOrCancelBriefForm(brief)
     already_awarded = brief['status'] in ["awarded", "cancelled", "unsuccessful"]
@@ -71,17 +66,14 @@ def award_or_cancel_brief(framework_slug, lot_slug, brief_id):
 
 @main.route('/frameworks/<framework_slug>/requirements/<lot_slug>/<brief_id>/award-contract', methods=['GET', 'POST'])
 def award_brief(framework_slug, lot_slug, brief_id):
-    get_framework_and_lot(
+    brief = load_brief_context(
         framework_slug,
         lot_slug,
+        brief_id,
         data_api_client,
-        allowed_statuses=['live', 'expired'],
-        must_allow_brief=True,
-    )
-    brief = data_api_client.get_brief(brief_id)["briefs"]
-
-    if not is_brief_correct(brief, framework_slug, lot_slug, current_user.id, allowed_statuses=['closed']):
-        abort(404)
+        current_user.id,
+        allowed_brief_statuses=['closed'],
+    ).brief
 
     brief_responses = data_api_client.find_brief_responses(
         brief['id'], status="submitted,pending-awarded"
@@ -96,7 +88,7 @@ def award_brief(framework_slug, lot_slug, brief_id):
             )
         )
 
-    form = AwardedBriefResponseForm(brief_responses)
+    form = AwardedBriefResponseForm(BriefResponses(brief, brief_responses).by_supplier_name)
     form_options = form.brief_response.govuk_options
 
     if form.validate_on_submit():
@@ -144,16 +136,14 @@ def award_brief(framework_slug, lot_slug, brief_id):
 def cancel_brief(framework_slug, lot_slug, brief_id):
     award_flow = request.endpoint.strip(request.blueprint + '.') == 'cancel_award_brief'
 
-    get_framework_and_lot(
+    brief = load_brief_context(
         framework_slug,
         lot_slug,
+        brief_id,
         data_api_client,
-        allowed_statuses=['live', 'expired'],
-        must_allow_brief=True,
-    )
-    brief = data_api_client.get_brief(brief_id)["briefs"]
-    if not is_brief_correct(brief, framework_slug, lot_slug, current_user.id, allowed_statuses=['closed']):
-        abort(404)
+        current_user.id,
+        allowed_brief_statuses=['closed'],
+    ).brief
 
     if award_flow:
         label_text = "Why didn’t you award a contract for {}?"
@@ -215,16 +205,13 @@ def cancel_brief(framework_slug, lot_slug, brief_id):
     methods=['GET', 'POST']
 )
 def award_brief_details(framework_slug, lot_slug, brief_id, brief_response_id):
-    get_framework_and_lot(
+    brief = load_brief_context(
         framework_slug,
         lot_slug,
+        brief_id,
         data_api_client,
-        allowed_statuses=['live', 'expired'],
-        must_allow_brief=True,
-    )
-    brief = data_api_client.get_brief(brief_id)["briefs"]
-    if not is_brief_correct(brief, framework_slug, lot_slug, current_user.id):
-        abort(404)
+        current_user.id,
+    ).brief
     brief_response = data_api_client.get_brief_response(brief_response_id)["briefResponses"]
     if not brief_response.get('status') == 'pending-awarded' or not brief_response.get('briefId') == brief.get('id'):
         abort(404)
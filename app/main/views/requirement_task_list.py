@@ -1,68 +1,49 @@
-from flask import abort, request, url_for
+from flask import request, url_for
 from flask_login import current_user
 
 from dmutils.flask import timed_render_template as render_template
 
 from app import data_api_client
 from .. import main, content_loader
-from ..helpers.buyers_helpers import (
-    count_unanswered_questions,
-    get_framework_and_lot,
-    is_brief_correct,
-)
+from ..helpers.brief_summary import BriefSummary
+from ..helpers.buyers_helpers import load_brief_context
+from ..helpers.clarification_questions import numbered_clarification_questions
+from ..helpers.page_cache import brief_page_key, conditional_response
+from ..helpers.task_list import framework_urls, task_list_status
 
 
 @main.route('/frameworks/<framework_slug>/requirements/<lot_slug>/<brief_id>', methods=['GET'])
 def view_brief_overview(framework_slug, lot_slug, brief_id):
-    framework, lot = get_framework_and_lot(
+    framework, lot, brief = load_brief_context(
         framework_slug,
         lot_slug,
+        brief_id,
         data_api_client,
-        allowed_statuses=['live', 'expired'],
-        must_allow_brief=True
+        current_user.id,
     )
-    brief = data_api_client.get_brief(brief_id)["briefs"]
 
-    if not is_brief_correct(brief, framework_slug, lot_slug, current_user.id):
-        abort(404)
+    page_key = brief_page_key(brief, framework['status'], len(brief['clarificationQuestions']))
 
+    return conditional_response(
+        'view_brief_overview',
+        page_key,
+        lambda: render_brief_overview(framework, brief),
+    )
+
+
+def render_brief_overview(framework, brief):
     awarded_brief_response_supplier_name = ""
     if brief.get('awardedBriefResponseId'):
         awarded_brief_response_supplier_name = data_api_client.get_brief_response(
             brief['awardedBriefResponseId'])["briefResponses"]["supplierName"]
 
     content = content_loader.get_manifest(brief['frameworkSlug'], 'edit_brief').filter({'lot': brief['lotSlug']})
-    sections = content.summary(brief)
+    sections = BriefSummary.for_request(content, brief)
+    status = task_list_status(sections)
 
-    content_loader.load_messages(brief['frameworkSlug'], ['urls'])
-    call_off_contract_url = content_loader.get_message(brief['frameworkSlug'], 'urls', 'call_off_contract_url')
-    framework_agreement_url = content_loader.get_message(brief['frameworkSlug'], 'urls', 'framework_agreement_url')
+    urls = framework_urls.get(content_loader, brief['frameworkSlug'])
 
-    sections_status = {
-        'previewable': True,
-        'publishable': True
-    }
-    for section in sections:
-        required, optional = count_unanswered_questions([section])
-        if section.is_empty:
-            if required > 0:
-                sections_status[section.slug] = 'to_do'
-                sections_status['previewable'] = False
-                sections_status['publishable'] = False
-            elif optional > 0:
-                sections_status[section.slug] = 'optional'
-        elif not section.is_empty:
-            if required > 0:
-                sections_status[section.slug] = 'in_progress'
-                sections_status['previewable'] = False
-                sections_status['publishable'] = False
-            else:
-                sections_status[section.slug] = 'done'
-
-    brief['clarificationQuestions'] = [
-        dict(question, number=index + 1)
-        for index, question in enumerate(brief['clarificationQuestions'])
-    ]
+    brief['clarificationQuestions'] = numbered_clarification_questions(brief['clarificationQuestions'])
 
     publish_requirements_section_instructions = [
         {
@@ -74,7 +55,7 @@ def view_brief_overview(framework_slug, lot_slug, brief_id):
             ),
             'text': 'Preview your requirements',
             'allowed_statuses': ['draft'],
-            'startable': sections_status['previewable'],
+            'startable': status.previewable,
             'active_tag': 'Optional'
         },
         {
@@ -86,7 +67,7 @@ def view_brief_overview(framework_slug, lot_slug, brief_id):
             ),
             'text': 'Publish your requirements',
             'allowed_statuses': ['draft'],
-            'startable': sections_status['publishable'],
+            'startable': status.publishable,
             'active_tag': 'To do'
         },
     ]
@@ -116,13 +97,13 @@ def view_brief_overview(framework_slug, lot_slug, brief_id):
         "buyers/brief_overview.html",
         framework=framework,
         confirm_remove=request.args.get("confirm_remove", None),
-        brief=section.unformat_data(brief),
+        brief=list(sections)[-1].unformat_data(brief),
         sections=sections,
-        sections_status=sections_status,
+        sections_status=status.sections,
         step_sections=[section.step for section in sections if hasattr(section, 'step')],
-        call_off_contract_url=call_off_contract_url,
-        framework_agreement_url=framework_agreement_url,
+        call_off_contract_url=urls['call_off_contract_url'],
+        framework_agreement_url=urls['framework_agreement_url'],
         awarded_brief_response_supplier_name=awarded_brief_response_supplier_name,
         publish_requirements_section_links=publish_requirements_section_links,
         publish_requirements_section_instructions=publish_requirements_section_instructions
-    ), 200
+    )
@@ -1,13 +1,14 @@
 # coding: utf-8
 from __future__ import unicode_literals
 
-from flask import abort, request, redirect, url_for
+from flask import request, redirect, url_for
 from flask_login import current_user
 
 from app import data_api_client
 from .. import main, content_loader
-from ..helpers.buyers_helpers import get_framework_and_lot, is_brief_correct
-from dmcontent.html import text_to_html
+from ..helpers.buyers_helpers import load_brief_context
+from ..helpers.clarification_questions import clarification_question_rows
+from ..helpers.page_cache import brief_page_key, conditional_response
 
 from dmapiclient import HTTPError
 from dmutils.flask import timed_render_template as render_template
@@ -18,25 +19,24 @@ from dmutils.forms.errors import govuk_errors
     "/frameworks/<framework_slug>/requirements/<lot_slug>/<brief_id>/supplier-questions",
     methods=["GET"])
 def supplier_questions(framework_slug, lot_slug, brief_id):
-    get_framework_and_lot(
+    brief = load_brief_context(
         framework_slug,
         lot_slug,
+        brief_id,
         data_api_client,
-        allowed_statuses=['live', 'expired'],
-        must_allow_brief=True
-    )
-    brief = data_api_client.get_brief(brief_id)["briefs"]
+        current_user.id,
+        allowed_brief_statuses=['live'],
+    ).brief
+
+    # published clarification questions can't be changed, only added to
+    page_key = brief_page_key(brief, len(brief['clarificationQuestions']))
 
-    if not is_brief_correct(brief, framework_slug, lot_slug, current_user.id, allowed_statuses=['live']):
-        abort(404)
+    return conditional_response('supplier_questions', page_key, lambda: render_supplier_questions(brief))
 
+
+def render_supplier_questions(brief):
     # Get Q&A in format suitable for govukSummaryList
-    for index, question in enumerate(brief['clarificationQuestions']):
-        question["key"] = {
-            "html": f"{str(index + 1)}. "
-                    f"{text_to_html(question['question'], format_links=True, preserve_line_breaks=True)}"
-        }
-        question["value"] = {"html": text_to_html(question["answer"], format_links=True, preserve_line_breaks=True)}
+    brief['clarificationQuestions'] = clarification_question_rows(brief['clarificationQuestions'])
 
     return render_template(
         "buyers/supplier_questions.html",
@@ -48,16 +48,14 @@ def supplier_questions(framework_slug, lot_slug, brief_id):
     "/frameworks/<framework_slug>/requirements/<lot_slug>/<brief_id>/supplier-questions/answer-question",
     methods=["GET", "POST"])
 def add_supplier_question(framework_slug, lot_slug, brief_id):
-    get_framework_and_lot(
+    brief = load_brief_context(
         framework_slug,
-        lot_slug, data_api_client,
-        allowed_statuses=['live', 'expired'],
-        must_allow_brief=True
-    )
-    brief = data_api_client.get_brief(brief_id)["briefs"]
-
-    if not is_brief_correct(brief, framework_slug, lot_slug, current_user.id, allowed_statuses=['live']):
-        abort(404)
+        lot_slug,
+        brief_id,
+        data_api_client,
+        current_user.id,
+        allowed_brief_statuses=['live'],
+    ).brief
 
     content = content_loader.get_manifest(brief['frameworkSlug'], "clarification_question").filter({})
     section = content.get_section(content.get_next_editable_section_id())
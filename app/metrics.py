@@ -1,9 +1,95 @@
 from flask import Blueprint
 from dmutils.metrics import DMGDSMetrics
+from gds_metrics import Counter, Gauge, Histogram
 
 
-metrics = Blueprint('metrics', __name__)
+def create_metrics_blueprint():
+    """Return the metrics blueprint and the `DMGDSMetrics` recording the app's requests
 
-gds_metrics = DMGDSMetrics()
+    These are built when the app is created rather than when this module is imported, as the metrics below are
+    imported along with the app package, before the metrics path may have been set in the environment.
+    """
+    gds_metrics = DMGDSMetrics()
 
-metrics.add_url_rule(gds_metrics.metrics_path, 'metrics', gds_metrics.metrics_endpoint)
+    metrics = Blueprint('metrics', __name__)
+    metrics.add_url_rule(gds_metrics.metrics_path, 'metrics', gds_metrics.metrics_endpoint)
+
+    return metrics, gds_metrics
+
+
+DATA_API_CALLS_SAVED_TOTAL = Counter(
+    'data_api_calls_saved_total',
+    'Data API reads answered from the request-scoped memo instead of the API',
+    ['endpoint'],
+)
+
+FILTERED_MANIFEST_CACHE_TOTAL = Counter(
+    'filtered_manifest_cache_total',
+    'Lookups of filtered content manifests in the shared cache',
+    ['manifest', 'result'],
+)
+
+RENDERED_PAGE_CACHE_TOTAL = Counter(
+    'rendered_page_cache_total',
+    'Requests for cached pages answered from the cache (hit), by rendering (miss) or with a 304 (not_modified)',
+    ['page', 'result'],
+)
+
+CONDITIONAL_PAGE_TOTAL = Counter(
+    'conditional_page_total',
+    'Requests for pages with an ETag answered with a 304 (not_modified) or by rendering the page (rendered)',
+    ['page', 'result'],
+)
+
+DATA_API_CONNECTIONS_OPENED_TOTAL = Counter(
+    'data_api_connections_opened_total',
+    'Connections opened to the data API',
+)
+
+DATA_API_CONNECTIONS_IN_USE = Gauge(
+    'data_api_connections_in_use',
+    'Connections to the data API currently taken from the pool',
+    multiprocess_mode='livesum',
+)
+
+DATA_API_POOL_MAX_SIZE = Gauge(
+    'data_api_pool_max_size',
+    'Idle connections to the data API kept open by each pool',
+    multiprocess_mode='livesum',
+)
+
+RESPONSE_EXPORT_TOTAL = Counter(
+    'response_export_total',
+    'Requests for brief response files, and the results of building them in the background',
+    ['result'],
+)
+
+SESSION_WRITES_AVOIDED_TOTAL = Counter(
+    'session_writes_avoided_total',
+    'Responses which did not save the session as it had not changed and was not due to be refreshed',
+)
+
+USER_CACHE_TOTAL = Counter(
+    'user_cache_total',
+    'Users loaded for logged in requests from the process-wide cache (hit) or the API (miss)',
+    ['result'],
+)
+
+DATA_API_CALLS_PER_REQUEST = Histogram(
+    'data_api_calls_per_request',
+    'Requests made to the data API while handling each request',
+    ['endpoint'],
+    buckets=(0, 1, 2, 3, 4, 6, 8, 12, 16, 24, 32, float('inf')),
+)
+
+DATA_API_METHOD_DURATION_SECONDS = Histogram(
+    'data_api_method_duration_seconds',
+    'Time spent in each data API client method',
+    ['endpoint', 'method'],
+)
+
+TEMPLATE_RENDER_DURATION_SECONDS = Histogram(
+    'template_render_duration_seconds',
+    'Time spent rendering each page template',
+    ['endpoint'],
+)
@@ -0,0 +1,69 @@
+from time import time
+
+from flask import current_app, request, session
+
+from .metrics import SESSION_WRITES_AVOIDED_TOTAL
+
+
+class OnlyChangedSessionInterface(object):
+    """Wraps an app's session interface so sessions are only saved when they need to be
+
+    Flask's own cookie sessions already only set the cookie when the session has changed (or on every request if
+    SESSION_REFRESH_EACH_REQUEST is set), but the redis session interface from Flask-Session writes every non-empty
+    session back to redis and re-issues its cookie on every request. This applies the same check to any interface.
+    """
+
+    def __init__(self, interface):
+        self.interface = interface
+
+    def __getattr__(self, name):
+        return getattr(self.interface, name)
+
+    def save_session(self, app, session, response):
+        if session and not self.interface.should_set_cookie(app, session):
+            SESSION_WRITES_AVOIDED_TOTAL.inc()
+            return
+        return self.interface.save_session(app, session, response)
+
+
+class SlidingSessionRefresh(object):
+    """Keeps logged in users' sessions alive, re-issuing them only once in a while rather than on every request
+
+    A session is made permanent and saved again (pushing back its expiry by PERMANENT_SESSION_LIFETIME) when at least
+    `refresh_fraction` of the lifetime has passed since it was last refreshed. Other requests leave an unchanged
+    session alone, so it isn't serialized, signed and written again. Requests with no logged in user, and those for
+    static assets, healthchecks, the status page and metrics never refresh the session.
+    """
+
+    SKIPPED_BLUEPRINTS = frozenset(('healthcheck', 'status', 'metrics'))
+    REFRESHED_AT_KEY = '_refreshed_at'
+
+    def __init__(self, refresh_fraction=0):
+        self.refresh_fraction = refresh_fraction
+
+    def init_app(self, app):
+        self.refresh_fraction = app.config['DM_SESSION_REFRESH_FRACTION']
+        app.session_interface = OnlyChangedSessionInterface(app.session_interface)
+        app.before_request(self.refresh_session)
+
+    def _is_skipped(self):
+        return (
+            request.endpoint is None
+            or request.endpoint == 'static'
+            or request.blueprint in self.SKIPPED_BLUEPRINTS
+            or '_user_id' not in session
+        )
+
+    def refresh_session(self):
+        if self._is_skipped():
+            return
+
+        now = time()
+        refresh_after = self.refresh_fraction * current_app.permanent_session_lifetime.total_seconds()
+        if now - session.get(self.REFRESHED_AT_KEY, 0) >= refresh_after:
+            session.permanent = True
+            session[self.REFRESHED_AT_KEY] = int(now)
+            session.modified = True
+
+
+session_refresh = SlidingSessionRefresh()
@@ -1,12 +1,32 @@
-from flask import request
+import hmac
 
-from . import status
-from .. import data_api_client
+from flask import abort, current_app, jsonify, request
+
+from . import status as status_blueprint
+from .. import csrf, data_api_client
+from ..main.helpers.framework_cache import framework_cache
 from dmutils.status import get_app_status
 
 
-@status.route('/_status')
+@status_blueprint.route('/_status')
 def status():
     return get_app_status(data_api_client=data_api_client,
                           search_api_client=None,
                           ignore_dependencies='ignore-dependencies' in request.args)
+
+
+@status_blueprint.route('/_framework-cache', methods=['DELETE'])
+@csrf.exempt
+def invalidate_framework_cache():
+    # Reaches every worker process sharing DM_FRAMEWORK_CACHE_INVALIDATION_DIRECTORY (see
+    # app/main/helpers/framework_cache.py) - but not other instances, which pick up changes once their copies expire.
+    token = current_app.config['DM_FRAMEWORK_CACHE_INVALIDATION_TOKEN']
+    if not token:
+        abort(404)
+    if not hmac.compare_digest(request.headers.get('Authorization', ''), 'Bearer {}'.format(token)):
+        # not aborting as the frontend 403 handler would redirect to the login page
+        return jsonify(status='forbidden'), 403
+
+    framework_cache.invalidate(request.args.get('framework'))
+
+    return jsonify(status='ok'), 200
@@ -0,0 +1,128 @@
+import os
+import tempfile
+
+import jinja2
+from jinja2 import meta
+from jinja2.loaders import split_template_path
+
+from dmutils.timing import logged_duration
+
+# the app's own page templates - everything they extend, include or import is compiled along with them
+PRECOMPILED_TEMPLATE_FOLDERS = ('buyers', 'create_buyer')
+
+
+class TemplateBytecodeCache(jinja2.FileSystemBytecodeCache):
+    """A `FileSystemBytecodeCache` which can be shared by several processes and may be read-only
+
+    Compiled templates are written under a temporary name and moved into place so a partially written file is never
+    read, and failing to write one (e.g. to a cache directory built into a read-only image) only means the template
+    will be compiled again next time rather than the page failing. Jinja ignores any cached file made from a different
+    template source or by a different version of Python or Jinja.
+    """
+
+    def dump_bytecode(self, bucket):
+        try:
+            fd, temporary_path = tempfile.mkstemp(dir=self.directory, prefix='.', suffix='.cache')
+        except OSError:
+            return
+
+        try:
+            with os.fdopen(fd, 'wb') as temporary_file:
+                bucket.write_bytecode(temporary_file)
+            os.replace(temporary_path, self._get_cache_filename(bucket))
+        except OSError:
+            try:
+                os.unlink(temporary_path)
+            except OSError:
+                pass
+
+
+class IndexedFileSystemLoader(jinja2.FileSystemLoader):
+    """A `FileSystemLoader` which finds templates in an index of its search paths built when it's created
+
+    Looking up a template in a plain `FileSystemLoader` tries to open it in each search path in turn, which with the
+    node_modules folders means several failed file system calls for most templates and macro imports. Instead each
+    search path is walked once, up front, and templates are read straight from the first path they were found in.
+
+    Templates are assumed not to change while the app is running, so none are added to the index after it's built and
+    loaded templates are never checked for changes. Use a plain `FileSystemLoader` where templates are being edited.
+    """
+
+    def __init__(self, searchpath, encoding='utf-8', followlinks=False):
+        super().__init__(searchpath, encoding=encoding, followlinks=followlinks)
+        self.index = {}
+        for searchpath in self.searchpath:
+            for dirpath, _, filenames in os.walk(searchpath, followlinks=self.followlinks):
+                for filename in filenames:
+                    template = os.path.relpath(os.path.join(dirpath, filename), searchpath).replace(os.path.sep, '/')
+                    self.index.setdefault(template, os.path.join(searchpath, *template.split('/')))
+
+    def get_source(self, environment, template):
+        filename = self.index.get('/'.join(split_template_path(template)))
+        if filename is None:
+            raise jinja2.TemplateNotFound(template)
+
+        with open(filename, 'rb') as template_file:
+            contents = template_file.read().decode(self.encoding)
+        # as the template is never reloaded there's no need for an `uptodate` function
+        return contents, filename, None
+
+    def list_templates(self):
+        return sorted(self.index)
+
+
+def init_app(app):
+    directory = app.config['DM_TEMPLATE_BYTECODE_CACHE_DIRECTORY']
+    if not directory:
+        return
+
+    try:
+        os.makedirs(directory, exist_ok=True)
+    except OSError:
+        app.logger.warning("Template bytecode cache {directory} can't be created", extra={'directory': directory})
+        return
+    app.jinja_env.bytecode_cache = TemplateBytecodeCache(directory)
+
+
+def iter_page_templates(app, folders=PRECOMPILED_TEMPLATE_FOLDERS):
+    """Yield the name of each template in the `folders` of the app's templates folder"""
+    templates_folder = os.path.join(app.root_path, app.template_folder or 'templates')
+    for folder in folders:
+        for dirpath, _, filenames in os.walk(os.path.join(templates_folder, folder)):
+            for filename in sorted(filenames):
+                if filename.endswith('.html'):
+                    yield os.path.relpath(os.path.join(dirpath, filename), templates_folder).replace(os.sep, '/')
+
+
+def precompile_templates(app, folders=PRECOMPILED_TEMPLATE_FOLDERS):
+    """Compile the app's page templates, and every template they use, into the Jinja environment's cache
+
+    Only templates named by constant strings can be found. Returns the names of the templates compiled.
+    """
+    env = app.jinja_env
+    compiled = []
+    with logged_duration(
+        logger=app.logger,
+        message="Spent {duration_real}s in precompile_templates",
+        condition=True,
+    ):
+        to_compile = list(iter_page_templates(app, folders))
+        seen = set(to_compile)
+        while to_compile:
+            name = to_compile.pop()
+            try:
+                source = env.loader.get_source(env, name)[0]
+            except jinja2.TemplateNotFound:
+                # perhaps only included when it exists
+                app.logger.warning("Template {template_name} not found to precompile", extra={'template_name': name})
+                continue
+            env.get_template(name)
+            compiled.append(name)
+
+            for referenced in meta.find_referenced_templates(env.parse(source)):
+                if referenced is not None and referenced not in seen:
+                    seen.add(referenced)
+                    to_compile.append(referenced)
+
+    app.logger.info("Precompiled {template_count} templates", extra={'template_count': len(compiled)})
+    return compiled
@@ -0,0 +1,76 @@
+import threading
+import time
+
+from dmutils.user import User
+
+from .metrics import USER_CACHE_TOTAL
+
+
+class UserCache(object):
+    """A short-lived, process-wide cache of the users loaded by Flask-Login, keyed by user id
+
+    Every request from a logged in user needs their user record from the API before any view code runs. Records are
+    kept for `DM_USER_CACHE_TTL` seconds, so a lockout, deactivation or password change is only honoured by this app
+    up to that long after it's made. A TTL of 0 disables the cache entirely.
+
+    At most `DM_USER_CACHE_MAX_SIZE` users are kept, the longest cached being dropped first.
+    """
+
+    def __init__(self, ttl=0, max_size=1000, clock=time.monotonic):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._clock = clock
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.ttl = app.config['DM_USER_CACHE_TTL']
+        self.max_size = app.config['DM_USER_CACHE_MAX_SIZE']
+        self.invalidate()
+
+    def invalidate(self, user_id=None):
+        """Drop the cached record of `user_id`, or of every user if no id is given"""
+        with self._lock:
+            if user_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(str(user_id), None)
+
+    def load_user(self, data_api_client, user_id):
+        """Return a `User` for `user_id` if they exist and are active, as `User.load_user` does"""
+        if self.ttl <= 0:
+            return User.load_user(data_api_client, user_id)
+
+        user_json = self._get(str(user_id))
+        if user_json is None:
+            USER_CACHE_TOTAL.labels(result='miss').inc()
+            user_json = data_api_client.get_user(user_id=int(user_id))
+            if not user_json:
+                return None
+            self._store(str(user_id), user_json)
+        else:
+            USER_CACHE_TOTAL.labels(result='hit').inc()
+
+        user = User.from_json(user_json)
+        if user.is_active():
+            return user
+
+    def _get(self, user_id):
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+
+        loaded_at, user_json = entry
+        if self._clock() - loaded_at >= self.ttl:
+            return None
+        return user_json
+
+    def _store(self, user_id, user_json):
+        with self._lock:
+            self._entries.pop(user_id, None)
+            while self._entries and len(self._entries) >= self.max_size:
+                del self._entries[next(iter(self._entries))]
+            self._entries[user_id] = (self._clock(), user_json)
+
+
+user_cache = UserCache()
@@ -1,5 +1,6 @@
 import os
 import hashlib
+import tempfile
 import jinja2
 import json
 import dmcontent.govuk_frontend
@@ -29,6 +30,11 @@ class Config(object):
     SESSION_COOKIE_SAMESITE = "Lax"
 
     PERMANENT_SESSION_LIFETIME = 3600  # 1 hour
+    # only save sessions which have changed, see app/session_refresh.py
+    SESSION_REFRESH_EACH_REQUEST = False
+    # a logged in user's session is re-issued once this fraction of PERMANENT_SESSION_LIFETIME has passed since it last
+    # was - 0 re-issues it on every request
+    DM_SESSION_REFRESH_FRACTION = 0.1
 
     DM_COOKIE_PROBE_EXPECT_PRESENT = True
 
@@ -37,9 +43,59 @@ class Config(object):
 
     DM_DATA_API_URL = None
     DM_DATA_API_AUTH_TOKEN = None
+    # Connections to the data API are kept open and shared by each process's threads, see app/api_transport.py. The
+    # pool size is per process and should cover its threads plus DM_CONCURRENT_FETCH_MAX_WORKERS - without
+    # DM_DATA_API_POOL_BLOCK, threads beyond that open (and then close) connections of their own
+    DM_DATA_API_POOL_SIZE = 16
+    DM_DATA_API_POOL_BLOCK = False
+    # seconds a pooled connection is idle before TCP keep-alive probes are sent - 0 disables keep-alive probes
+    DM_DATA_API_TCP_KEEPALIVE_IDLE = 60
+    DM_DATA_API_CONNECT_TIMEOUT = 15
+    DM_DATA_API_READ_TIMEOUT = 45
+    # times a GET (or any request which couldn't connect) is retried, waiting longer after each failure
+    DM_DATA_API_RETRIES = 5
+    DM_DATA_API_RETRY_BACKOFF_FACTOR = 0.3
     DM_NOTIFY_API_KEY = None
     DM_REDIS_SERVICE_NAME = None
 
+    # Framework documents are cached per process, see app/main/helpers/framework_cache.py
+    DM_FRAMEWORK_CACHE_TTL = 300  # 5 minutes
+    DM_FRAMEWORK_CACHE_STALE_TTL = 600  # 10 minutes
+    # Bearer token accepted by the framework cache invalidation endpoint - the endpoint is disabled when unset
+    DM_FRAMEWORK_CACHE_INVALIDATION_TOKEN = None
+    # Where invalidations are stamped for every worker process to see - without one an invalidation only affects the
+    # process which handles it
+    DM_FRAMEWORK_CACHE_INVALIDATION_DIRECTORY = None
+
+    # Threads shared by all requests for making independent API reads in parallel, see app/concurrent_fetch.py. Reads
+    # which find every thread busy are made by the requesting thread rather than waiting. 0 makes all such reads one
+    # after the other
+    DM_CONCURRENT_FETCH_MAX_WORKERS = 8
+
+    # Brief response downloads are built by background threads and kept on disk, see
+    # app/main/helpers/response_exports.py. Without a directory each process uses its own temporary directory. 0
+    # workers builds files in the requesting thread.
+    DM_RESPONSE_EXPORT_DIRECTORY = None
+    DM_RESPONSE_EXPORT_MAX_WORKERS = 2
+    # seconds a download request waits for its file to be built before asking the browser to come back for it
+    DM_RESPONSE_EXPORT_WAIT = 20
+    # seconds a built file is kept (and served) for - they hold suppliers' contact details. 0 keeps them forever
+    DM_RESPONSE_EXPORT_MAX_AGE = 24 * 60 * 60
+
+    # Logged in users' records are cached per process, see app/user_cache.py, so lockouts and password changes take up
+    # to the TTL (in seconds) to be honoured. A TTL of 0 disables the cache
+    DM_USER_CACHE_TTL = 30
+    DM_USER_CACHE_MAX_SIZE = 1000
+
+    # send each response's data API and rendering times in a Server-Timing header, see app/instrumentation.py
+    DM_SERVER_TIMING_HEADER = False
+
+    # rendered brief previews kept by each process, see app/main/helpers/page_cache.py - 0 disables the cache
+    DM_BRIEF_PREVIEW_CACHE_SIZE = 100
+
+    # briefs shown in each list on the requirements dashboard
+    DM_REQUIREMENTS_PAGE_SIZE = 50
+
     NOTIFY_TEMPLATES = {
         "create_user_account": "84f5d812-df9d-4ab8-804a-06f64f5abd30",
     }
@@ -62,6 +118,14 @@ class Config(object):
         'asset_fingerprinter': AssetFingerprinter(asset_root=ASSET_PATH)
     }
 
+    # Freeze the garbage collector once the app is loaded so forked workers keep sharing its memory with the master
+    DM_PREFORK_WARM_UP = False
+    # Compiled templates are kept on disk here, see app/template_cache.py - docker-aws/Dockerfile.wsgi fills it when
+    # building the image
+    DM_TEMPLATE_BYTECODE_CACHE_DIRECTORY = None
+    # Compile the app's page templates, and everything they use, when the app is created rather than on first use
+    DM_PRECOMPILE_TEMPLATES = False
+
     # LOGGING
     DM_LOG_LEVEL = 'DEBUG'
     DM_PLAIN_TEXT_LOGS = False
@@ -79,7 +143,12 @@ class Config(object):
             os.path.join(digitalmarketplace_govuk_frontend),
             os.path.join(digitalmarketplace_govuk_frontend, "digitalmarketplace", "templates"),
         ]
-        jinja_loader = jinja2.FileSystemLoader(template_folders)
+        if app.debug or app.config.get('TEMPLATES_AUTO_RELOAD'):
+            # templates are reloaded as they're edited
+            jinja_loader = jinja2.FileSystemLoader(template_folders)
+        else:
+            from app.template_cache import IndexedFileSystemLoader
+            jinja_loader = IndexedFileSystemLoader(template_folders)
         app.jinja_loader = jinja_loader
 
         # Set the govuk_frontend_version to account for version-based quirks (eg: v3 Error Summary links to radios)
@@ -97,6 +166,11 @@ class Test(Config):
     DM_DATA_API_URL = "http://wrong.completely.invalid:5000"
     DM_DATA_API_AUTH_TOKEN = "myToken"
 
+    DM_FRAMEWORK_CACHE_TTL = 0
+    DM_RESPONSE_EXPORT_MAX_WORKERS = 0
+    DM_USER_CACHE_TTL = 0
+    DM_SERVER_TIMING_HEADER = True
+
     DM_NOTIFY_API_KEY = "not_a_real_key-00000000-fake-uuid-0000-000000000000"
     SHARED_EMAIL_KEY = "KEY"
     SECRET_KEY = "KEY"
@@ -106,6 +180,7 @@ class Development(Config):
     DEBUG = True
     DM_PLAIN_TEXT_LOGS = True
     SESSION_COOKIE_SECURE = False
+    DM_SERVER_TIMING_HEADER = True
 
     DM_DATA_API_URL = f"http://localhost:{os.getenv('DM_API_PORT', 5000)}"
     DM_DATA_API_AUTH_TOKEN = "myToken"
@@ -119,6 +194,14 @@ class SharedLive(Config):
     """Base config for deployed environments shared between GPaaS and AWS"""
     DEBUG = False
     DM_HTTP_PROTO = 'https'
+    DM_PREFORK_WARM_UP = True
+    DM_TEMPLATE_BYTECODE_CACHE_DIRECTORY = os.path.join(basedir, '.template-cache')
+    DM_PRECOMPILE_TEMPLATES = True
+    # shared by all of an instance's worker processes
+    DM_RESPONSE_EXPORT_DIRECTORY = os.path.join(tempfile.gettempdir(), 'briefs-frontend-response-exports')
+    DM_FRAMEWORK_CACHE_INVALIDATION_DIRECTORY = os.path.join(
+        tempfile.gettempdir(), 'briefs-frontend-framework-cache-invalidations',
+    )
 
     # use of invalid email addresses with live api keys annoys Notify
     DM_NOTIFY_REDIRECT_DOMAINS_TO_ADDRESS = {
@@ -144,11 +227,11 @@ class Live(SharedLive):
 
 
 class Preview(Live):
-    pass
+    DM_SERVER_TIMING_HEADER = True
 
 
 class Staging(Live):
-    pass
+    DM_SERVER_TIMING_HEADER = True
 
 
 class Production(Live):
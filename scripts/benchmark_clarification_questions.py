@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+"""Compare the time taken to convert a live brief's clarification questions and answers to HTML for the supplier
+questions page with `text_to_html` on every view, against the memoized `clarification_question_rows` once its cache
+has been filled by the first view.
+
+Usage:
+    scripts/benchmark_clarification_questions.py [--questions=<n>] [--repeat=<n>]
+
+Options:
+    --questions=<n>  Number of synthetic questions and answers [default: 200]
+    --repeat=<n>     Number of page views [default: 50]
+"""
+import sys
+import timeit
+
+from docopt import docopt
+from dmcontent.html import text_to_html
+
+sys.path.insert(0, '.')
+
+from app.main.helpers.clarification_questions import clarification_question_rows  # noqa: E402
+
+
+def synthetic_questions(question_count):
+    return [
+        {
+            "question": "Question {} about the requirements, see https://www.example.com/requirements/{}?\r\n"
+                        "And a second line to the question.".format(i, i),
+            "answer": "Answer {} with details at https://www.gov.uk/guidance/{} and more detail.\r\n\r\n".format(i, i)
+                      * 3,
+            "publishedAt": "2016-03-29T10:11:13.000000Z",
+        }
+        for i in range(question_count)
+    ]
+
+
+def uncached_rows(questions):
+    rows = []
+    for index, question in enumerate(questions):
+        rows.append(dict(
+            question,
+            key={"html": f"{str(index + 1)}. "
+                         f"{text_to_html(question['question'], format_links=True, preserve_line_breaks=True)}"},
+            value={"html": text_to_html(question["answer"], format_links=True, preserve_line_breaks=True)},
+        ))
+    return rows
+
+
+def strip_numbers(rows):
+    return [{key: value for key, value in row.items() if key != 'number'} for row in rows]
+
+
+if __name__ == '__main__':
+    arguments = docopt(__doc__)
+    questions = synthetic_questions(int(arguments['--questions']))
+    repeat = int(arguments['--repeat'])
+
+    assert uncached_rows(questions) == strip_numbers(clarification_question_rows(questions))
+
+    uncached_time = timeit.timeit(lambda: uncached_rows(questions), number=repeat) / repeat
+    cached_time = timeit.timeit(lambda: clarification_question_rows(questions), number=repeat) / repeat
+    print("{:>10} {:>12} {:>10} {:>9}".format("questions", "uncached ms", "cached ms", "speedup"))
+    print("{:>10} {:>12.2f} {:>10.2f} {:>8.1f}x".format(
+        len(questions), uncached_time * 1e3, cached_time * 1e3, uncached_time / cached_time,
+    ))
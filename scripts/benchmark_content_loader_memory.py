@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+"""Compare the memory retained by per-thread content loaders when each thread takes a deepcopy of the primary loader
+against each thread taking a copy-on-write view of it.
+
+Each thread does the work a typical request does with its loader: fetching and filtering every framework's
+`edit_brief` manifest and loading its `urls` messages.
+
+Run from the repository root once the frontend build has copied the frameworks content into app/content.
+
+Usage:
+    scripts/benchmark_content_loader_memory.py [--threads=<n>...]
+
+Options:
+    --threads=<n>  Number of threads to create content loaders in, may be repeated [default: 1 4 16 64]
+"""
+import sys
+import threading
+import tracemalloc
+from copy import deepcopy
+
+from docopt import docopt
+
+sys.path.insert(0, '.')
+
+from app.main import _load_primary_content_loader  # noqa: E402
+from app.main.helpers.content import CopyOnWriteContentLoader  # noqa: E402
+
+
+def use_content_loader(content_loader):
+    for framework_slug in list(content_loader._content):
+        content_loader.get_manifest(framework_slug, 'edit_brief').filter({'lot': 'digital-specialists'})
+        content_loader.load_messages(framework_slug, ['urls'])
+
+
+def measure(make_content_loader, primary, thread_count):
+    content_loaders = []
+
+    def worker():
+        content_loader = make_content_loader(primary)
+        use_content_loader(content_loader)
+        content_loaders.append(content_loader)
+
+    tracemalloc.start()
+    threads = [threading.Thread(target=worker) for _ in range(thread_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return retained, peak
+
+
+if __name__ == '__main__':
+    arguments = docopt(__doc__)
+    thread_counts = [int(count) for value in arguments['--threads'] for count in value.split()]
+
+    primary = _load_primary_content_loader()
+    approaches = (
+        ('deepcopy', deepcopy),
+        ('copy-on-write', CopyOnWriteContentLoader),
+    )
+
+    print("{:>8} {:>15} {:>14} {:>14} {:>16}".format(
+        "threads", "approach", "retained MiB", "peak MiB", "MiB per thread",
+    ))
+    for thread_count in thread_counts:
+        for name, make_content_loader in approaches:
+            retained, peak = measure(make_content_loader, primary, thread_count)
+            print("{:>8} {:>15} {:>14.2f} {:>14.2f} {:>16.3f}".format(
+                thread_count, name, retained / 2 ** 20, peak / 2 ** 20, retained / 2 ** 20 / thread_count,
+            ))
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+"""Compare the peak memory used writing the (DOS1) brief responses CSV when every row is built before writing starts
+against streaming rows out as they're generated.
+
+Synthetic responses are generated up front (they arrive from the API as a single document either way), so only memory
+used by producing the CSV itself is measured.
+
+Usage:
+    scripts/benchmark_csv_export_memory.py [--responses=<n>...]
+
+Options:
+    --responses=<n>  Number of synthetic brief responses, may be repeated [default: 100 1000 10000]
+"""
+import csv
+import sys
+import tracemalloc
+
+from docopt import docopt
+from dmcontent.questions import Question
+from dmutils.csv_generator import iter_csv
+
+sys.path.insert(0, '.')
+
+from app.main.views.download_responses import DownloadBriefResponsesView  # noqa: E402
+
+ESSENTIAL_REQUIREMENTS = ["Essential {}".format(i) for i in range(5)]
+NICE_TO_HAVE_REQUIREMENTS = ["Nice to have {}".format(i) for i in range(5)]
+QUESTIONS = [
+    Question({'id': 'supplierName', 'name': 'Supplier', 'type': 'text'}),
+    Question({'id': 'availability', 'name': 'Date the specialist can start work', 'type': 'text'}),
+    Question({'id': 'dayRate', 'name': 'Day rate', 'type': 'text'}),
+    Question({'id': 'niceToHaveRequirements', 'name': 'Nice-to-have skills', 'type': 'boolean_list'}),
+    Question({'id': 'respondToEmailAddress', 'name': 'Email address', 'type': 'text'}),
+]
+
+
+class BenchmarkView(DownloadBriefResponsesView):
+    def get_questions(self, framework_slug, lot_slug, manifest):
+        return QUESTIONS
+
+
+def synthetic_file_context(response_count):
+    return {
+        'brief': {
+            'frameworkSlug': 'digital-outcomes-and-specialists',
+            'lotSlug': 'digital-specialists',
+            'essentialRequirements': ESSENTIAL_REQUIREMENTS,
+            'niceToHaveRequirements': NICE_TO_HAVE_REQUIREMENTS,
+        },
+        'responses': [
+            {
+                'supplierName': "Supplier {}".format(i),
+                'availability': "Within {} weeks of the contract starting".format(i % 12),
+                'dayRate': "£{}".format(300 + i % 700),
+                'essentialRequirements': [True] * len(ESSENTIAL_REQUIREMENTS),
+                'niceToHaveRequirements': [bool((i >> bit) & 1) for bit in range(len(NICE_TO_HAVE_REQUIREMENTS))],
+                'respondToEmailAddress': "supplier-{}@example.com".format(i),
+            }
+            for i in range(response_count)
+        ],
+    }
+
+
+def measure(rows):
+    tracemalloc.start()
+    size = sum(len(chunk) for chunk in iter_csv(rows(), quoting=csv.QUOTE_ALL))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, peak
+
+
+if __name__ == '__main__':
+    arguments = docopt(__doc__)
+    response_counts = [int(count) for value in arguments['--responses'] for count in value.split()]
+    view = BenchmarkView()
+
+    print("{:>10} {:>10} {:>20} {:>20}".format("responses", "CSV KiB", "all rows peak KiB", "streamed peak KiB"))
+    for response_count in response_counts:
+        file_context = synthetic_file_context(response_count)
+
+        size, all_rows_peak = measure(lambda: list(view.iter_csv_rows(file_context)))
+        _, streamed_peak = measure(lambda: view.iter_csv_rows(file_context))
+
+        print("{:>10} {:>10.1f} {:>20.1f} {:>20.1f}".format(
+            response_count, size / 1024, all_rows_peak / 1024, streamed_peak / 1024,
+        ))
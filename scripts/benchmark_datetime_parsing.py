@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+"""Compare the time taken to parse API timestamps with `datetime.strptime(value, DATETIME_FORMAT)` against
+`parse_datetime`, both without its memo (each timestamp seen for the first time) and with it (as when the same briefs'
+dates are parsed again by sorting, templates and the publishing dates).
+
+Usage:
+    scripts/benchmark_datetime_parsing.py [--timestamps=<n>] [--repeat=<n>]
+
+Options:
+    --timestamps=<n>  Number of distinct synthetic timestamps [default: 1000]
+    --repeat=<n>      Number of times to parse the timestamps [default: 20]
+"""
+import sys
+import timeit
+from datetime import datetime, timedelta
+
+from docopt import docopt
+
+sys.path.insert(0, '.')
+
+from dmutils.formats import DATETIME_FORMAT  # noqa: E402
+
+from app.main.helpers.dates import parse_datetime  # noqa: E402
+
+
+def synthetic_timestamps(timestamp_count):
+    start = datetime(2016, 1, 1)
+    return [
+        (start + timedelta(seconds=i * 7919, microseconds=i * 104729)).strftime(DATETIME_FORMAT)
+        for i in range(timestamp_count)
+    ]
+
+
+def with_strptime(timestamps):
+    return [datetime.strptime(timestamp, DATETIME_FORMAT) for timestamp in timestamps]
+
+
+def without_memo(timestamps):
+    return [parse_datetime.__wrapped__(timestamp) for timestamp in timestamps]
+
+
+def with_memo(timestamps):
+    return [parse_datetime(timestamp) for timestamp in timestamps]
+
+
+if __name__ == '__main__':
+    arguments = docopt(__doc__)
+    timestamps = synthetic_timestamps(int(arguments['--timestamps']))
+    repeat = int(arguments['--repeat'])
+
+    assert with_strptime(timestamps) == without_memo(timestamps) == with_memo(timestamps)
+
+    print("{:>11} {:>12} {:>18} {:>8} {:>15} {:>8}".format(
+        "timestamps", "strptime ms", "parse_datetime ms", "speedup", "memoized ms", "speedup",
+    ))
+    strptime_time = timeit.timeit(lambda: with_strptime(timestamps), number=repeat) / repeat
+    parse_time = timeit.timeit(lambda: without_memo(timestamps), number=repeat) / repeat
+    memoized_time = timeit.timeit(lambda: with_memo(timestamps), number=repeat) / repeat
+    print("{:>11} {:>12.2f} {:>18.2f} {:>7.1f}x {:>15.2f} {:>7.1f}x".format(
+        len(timestamps), strptime_time * 1e3, parse_time * 1e3, strptime_time / parse_time,
+        memoized_time * 1e3, strptime_time / memoized_time,
+    ))
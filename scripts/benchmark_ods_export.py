@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+"""Compare the time taken to build the brief responses spreadsheet (ODS) column by column, looking each row up by name
+for every cell, against building it row by row.
+
+Synthetic responses are generated up front for a brief with text, boolean list and dynamic list questions. The
+sheet's XML is checked to be byte-for-byte the same both ways before timings are reported.
+
+Usage:
+    scripts/benchmark_ods_export.py [--responses=<n>...] [--repeat=<n>]
+
+Options:
+    --responses=<n>  Number of synthetic brief responses, may be repeated [default: 10 100 1000]
+    --repeat=<n>     Number of times to build each spreadsheet [default: 3]
+"""
+import sys
+import timeit
+from io import StringIO
+
+from docopt import docopt
+from dmcontent.questions import Question
+
+sys.path.insert(0, '.')
+
+from app.main.views.download_responses import DownloadBriefResponsesView  # noqa: E402
+
+ESSENTIAL_REQUIREMENTS = ["Essential {}".format(i) for i in range(10)]
+NICE_TO_HAVE_REQUIREMENTS = ["Nice to have {}".format(i) for i in range(10)]
+QUESTIONS = [
+    Question({'id': 'supplierName', 'name': 'Supplier', 'type': 'text'}),
+    Question({'id': 'respondToEmailAddress', 'name': 'Email address', 'type': 'text'}),
+    Question({'id': 'availability', 'name': 'Availability', 'type': 'text'}),
+    Question({'id': 'dayRate', 'name': 'Day rate', 'type': 'text'}),
+    Question({'id': 'essentialRequirementsMet', 'name': 'Meets all essential requirements', 'type': 'boolean_list'}),
+    Question({'id': 'essentialRequirements', 'name': 'Essential skills & evidence', 'type': 'dynamic_list'}),
+    Question({'id': 'niceToHaveRequirements', 'name': 'Nice-to-have skills & evidence', 'type': 'dynamic_list'}),
+]
+
+
+class BenchmarkView(DownloadBriefResponsesView):
+    def get_questions(self, framework_slug, lot_slug, manifest):
+        return QUESTIONS
+
+
+class ColumnByColumnView(BenchmarkView):
+    def populate_styled_ods_with_data(self, spreadsheet, file_context):
+        # the previous implementation, kept here as the reference for the document's content
+        sheet = spreadsheet.sheet("Supplier evidence")
+
+        brief, responses = file_context['brief'], file_context['responses']
+        questions = self.get_questions(brief['frameworkSlug'], brief['lotSlug'], 'output_brief_response')
+
+        sheet.create_column(stylename="col-wide", defaultcellstylename="cell-default")
+        sheet.create_column(stylename="col-wide", defaultcellstylename="cell-default")
+
+        row = sheet.create_row("header", stylename="row-tall")
+        row.write_cell(brief['title'], stylename="cell-header", numbercolumnsspanned=str(len(responses) + 2))
+
+        for question in questions:
+            if question._data['type'] in ('boolean_list', 'dynamic_list'):
+                length = len(brief[question.id])
+
+                for i, requirement in enumerate(brief[question.id]):
+                    row = sheet.create_row("{0}[{1}]".format(question.id, i))
+                    if i == 0:
+                        row.write_cell(question.name, stylename="cell-header", numberrowsspanned=str(length))
+                    else:
+                        row.write_covered_cell()
+                    row.write_cell(requirement, stylename="cell-default")
+            else:
+                row = sheet.create_row(question.id, stylename="row-tall-optimal")
+                row.write_cell(question.name, stylename="cell-header", numbercolumnsspanned="2")
+                row.write_covered_cell()
+
+        for response in responses:
+            sheet.create_column(stylename="col-extra-wide", defaultcellstylename="cell-default")
+
+            for question in questions:
+                if question._data['type'] == 'dynamic_list':
+                    if not brief.get(question.id):
+                        continue
+
+                    for i, item in enumerate(response[question.id]):
+                        row = sheet.get_row("{0}[{1}]".format(question.id, i))
+                        row.write_cell(item.get('evidence') or '', stylename="cell-default")
+
+                elif question.type == 'boolean_list' and brief.get(question.id):
+                    for i, item in enumerate(response[question.id]):
+                        row = sheet.get_row("{0}[{1}]".format(question.id, i))
+                        row.write_cell(str(bool(item)).lower(), stylename="cell-default")
+
+                else:
+                    sheet.get_row(question.id).write_cell(response.get(question.id, ''), stylename="cell-default")
+
+        return spreadsheet
+
+
+def synthetic_file_context(response_count):
+    return {
+        'brief': {
+            'title': 'Benchmark brief',
+            'frameworkSlug': 'digital-outcomes-and-specialists-4',
+            'lotSlug': 'digital-specialists',
+            'essentialRequirementsMet': ["All essential requirements"],
+            'essentialRequirements': ESSENTIAL_REQUIREMENTS,
+            'niceToHaveRequirements': NICE_TO_HAVE_REQUIREMENTS,
+        },
+        'responses': [
+            {
+                'supplierName': "Supplier {}".format(i),
+                'respondToEmailAddress': "supplier-{}@example.com".format(i),
+                'availability': "Within {} weeks of the contract starting".format(i % 12),
+                'dayRate': "£{}".format(300 + i % 700),
+                'essentialRequirementsMet': [True],
+                'essentialRequirements': [
+                    {'evidence': "Evidence {} for supplier {}".format(j, i)} for j in range(len(ESSENTIAL_REQUIREMENTS))
+                ],
+                # not every supplier has every nice-to-have
+                'niceToHaveRequirements': [
+                    {'evidence': "Evidence {} for supplier {}".format(j, i)} if (i >> j) & 1 else {'yesNo': False}
+                    for j in range(i % (len(NICE_TO_HAVE_REQUIREMENTS) + 1))
+                ],
+            }
+            for i in range(response_count)
+        ],
+    }
+
+
+def build(view, file_context):
+    return view.populate_styled_ods_with_data(view.create_blank_ods_with_styles(), file_context)
+
+
+def sheet_xml(spreadsheet):
+    # odfpy adds namespace declarations to the document as it's serialised, so compare just the sheet itself
+    xml = StringIO()
+    spreadsheet.sheet("Supplier evidence")._table.toXml(0, xml)
+    return xml.getvalue()
+
+
+if __name__ == '__main__':
+    arguments = docopt(__doc__)
+    response_counts = [int(count) for value in arguments['--responses'] for count in value.split()]
+    repeat = int(arguments['--repeat'])
+    column_view, row_view = ColumnByColumnView(), BenchmarkView()
+
+    print("{:>10} {:>18} {:>18} {:>9}".format("responses", "column by column ms", "row by row ms", "speedup"))
+    for response_count in response_counts:
+        file_context = synthetic_file_context(response_count)
+        assert sheet_xml(build(column_view, file_context)) == sheet_xml(build(row_view, file_context))
+
+        column_time = timeit.timeit(lambda: build(column_view, file_context), number=repeat) / repeat
+        row_time = timeit.timeit(lambda: build(row_view, file_context), number=repeat) / repeat
+        print("{:>10} {:>18.1f} {:>18.1f} {:>8.1f}x".format(
+            response_count, column_time * 1e3, row_time * 1e3, column_time / row_time,
+        ))
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""Report application startup time and the memory used by each forked worker, with and without the pre-fork warm-up.
+
+The app is created once in this (master) process, then worker processes are forked from it. Each worker does the
+content work a handful of requests would do, runs a full garbage collection and reports how much of its memory is
+private to it (i.e. no longer shared with the master) from /proc/self/smaps_rollup. This is then repeated after running
+`prefork_warm_up`. Linux only.
+
+Run from the repository root once the frontend build has copied the frameworks content into app/content.
+
+Usage:
+    scripts/benchmark_prefork_memory.py [--workers=<n>] [--config=<name>]
+
+Options:
+    --workers=<n>    Number of worker processes to fork [default: 4]
+    --config=<name>  App config to create the app with [default: development]
+"""
+import gc
+import json
+import os
+import sys
+import time
+
+from docopt import docopt
+
+sys.path.insert(0, '.')
+
+
+def read_memory_kib():
+    with open('/proc/self/smaps_rollup') as smaps_rollup:
+        next(smaps_rollup)  # address range header
+        fields = dict(line.split(':', 1) for line in smaps_rollup)
+    return {name: int(fields[name].split()[0]) for name in ('Rss', 'Pss', 'Private_Clean', 'Private_Dirty')}
+
+
+def do_request_work():
+    from app.main import get_content_loader
+
+    content_loader = get_content_loader()
+    for framework_slug in list(content_loader._content):
+        manifest = content_loader.get_manifest(framework_slug, 'edit_brief').filter({'lot': 'digital-specialists'})
+        manifest.summary({})
+        content_loader.get_message(framework_slug, 'urls', 'call_off_contract_url')
+    gc.collect()
+
+
+def fork_workers(worker_count):
+    results = []
+    for _ in range(worker_count):
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            do_request_work()
+            with os.fdopen(write_fd, 'w') as pipe:
+                pipe.write(json.dumps(read_memory_kib()))
+            os._exit(0)
+
+        os.close(write_fd)
+        with os.fdopen(read_fd) as pipe:
+            results.append(json.loads(pipe.read()))
+        os.waitpid(pid, 0)
+    return results
+
+
+def report(label, results):
+    private = [result['Private_Clean'] + result['Private_Dirty'] for result in results]
+    print("{:<22} {:>10} {:>10} {:>16}".format(
+        label,
+        sum(result['Rss'] for result in results) // len(results),
+        sum(result['Pss'] for result in results) // len(results),
+        sum(private) // len(private),
+    ))
+
+
+if __name__ == '__main__':
+    arguments = docopt(__doc__)
+    worker_count = int(arguments['--workers'])
+
+    start = time.perf_counter()
+    from app import create_app, prefork_warm_up
+    imported = time.perf_counter()
+    application = create_app(arguments['--config'])
+    created = time.perf_counter()
+
+    print("import app:                 {:.3f}s".format(imported - start))
+    print("create_app (loads content): {:.3f}s".format(created - imported))
+    print()
+    print("{:<22} {:>10} {:>10} {:>16}".format("per worker (KiB)", "RSS", "PSS", "private (USS)"))
+
+    if application.config['DM_PREFORK_WARM_UP']:
+        print("(the {} config already warms up on create_app)".format(arguments['--config']))
+    else:
+        report("without warm-up", fork_workers(worker_count))
+
+        start = time.perf_counter()
+        prefork_warm_up(application)
+        warm_up_duration = time.perf_counter() - start
+
+    report("with warm-up", fork_workers(worker_count))
+
+    if not application.config['DM_PREFORK_WARM_UP']:
+        print()
+        print("prefork_warm_up:            {:.3f}s".format(warm_up_duration))
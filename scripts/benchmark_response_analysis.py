@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+"""Compare the time taken to work out which of a brief's responses are eligible, count them and sort them by the
+nice-to-have requirements they meet with a pass over the responses for each, against a single BriefResponses.
+
+The passes made for each are those made by the responses page (counting eligible responses), the download
+(sorting the responses, then checking each one's eligibility again as the CSV is written) and the award form (sorting
+by supplier name). Synthetic DOS1 style responses are generated up front.
+
+Usage:
+    scripts/benchmark_response_analysis.py [--responses=<n>] [--repeat=<n>]
+
+Options:
+    --responses=<n>  Number of synthetic brief responses [default: 5000]
+    --repeat=<n>     Number of times to analyse the responses [default: 20]
+"""
+import sys
+import timeit
+from collections import Counter
+
+from docopt import docopt
+
+sys.path.insert(0, '.')
+
+from app.main.helpers.response_analysis import BriefResponses  # noqa: E402
+
+ESSENTIAL_REQUIREMENTS = ["Essential {}".format(i) for i in range(5)]
+NICE_TO_HAVE_REQUIREMENTS = ["Nice to have {}".format(i) for i in range(5)]
+BRIEF = {
+    'id': 1234,
+    'essentialRequirements': ESSENTIAL_REQUIREMENTS,
+    'niceToHaveRequirements': NICE_TO_HAVE_REQUIREMENTS,
+}
+
+
+def synthetic_responses(response_count):
+    return [
+        {
+            'id': i,
+            'supplierName': "Supplier {}".format((i * 7919) % response_count),
+            'essentialRequirements': [(i >> bit) % 7 != 0 for bit in range(len(ESSENTIAL_REQUIREMENTS))],
+            'niceToHaveRequirements': [bool((i >> bit) & 1) for bit in range(len(NICE_TO_HAVE_REQUIREMENTS))],
+        }
+        for i in range(response_count)
+    ]
+
+
+def separate_passes(responses):
+    counter = Counter()
+    for response in responses:
+        counter[all(response['essentialRequirements'])] += 1
+    counts = {"failed": counter[False], "eligible": counter[True]}
+
+    by_nice_to_haves = sorted(
+        responses,
+        key=lambda k: len([nice for nice in k['niceToHaveRequirements'] if nice is True]),
+        reverse=True
+    )
+    eligible = [response for response in by_nice_to_haves if all(response['essentialRequirements'])]
+
+    by_supplier_name = sorted(
+        [{'id': b['id'], 'name': b['supplierName']} for b in responses],
+        key=lambda x: x['name']
+    )
+    return counts, by_nice_to_haves, eligible, [response['id'] for response in by_supplier_name]
+
+
+def single_pass(responses):
+    brief_responses = BriefResponses(BRIEF, responses)
+    return (
+        brief_responses.counts,
+        list(brief_responses),
+        brief_responses.eligible_responses,
+        [response['id'] for response in brief_responses.by_supplier_name],
+    )
+
+
+if __name__ == '__main__':
+    arguments = docopt(__doc__)
+    responses = synthetic_responses(int(arguments['--responses']))
+    repeat = int(arguments['--repeat'])
+
+    assert separate_passes(responses) == single_pass(responses)
+
+    separate_time = timeit.timeit(lambda: separate_passes(responses), number=repeat) / repeat
+    single_time = timeit.timeit(lambda: single_pass(responses), number=repeat) / repeat
+    print("{:>10} {:>18} {:>14} {:>9}".format("responses", "separate passes ms", "single pass ms", "speedup"))
+    print("{:>10} {:>18.2f} {:>14.2f} {:>8.1f}x".format(
+        len(responses), separate_time * 1e3, single_time * 1e3, separate_time / single_time,
+    ))
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""Compare the per-brief cost of working out the requirements task list's section statuses, and of looking up the
+framework's URLs, before and after the task list status engine.
+
+"Before" checks each section's `is_empty` and calls `count_unanswered_questions([section])` for it, and loads the
+framework's `urls` messages from disk. "After" uses `task_list_status` and the preloaded `framework_urls`. Both work
+from a summary of the brief that's built before timing starts, as the view builds it anyway.
+
+The brief used is the DOS brief fixture, with every other answer removed so there's a mix of answered and unanswered
+questions, for each lot of each framework with an `edit_brief` manifest.
+
+Run from the repository root once the frontend build has copied the frameworks content into app/content.
+
+Usage:
+    scripts/benchmark_task_list_status.py [--repeat=<n>]
+
+Options:
+    --repeat=<n>  Number of times to work out each brief's status [default: 2000]
+"""
+import json
+import sys
+import timeit
+
+from docopt import docopt
+
+sys.path.insert(0, '.')
+
+from app.main import _load_primary_content_loader  # noqa: E402
+from app.main.helpers.buyers_helpers import count_unanswered_questions  # noqa: E402
+from app.main.helpers.content import CopyOnWriteContentLoader  # noqa: E402
+from app.main.helpers.task_list import FRAMEWORK_URL_KEYS, framework_urls, task_list_status  # noqa: E402
+
+LOTS = ('digital-outcomes', 'digital-specialists', 'user-research-participants', 'user-research-studios')
+
+
+def draft_brief():
+    with open('tests/fixtures/dos_brief_fixture.json') as brief_fixture:
+        brief = json.load(brief_fixture)['briefs']
+    return {key: value for index, (key, value) in enumerate(sorted(brief.items())) if index % 2}
+
+
+def section_by_section_status(sections):
+    statuses = {}
+    for section in sections:
+        required, optional = count_unanswered_questions([section])
+        if section.is_empty:
+            if required > 0:
+                statuses[section.slug] = 'to_do'
+            elif optional > 0:
+                statuses[section.slug] = 'optional'
+        elif not section.is_empty:
+            statuses[section.slug] = 'in_progress' if required > 0 else 'done'
+    return statuses
+
+
+def load_urls(content_loader, framework_slug):
+    content_loader.load_messages(framework_slug, ['urls'])
+    return {key: content_loader.get_message(framework_slug, 'urls', key) for key in FRAMEWORK_URL_KEYS}
+
+
+if __name__ == '__main__':
+    arguments = docopt(__doc__)
+    repeat = int(arguments['--repeat'])
+
+    primary = _load_primary_content_loader()
+    content_loader = CopyOnWriteContentLoader(primary)
+    brief = draft_brief()
+
+    print("{:<36} {:<28} {:>12} {:>12} {:>9}".format("framework", "lot", "before µs", "after µs", "speedup"))
+    for framework_slug in sorted(primary._content):
+        for lot_slug in LOTS:
+            manifest = primary.get_manifest(framework_slug, 'edit_brief').filter({'lot': lot_slug})
+            if not manifest.sections:
+                continue
+            sections = manifest.summary(brief)
+            assert task_list_status(sections).sections == section_by_section_status(sections)
+            assert framework_urls.get(content_loader, framework_slug) == load_urls(content_loader, framework_slug)
+
+            before_time = timeit.timeit(
+                lambda: (section_by_section_status(sections), load_urls(content_loader, framework_slug)),
+                number=repeat,
+            )
+            after_time = timeit.timeit(
+                lambda: (task_list_status(sections), framework_urls.get(content_loader, framework_slug)),
+                number=repeat,
+            )
+            print("{:<36} {:<28} {:>12.1f} {:>12.1f} {:>8.1f}x".format(
+                framework_slug, lot_slug,
+                before_time / repeat * 1e6, after_time / repeat * 1e6, before_time / after_time,
+            ))
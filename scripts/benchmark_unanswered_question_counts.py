@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+"""Compare the per-brief cost of counting unanswered questions for the requirements dashboard by building a summary of
+the brief's `edit_brief` manifest against using a precompiled RequiredQuestionChecker.
+
+The brief used is the DOS brief fixture, with every other answer removed so there's a mix of answered and unanswered
+questions, for each lot of each framework with an `edit_brief` manifest. Manifests are filtered before timing starts,
+as the filtered manifest cache would have done for a warm process.
+
+Run from the repository root once the frontend build has copied the frameworks content into app/content.
+
+Usage:
+    scripts/benchmark_unanswered_question_counts.py [--repeat=<n>]
+
+Options:
+    --repeat=<n>  Number of times to count each brief [default: 2000]
+"""
+import json
+import sys
+import timeit
+
+from docopt import docopt
+
+sys.path.insert(0, '.')
+
+from app.main import _load_primary_content_loader  # noqa: E402
+from app.main.helpers.buyers_helpers import count_unanswered_questions  # noqa: E402
+from app.main.helpers.unanswered_questions import RequiredQuestionChecker  # noqa: E402
+
+LOTS = ('digital-outcomes', 'digital-specialists', 'user-research-participants', 'user-research-studios')
+
+
+def draft_brief():
+    with open('tests/fixtures/dos_brief_fixture.json') as brief_fixture:
+        brief = json.load(brief_fixture)['briefs']
+    return {key: value for index, (key, value) in enumerate(sorted(brief.items())) if index % 2}
+
+
+if __name__ == '__main__':
+    arguments = docopt(__doc__)
+    repeat = int(arguments['--repeat'])
+
+    primary = _load_primary_content_loader()
+    brief = draft_brief()
+
+    print("{:<36} {:<28} {:>14} {:>14} {:>9}".format("framework", "lot", "summary µs", "checker µs", "speedup"))
+    for framework_slug in sorted(primary._content):
+        for lot_slug in LOTS:
+            manifest = primary.get_manifest(framework_slug, 'edit_brief').filter({'lot': lot_slug})
+            if not manifest.sections:
+                continue
+            checker = RequiredQuestionChecker(manifest)
+            assert checker.count_unanswered(brief) == count_unanswered_questions(manifest.summary(brief))
+
+            summary_time = timeit.timeit(lambda: count_unanswered_questions(manifest.summary(brief)), number=repeat)
+            checker_time = timeit.timeit(lambda: checker.count_unanswered(brief), number=repeat)
+            print("{:<36} {:<28} {:>14.1f} {:>14.1f} {:>8.1f}x".format(
+                framework_slug, lot_slug,
+                summary_time / repeat * 1e6, checker_time / repeat * 1e6, summary_time / checker_time,
+            ))
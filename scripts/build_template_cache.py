@@ -0,0 +1,32 @@
+#!/usr/bin/env python
+"""Compile the app's page templates, and every template they use, into a Jinja bytecode cache directory.
+
+Run when the wsgi image is built (see docker-aws/Dockerfile.wsgi) so that the cache is shipped with the app (see
+DM_TEMPLATE_BYTECODE_CACHE_DIRECTORY). Cached templates are keyed by their paths, so this must be run from the directory
+the app will be run from. Any cached
+template made from a different source or by a different version of Python or Jinja is ignored by the app.
+
+Usage:
+    scripts/build_template_cache.py <directory> [--config=<name>]
+
+Options:
+    --config=<name>  App config to use when loading the templates [default: development]
+"""
+import sys
+
+from docopt import docopt
+
+sys.path.insert(0, '.')
+
+from app import create_app  # noqa: E402
+from app import template_cache  # noqa: E402
+
+
+if __name__ == '__main__':
+    arguments = docopt(__doc__)
+    application = create_app(arguments['--config'])
+    application.config['DM_TEMPLATE_BYTECODE_CACHE_DIRECTORY'] = arguments['<directory>']
+    template_cache.init_app(application)
+
+    template_names = template_cache.precompile_templates(application)
+    print("Compiled {} templates into {}".format(len(template_names), arguments['<directory>']))
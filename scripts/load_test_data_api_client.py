@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+"""Load test the app's data API client, with its pooled transport, against dmapiclient's own client by making the
+same API calls from many threads at once to a local stub of the API.
+
+The stub runs in its own process, answering every request with a small JSON document after the given latency, and
+counts the connections opened to it. The app's client is configured from the test config, with the given pool size.
+
+Usage:
+    scripts/load_test_data_api_client.py [--threads=<n>] [--calls=<n>] [--latency=<ms>] [--pool-size=<n>]
+
+Options:
+    --threads=<n>    Number of threads making API calls [default: 16]
+    --calls=<n>      Number of API calls made by each thread [default: 100]
+    --latency=<ms>   Time the stub API takes to answer each request [default: 5]
+    --pool-size=<n>  Connections kept open by the app's client [default: 16]
+"""
+import json
+import multiprocessing
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from docopt import docopt
+from flask import Flask
+
+sys.path.insert(0, '.')
+
+from dmapiclient import DataAPIClient  # noqa: E402
+
+from app.api_client import RequestMemoizingDataAPIClient  # noqa: E402
+from config import configs  # noqa: E402
+
+
+class StubAPIHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.connections.get_lock():
+            self.server.connections.value += 1
+
+    def do_GET(self):
+        time.sleep(self.server.latency)
+        body = json.dumps({'briefs': {'id': self.path.rsplit('/', 1)[-1]}}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def serve_stub_api(latency, connections, port):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubAPIHandler)
+    server.daemon_threads = True
+    server.request_queue_size = 128
+    server.latency = latency
+    server.connections = connections
+    port.value = server.server_address[1]
+    server.serve_forever()
+
+
+def start_stub_api(latency):
+    """Start the stub API in another process, returning the process, its port and its count of connections"""
+    connections = multiprocessing.Value('i', 0)
+    port = multiprocessing.Value('i', 0)
+    process = multiprocessing.Process(target=serve_stub_api, args=(latency, connections, port), daemon=True)
+    process.start()
+    while not port.value:
+        time.sleep(0.01)
+    return process, port.value, connections
+
+
+def run(client, connections, threads, calls):
+    with connections.get_lock():
+        connections.value = 0
+
+    def make_calls(thread_index):
+        durations = []
+        for call_index in range(calls):
+            start = time.perf_counter()
+            client.get_brief(thread_index * calls + call_index)
+            durations.append(time.perf_counter() - start)
+        return durations
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        durations = [duration for thread_durations in executor.map(make_calls, range(threads)) for duration in
+                     thread_durations]
+    elapsed = time.perf_counter() - start
+
+    durations.sort()
+    return {
+        'calls/s': len(durations) / elapsed,
+        'mean ms': statistics.mean(durations) * 1e3,
+        'median ms': statistics.median(durations) * 1e3,
+        '95th ms': durations[int(len(durations) * 0.95)] * 1e3,
+        'connections': connections.value,
+    }
+
+
+if __name__ == '__main__':
+    arguments = docopt(__doc__)
+    threads = int(arguments['--threads'])
+    calls = int(arguments['--calls'])
+
+    stub_process, port, connections = start_stub_api(int(arguments['--latency']) / 1e3)
+    api_url = 'http://127.0.0.1:{}'.format(port)
+
+    app = Flask(__name__)
+    app.config.from_object(configs['test'])
+    app.config['DM_DATA_API_URL'] = api_url
+    app.config['DM_DATA_API_POOL_SIZE'] = int(arguments['--pool-size'])
+    pooled_client = RequestMemoizingDataAPIClient()
+    pooled_client.init_app(app)
+
+    clients = (
+        ('dmapiclient', DataAPIClient(api_url, app.config['DM_DATA_API_AUTH_TOKEN'])),
+        ('pooled', pooled_client),
+    )
+
+    print("{} threads making {} calls each".format(threads, calls))
+    print("{:<14} {:>10} {:>10} {:>10} {:>10} {:>12}".format(
+        "client", "calls/s", "mean ms", "median ms", "95th ms", "connections",
+    ))
+    for name, client in clients:
+        results = run(client, connections, threads, calls)
+        print("{:<14} {:>10.0f} {:>10.1f} {:>10.1f} {:>10.1f} {:>12}".format(
+            name, results['calls/s'], results['mean ms'], results['median ms'], results['95th ms'],
+            results['connections'],
+        ))
+
+    stub_process.terminate()
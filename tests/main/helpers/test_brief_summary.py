@@ -0,0 +1,58 @@
+from flask import Flask
+
+from dmcontent.content_loader import ContentLoader
+
+from app.main.helpers.brief_summary import BriefSummary
+from app.main.helpers.buyers_helpers import count_unanswered_questions
+
+content_loader = ContentLoader('tests/fixtures/content')
+content_loader.load_manifest('dos', 'data', 'edit_brief')
+
+
+class TestBriefSummary(object):
+
+    def setup_method(self, method):
+        self.manifest = content_loader.get_manifest('dos', 'edit_brief').filter({'lot': 'digital-specialists'})
+        self.brief = {'id': 1234, 'updatedAt': '2016-03-29T10:11:13.000000Z', 'required1': True}
+
+    def test_sections_and_questions_match_the_manifest_summary(self):
+        summary = BriefSummary(self.manifest, self.brief)
+        expected = self.manifest.summary(self.brief)
+
+        assert [section.id for section in summary] == [section.id for section in expected]
+        for section_slug in ('section-1', 'section-5'):
+            assert summary.get_section(section_slug).id == section_slug
+            assert [question.id for question in summary.get_section(section_slug).questions] == [
+                question.id for question in expected.get_section(section_slug).questions
+            ]
+        for question_id in ('required1', 'optional2', 'required3', 'required3_2'):
+            question = summary.get_question(question_id)
+            assert question.id == question_id
+            assert question.value == expected.get_question(question_id).value
+            assert question.answer_required == expected.get_question(question_id).answer_required
+        assert summary.get_section('not-a-section') is None
+        assert summary.get_question('not-a-question') is None
+
+    def test_section_for_question(self):
+        summary = BriefSummary(self.manifest, self.brief)
+
+        assert summary.section_for_question('optional1').id == 'section-1'
+        assert summary.section_for_question('required3_1').id == 'section-5'
+        assert summary.section_for_question('not-a-question') is None
+
+    def test_unanswered_counts(self):
+        summary = BriefSummary(self.manifest, self.brief)
+
+        assert summary.unanswered_counts == count_unanswered_questions(self.manifest.summary(self.brief))
+        assert (summary.unanswered_required, summary.unanswered_optional) == summary.unanswered_counts
+
+    def test_summary_is_built_once_per_request(self):
+        app = Flask(__name__)
+
+        with app.test_request_context('/'):
+            summary = BriefSummary.for_request(self.manifest, self.brief)
+            assert BriefSummary.for_request(self.manifest, self.brief) is summary
+            assert BriefSummary.for_request(self.manifest, dict(self.brief, updatedAt='later')) is not summary
+
+        with app.test_request_context('/'):
+            assert BriefSummary.for_request(self.manifest, self.brief) is not summary
@@ -122,6 +122,45 @@ class TestBuyersHelpers(object):
         assert helpers.buyers_helpers.brief_is_withdrawn(BriefStub(status='withdrawn').response()) is True
         assert helpers.buyers_helpers.brief_is_withdrawn(BriefStub(status='live').response()) is False
 
+    def _load_brief_context_data_api_client(self, framework_status='live', brief_status='draft'):
+        data_api_client = mock.Mock()
+        data_api_client.get_framework.return_value = FrameworkStub(
+            slug='digital-outcomes-and-specialists-4',
+            status=framework_status,
+            lots=[LotStub(slug='digital-specialists', allows_brief=True).response()],
+        ).single_result_response()
+        data_api_client.get_brief.return_value = BriefStub(
+            framework_slug='digital-outcomes-and-specialists-4', user_id=123, status=brief_status,
+        ).single_result_response()
+        return data_api_client
+
+    def test_load_brief_context(self):
+        data_api_client = self._load_brief_context_data_api_client()
+
+        framework, lot, brief = helpers.buyers_helpers.load_brief_context(
+            'digital-outcomes-and-specialists-4', 'digital-specialists', 1234, data_api_client, 123,
+        )
+
+        assert framework['slug'] == 'digital-outcomes-and-specialists-4'
+        assert lot['slug'] == 'digital-specialists'
+        assert brief['id'] == 1234
+        assert data_api_client.get_brief.call_args_list == [mock.call(1234)]
+
+    @pytest.mark.parametrize('kwargs, user_id, framework_status, brief_status', (
+        ({}, 124, 'live', 'draft'),
+        ({}, 123, 'open', 'draft'),
+        ({'allowed_framework_statuses': ['live']}, 123, 'expired', 'draft'),
+        ({'allowed_brief_statuses': ['live']}, 123, 'live', 'draft'),
+        ({'must_be_editable': True}, 123, 'live', 'live'),
+    ))
+    def test_load_brief_context_404s(self, kwargs, user_id, framework_status, brief_status):
+        data_api_client = self._load_brief_context_data_api_client(framework_status, brief_status)
+
+        with pytest.raises(NotFound):
+            helpers.buyers_helpers.load_brief_context(
+                'digital-outcomes-and-specialists-4', 'digital-specialists', 1234, data_api_client, user_id, **kwargs
+            )
+
     def test_section_has_at_least_one_required_question(self):
         content = content_loader.get_manifest('dos', 'edit_brief').filter(
             {'lot': 'digital-specialists'}
@@ -171,6 +210,22 @@ class TestBuyersHelpers(object):
             'unanswered_optional': 2
         }]
 
+    @pytest.mark.parametrize('page_number, expected_briefs, expected_number', (
+        (1, [1, 2], 1),
+        (2, [3, 4], 2),
+        (3, [5], 3),
+        (4, [5], 3),
+        (0, [1, 2], 1),
+        (-1, [1, 2], 1),
+    ))
+    def test_paginate_briefs(self, page_number, expected_briefs, expected_number):
+        page = helpers.buyers_helpers.paginate_briefs([1, 2, 3, 4, 5], page_number, 2)
+
+        assert page == helpers.buyers_helpers.BriefsPage(expected_briefs, expected_number, 3, 5)
+
+    def test_paginate_briefs_with_no_briefs(self):
+        assert helpers.buyers_helpers.paginate_briefs([], 1, 2) == helpers.buyers_helpers.BriefsPage([], 1, 1, 0)
+
     def test_get_sorted_responses_for_brief(self):
         data_api_client = mock.Mock()
         data_api_client.find_brief_responses.return_value = {
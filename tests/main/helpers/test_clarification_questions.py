@@ -0,0 +1,57 @@
+from dmcontent.html import text_to_html
+
+from app.main.helpers.clarification_questions import (
+    RENDERED_TEXT_CACHE_SIZE,
+    clarification_question_rows,
+    clarification_text_to_html,
+    numbered_clarification_questions,
+)
+
+
+class TestClarificationTextToHtml(object):
+
+    def setup_method(self, method):
+        clarification_text_to_html.cache_clear()
+
+    def test_same_as_text_to_html(self):
+        text = "See https://www.gov.uk\r\nfor <details>"
+
+        assert clarification_text_to_html(text) == text_to_html(text, format_links=True, preserve_line_breaks=True)
+
+    def test_converted_text_is_memoized_by_content(self):
+        first = clarification_text_to_html("How long is the contract?")
+
+        assert clarification_text_to_html("How long is the " + "contract?") is first
+        assert clarification_text_to_html.cache_info().hits == 1
+
+    def test_least_recently_used_text_is_dropped_when_full(self):
+        for number in range(RENDERED_TEXT_CACHE_SIZE + 1):
+            clarification_text_to_html("Question {}".format(number))
+
+        assert clarification_text_to_html.cache_info().currsize == RENDERED_TEXT_CACHE_SIZE
+        clarification_text_to_html("Question {}".format(RENDERED_TEXT_CACHE_SIZE))
+        clarification_text_to_html("Question 0")
+        assert clarification_text_to_html.cache_info().hits == 1
+
+
+class TestClarificationQuestions(object):
+
+    questions = [
+        {"question": "Why?", "answer": "Because https://www.gov.uk", "publishedAt": "2016-03-29T10:11:13.000000Z"},
+        {"question": "Who?", "answer": "Us", "publishedAt": "2016-03-29T10:11:14.000000Z"},
+    ]
+
+    def test_numbered_clarification_questions_are_copies(self):
+        numbered = numbered_clarification_questions(self.questions)
+
+        assert [question['number'] for question in numbered] == [1, 2]
+        assert numbered[0]['question'] == "Why?"
+        assert 'number' not in self.questions[0]
+
+    def test_clarification_question_rows(self):
+        rows = clarification_question_rows(self.questions)
+
+        assert rows[1]['key'] == {'html': "2. Who?"}
+        assert rows[1]['value'] == {'html': "Us"}
+        assert rows[0]['value']['html'] == clarification_text_to_html("Because https://www.gov.uk")
+        assert rows[0]['number'] == 1
@@ -0,0 +1,162 @@
+import shutil
+
+import pytest
+
+from dmcontent.content_loader import ContentLoader
+from dmcontent.errors import ContentNotFoundError
+
+from app.main.helpers.content import CopyOnWriteContentLoader, FilteredManifestCache
+
+
+class TestCopyOnWriteContentLoader(object):
+
+    def setup_method(self, method):
+        self.primary = ContentLoader('tests/fixtures/content')
+        self.primary.load_manifest('dos', 'data', 'edit_brief')
+
+    def _content_with_messages(self, tmp_path):
+        content_path = tmp_path / 'content'
+        shutil.copytree('tests/fixtures/content', content_path)
+        (content_path / 'frameworks' / 'dos' / 'messages').mkdir()
+        (content_path / 'frameworks' / 'dos' / 'messages' / 'urls.yml').write_text(
+            'call_off_contract_url: https://example.com/call-off-contract\n'
+        )
+        return str(content_path)
+
+    def test_manifests_match_primary(self):
+        content_loader = CopyOnWriteContentLoader(self.primary)
+
+        copied = content_loader.get_manifest('dos', 'edit_brief').filter({'lot': 'digital-specialists'})
+        original = self.primary.get_manifest('dos', 'edit_brief').filter({'lot': 'digital-specialists'})
+
+        assert [section.slug for section in copied] == [section.slug for section in original]
+        assert [q.id for s in copied for q in s.questions] == [q.id for s in original for q in s.questions]
+
+    def test_manifest_data_is_shared_not_copied(self):
+        content_loader = CopyOnWriteContentLoader(self.primary)
+
+        assert content_loader._content['dos']['edit_brief'] is self.primary._content['dos']['edit_brief']
+
+    def test_missing_manifest_raises(self):
+        with pytest.raises(ContentNotFoundError):
+            CopyOnWriteContentLoader(self.primary).get_manifest('dos', 'not_a_manifest')
+
+    def test_loading_a_manifest_does_not_modify_primary(self):
+        content_loader = CopyOnWriteContentLoader(self.primary)
+        content_loader.load_manifest('dos', 'data', 'edit_brief_fail')
+
+        assert content_loader.get_manifest('dos', 'edit_brief_fail')
+        assert 'edit_brief_fail' not in self.primary._content['dos']
+        with pytest.raises(ContentNotFoundError):
+            CopyOnWriteContentLoader(self.primary).get_manifest('dos', 'edit_brief_fail')
+
+    def test_loading_messages_does_not_modify_primary_or_other_loaders(self, tmp_path):
+        primary = ContentLoader(self._content_with_messages(tmp_path))
+        first, second = CopyOnWriteContentLoader(primary), CopyOnWriteContentLoader(primary)
+
+        first.load_messages('dos', ['urls'])
+
+        assert first.get_message('dos', 'urls', 'call_off_contract_url') == 'https://example.com/call-off-contract'
+        assert 'urls' not in primary._messages['dos']
+        with pytest.raises(ContentNotFoundError):
+            second.get_message('dos', 'urls', 'call_off_contract_url')
+
+    def test_messages_loaded_by_primary_are_shared(self, tmp_path):
+        primary = ContentLoader(self._content_with_messages(tmp_path))
+        primary.load_messages('dos', ['urls'])
+
+        content_loader = CopyOnWriteContentLoader(primary)
+
+        assert content_loader.get_message('dos', 'urls', 'call_off_contract_url') == (
+            'https://example.com/call-off-contract'
+        )
+
+
+class TestFilteredManifestCache(object):
+
+    def setup_method(self, method):
+        self.primary = ContentLoader('tests/fixtures/content')
+        self.primary.load_manifest('dos', 'data', 'edit_brief')
+        self.filtered_manifest_cache = FilteredManifestCache()
+        self.content_loader = CopyOnWriteContentLoader(self.primary, self.filtered_manifest_cache)
+
+    def test_manifest_filtered_by_lot_is_reused(self):
+        first = self.content_loader.get_manifest('dos', 'edit_brief').filter({'lot': 'digital-specialists'})
+        second = self.content_loader.get_manifest('dos', 'edit_brief').filter({'lot': 'digital-specialists'})
+
+        assert first is second
+
+    def test_cache_is_shared_between_content_loaders(self):
+        other_content_loader = CopyOnWriteContentLoader(self.primary, self.filtered_manifest_cache)
+
+        assert (
+            self.content_loader.get_manifest('dos', 'edit_brief').filter({'lot': 'digital-specialists'})
+            is other_content_loader.get_manifest('dos', 'edit_brief').filter({'lot': 'digital-specialists'})
+        )
+
+    def test_cached_manifest_matches_uncached(self):
+        cached = self.content_loader.get_manifest('dos', 'edit_brief').filter({'lot': 'digital-specialists'})
+        uncached = self.primary.get_manifest('dos', 'edit_brief').filter({'lot': 'digital-specialists'})
+
+        assert [section.slug for section in cached] == [section.slug for section in uncached]
+        assert [(q.id, q.number) for s in cached for q in s.questions] == (
+            [(q.id, q.number) for s in uncached for q in s.questions]
+        )
+
+    @pytest.mark.parametrize('first_args, second_args', (
+        (({'lot': 'digital-specialists'},), ({'lot': 'digital-outcomes'},)),
+        (({'lot': 'digital-specialists'},), ({'lot': 'digital-specialists'}, False)),
+    ))
+    def test_different_lots_or_dynamic_are_cached_separately(self, first_args, second_args):
+        first = self.content_loader.get_manifest('dos', 'edit_brief').filter(*first_args)
+        second = self.content_loader.get_manifest('dos', 'edit_brief').filter(*second_args)
+
+        assert first is not second
+        assert len(self.filtered_manifest_cache) == 2
+
+    @pytest.mark.parametrize('context, kwargs', (
+        ({'lot': 'digital-specialists', 'essentialRequirements': ['Python']}, {}),
+        ({'lot': 'digital-specialists'}, {'inplace_allowed': True}),
+    ))
+    def test_other_filters_are_not_cached(self, context, kwargs):
+        first = self.content_loader.get_manifest('dos', 'edit_brief').filter(context, **kwargs)
+        second = self.content_loader.get_manifest('dos', 'edit_brief').filter(context, **kwargs)
+
+        assert first is not second
+        assert len(self.filtered_manifest_cache) == 0
+
+    def test_summary_of_cached_manifest_is_a_new_manifest(self):
+        cached = self.content_loader.get_manifest('dos', 'edit_brief').filter({'lot': 'digital-specialists'})
+
+        summary = cached.summary({'title': 'A brief'})
+
+        assert summary is not cached
+        assert self.content_loader.get_manifest('dos', 'edit_brief').filter({'lot': 'digital-specialists'}) is cached
+
+    def test_least_recently_used_entry_is_evicted(self):
+        self.filtered_manifest_cache.maxsize = 2
+        manifest = self.content_loader.get_manifest('dos', 'edit_brief')
+        specialists = manifest.filter({'lot': 'digital-specialists'})
+        manifest.filter({'lot': 'digital-outcomes'})
+        manifest.filter({'lot': 'digital-specialists'})
+        manifest.filter({'lot': 'user-research-participants'})
+
+        assert len(self.filtered_manifest_cache) == 2
+        assert manifest.filter({'lot': 'digital-specialists'}) is specialists
+        assert manifest.filter({'lot': 'digital-outcomes'}) is not specialists
+        assert len(self.filtered_manifest_cache) == 2
+
+    def test_manifests_loaded_by_a_thread_are_not_cached(self):
+        self.content_loader.load_manifest('dos', 'data', 'edit_brief_fail')
+
+        self.content_loader.get_manifest('dos', 'edit_brief_fail').filter({'lot': 'digital-specialists'})
+
+        assert len(self.filtered_manifest_cache) == 0
+
+    def test_no_cache_by_default(self):
+        content_loader = CopyOnWriteContentLoader(self.primary)
+
+        assert (
+            content_loader.get_manifest('dos', 'edit_brief').filter({'lot': 'digital-specialists'})
+            is not content_loader.get_manifest('dos', 'edit_brief').filter({'lot': 'digital-specialists'})
+        )
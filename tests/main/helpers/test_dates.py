@@ -0,0 +1,66 @@
+from datetime import datetime
+
+import pytest
+from dmutils.formats import DATETIME_FORMAT, dateformat, utcdatetimeformat
+
+from app.main.helpers.dates import get_publishing_dates, parse_datetime, parsing_timestamps
+
+
+class TestParseDatetime(object):
+
+    @pytest.mark.parametrize('value', [
+        "2016-11-29T11:48:06.123456Z",
+        "2020-02-29T00:00:00.000000Z",
+        "1999-12-31T23:59:59.999999Z",
+        "2016-11-29T11:48:06.1Z",
+    ])
+    def test_same_as_strptime(self, value):
+        assert parse_datetime(value) == datetime.strptime(value, DATETIME_FORMAT)
+
+    @pytest.mark.parametrize('value', [
+        "2016-11-29",
+        "2016-11-29 11:48:06.123456Z",
+        "2016-13-29T11:48:06.123456Z",
+        "2019-02-29T11:48:06.123456Z",
+        "2016-11-29T11:48:+6.123456Z",
+        "2016-11-29T11:48:06.123456",
+    ])
+    def test_raises_value_error_like_strptime(self, value):
+        with pytest.raises(ValueError):
+            datetime.strptime(value, DATETIME_FORMAT)
+        with pytest.raises(ValueError):
+            parse_datetime(value)
+
+    def test_parsed_timestamps_are_memoized(self):
+        parse_datetime.cache_clear()
+
+        first = parse_datetime("2016-11-29T11:48:06.123456Z")
+
+        assert parse_datetime("2016-11-29T11:48:06.123456Z") is first
+        assert parse_datetime.cache_info().hits == 1
+
+
+class TestGetPublishingDates(object):
+
+    def test_same_dates_as_dmutils(self):
+        from dmutils.dates import get_publishing_dates as dmutils_get_publishing_dates
+        brief = {'publishedAt': "2016-11-29T11:48:06.123456Z", 'requirementsLength': '2 weeks'}
+
+        assert get_publishing_dates(brief) == dmutils_get_publishing_dates(brief)
+        assert brief['publishedAt'] == "2016-11-29T11:48:06.123456Z"
+
+
+class TestParsingTimestamps(object):
+
+    @pytest.mark.parametrize('date_filter', [dateformat, utcdatetimeformat])
+    def test_filter_output_is_unchanged(self, date_filter):
+        wrapped = parsing_timestamps(date_filter)
+
+        assert wrapped.__name__ == date_filter.__name__
+        assert wrapped("2016-11-29T11:48:06.123456Z") == date_filter("2016-11-29T11:48:06.123456Z")
+        assert wrapped(datetime(2016, 11, 29, 11, 48)) == date_filter(datetime(2016, 11, 29, 11, 48))
+        assert wrapped(None, default_value="Never") == "Never"
+
+    def test_unparseable_values_are_left_to_the_filter(self):
+        with pytest.raises(ValueError):
+            parsing_timestamps(dateformat)("29 November")
@@ -0,0 +1,113 @@
+import mock
+import pytest
+
+from dmtestutils.api_model_stubs import FrameworkStub, LotStub
+
+from app.main.helpers.framework_cache import FrameworkCache
+
+
+class SynchronousThread(object):
+    def __init__(self, target, args, **kwargs):
+        self.target, self.args = target, args
+
+    def start(self):
+        self.target(*self.args)
+
+
+class TestFrameworkCache(object):
+
+    def setup_method(self, method):
+        self.now = 1000.0
+        self.framework_cache = FrameworkCache(ttl=60, stale_ttl=30, clock=lambda: self.now)
+        self.data_api_client = mock.Mock()
+        self.data_api_client.get_framework.side_effect = lambda slug: FrameworkStub(
+            slug=slug,
+            lots=[LotStub(slug='digital-specialists').response(), LotStub(slug='digital-outcomes').response()],
+        ).single_result_response()
+
+    def test_framework_is_fetched_once_within_ttl(self):
+        first = self.framework_cache.get('digital-outcomes-and-specialists-4', self.data_api_client)
+        self.now += 59
+        second = self.framework_cache.get('digital-outcomes-and-specialists-4', self.data_api_client)
+
+        assert first is second
+        assert self.data_api_client.get_framework.call_args_list == [mock.call('digital-outcomes-and-specialists-4')]
+
+    def test_lots_are_indexed_by_slug(self):
+        framework, lots_by_slug = self.framework_cache.get('digital-outcomes-and-specialists-4', self.data_api_client)
+
+        assert framework['slug'] == 'digital-outcomes-and-specialists-4'
+        assert sorted(lots_by_slug) == ['digital-outcomes', 'digital-specialists']
+        assert lots_by_slug['digital-outcomes'] is framework['lots'][1]
+
+    def test_frameworks_are_cached_by_slug(self):
+        self.framework_cache.get('digital-outcomes-and-specialists-4', self.data_api_client)
+        self.framework_cache.get('digital-outcomes-and-specialists-5', self.data_api_client)
+
+        assert self.data_api_client.get_framework.call_count == 2
+
+    @mock.patch('app.main.helpers.framework_cache.threading.Thread', SynchronousThread)
+    def test_stale_framework_is_served_while_refreshing(self):
+        first = self.framework_cache.get('digital-outcomes-and-specialists-4', self.data_api_client)
+        self.now += 70
+
+        assert self.framework_cache.get('digital-outcomes-and-specialists-4', self.data_api_client) is first
+        assert self.data_api_client.get_framework.call_count == 2
+        assert self.framework_cache.get('digital-outcomes-and-specialists-4', self.data_api_client) is not first
+        assert self.data_api_client.get_framework.call_count == 2
+
+    @mock.patch('app.main.helpers.framework_cache.threading.Thread', SynchronousThread)
+    def test_failed_refresh_keeps_serving_stale_framework(self):
+        first = self.framework_cache.get('digital-outcomes-and-specialists-4', self.data_api_client)
+        self.now += 70
+        self.data_api_client.get_framework.side_effect = Exception("API is down")
+
+        assert self.framework_cache.get('digital-outcomes-and-specialists-4', self.data_api_client) is first
+        assert self.framework_cache.get('digital-outcomes-and-specialists-4', self.data_api_client) is first
+
+    def test_expired_framework_is_fetched_synchronously(self):
+        first = self.framework_cache.get('digital-outcomes-and-specialists-4', self.data_api_client)
+        self.now += 90
+
+        assert self.framework_cache.get('digital-outcomes-and-specialists-4', self.data_api_client) is not first
+        assert self.data_api_client.get_framework.call_count == 2
+
+    @pytest.mark.parametrize('invalidated_slug', ('digital-outcomes-and-specialists-4', None))
+    def test_invalidate(self, invalidated_slug):
+        self.framework_cache.get('digital-outcomes-and-specialists-4', self.data_api_client)
+        self.framework_cache.invalidate(invalidated_slug)
+        self.framework_cache.get('digital-outcomes-and-specialists-4', self.data_api_client)
+
+        assert self.data_api_client.get_framework.call_count == 2
+
+    @pytest.mark.parametrize('invalidated_slug', ('digital-outcomes-and-specialists-4', None))
+    def test_invalidation_is_seen_by_caches_sharing_a_directory(self, tmpdir, invalidated_slug):
+        other_process_cache = FrameworkCache(ttl=60, stale_ttl=30, invalidation_directory=str(tmpdir))
+        self.framework_cache.invalidation_directory = str(tmpdir)
+        first = self.framework_cache.get('digital-outcomes-and-specialists-4', self.data_api_client)
+        other = self.framework_cache.get('digital-outcomes-and-specialists-5', self.data_api_client)
+
+        other_process_cache.invalidate(invalidated_slug)
+
+        assert self.framework_cache.get('digital-outcomes-and-specialists-4', self.data_api_client) is not first
+        assert self.data_api_client.get_framework.call_count == 3
+        # the newly fetched copy is served until the next invalidation
+        self.framework_cache.get('digital-outcomes-and-specialists-4', self.data_api_client)
+        assert self.data_api_client.get_framework.call_count == 3
+        # other frameworks are only fetched again if they were invalidated too
+        assert (
+            self.framework_cache.get('digital-outcomes-and-specialists-5', self.data_api_client) is other
+        ) == (invalidated_slug is not None)
+
+    def test_invalidation_of_an_unknown_slug_is_not_stamped(self, tmpdir):
+        self.framework_cache.invalidation_directory = str(tmpdir)
+        self.framework_cache.invalidate('../../etc/passwd')
+
+        assert tmpdir.listdir() == []
+
+    def test_zero_ttl_disables_cache(self):
+        self.framework_cache.ttl = 0
+        self.framework_cache.get('digital-outcomes-and-specialists-4', self.data_api_client)
+        self.framework_cache.get('digital-outcomes-and-specialists-4', self.data_api_client)
+
+        assert self.data_api_client.get_framework.call_count == 2
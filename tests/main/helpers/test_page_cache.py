@@ -0,0 +1,120 @@
+import mock
+import pytest
+from flask import Flask, flash
+
+from app.main.helpers.page_cache import RenderedPageCache, brief_page_key, conditional_response, page_key
+
+
+class TestRenderedPageCache(object):
+
+    def setup_method(self, method):
+        self.page_cache = RenderedPageCache('page', 'DM_PAGE_CACHE_SIZE', maxsize=2)
+        self.render = mock.Mock(side_effect=lambda: "page {}".format(self.render.call_count))
+
+    def test_key_depends_on_every_part(self):
+        key = page_key('1.0', 1234, '2016-03-29T10:11:13.000000Z')
+
+        assert key == page_key('1.0', 1234, '2016-03-29T10:11:13.000000Z')
+        assert key != page_key('1.0', 1234, '2016-03-29T10:11:14.000000Z')
+        assert key != page_key('1.0', 1235, '2016-03-29T10:11:13.000000Z')
+
+    def test_page_is_rendered_once_for_each_key(self):
+        assert self.page_cache.get_or_render('a', self.render) == "page 1"
+        assert self.page_cache.get_or_render('a', self.render) == "page 1"
+        assert self.page_cache.get_or_render('b', self.render) == "page 2"
+        assert self.render.call_count == 2
+
+    def test_least_recently_used_page_is_dropped_when_full(self):
+        for key in ('a', 'b', 'a', 'c', 'a', 'b'):
+            self.page_cache.get_or_render(key, self.render)
+
+        assert self.render.call_count == 4
+
+    def test_size_of_zero_disables_cache(self):
+        app = Flask(__name__)
+        app.config['DM_PAGE_CACHE_SIZE'] = 0
+        self.page_cache.init_app(app)
+
+        self.page_cache.get_or_render('a', self.render)
+        self.page_cache.get_or_render('a', self.render)
+
+        assert self.render.call_count == 2
+
+    def test_response_is_not_modified_if_the_browser_has_the_page(self):
+        app = Flask(__name__)
+
+        with app.test_request_context('/', headers={'If-None-Match': '"a"'}):
+            not_modified = self.page_cache.response('a', self.render, headers={'X-Frame-Options': 'sameorigin'})
+            modified = self.page_cache.response('b', self.render)
+
+        assert not_modified.status_code == 304
+        assert not_modified.headers['ETag'] == '"a"'
+        assert not_modified.headers['X-Frame-Options'] == 'sameorigin'
+        assert modified.status_code == 200
+        assert modified.get_data(as_text=True) == "page 1"
+        assert modified.headers['ETag'] == '"b"'
+        assert modified.headers['Cache-Control'] in ('private, no-cache', 'no-cache, private')
+
+
+class TestConditionalResponse(object):
+
+    def setup_method(self, method):
+        self.app = Flask(__name__)
+        self.app.secret_key = 'secret'
+        self.render = mock.Mock(return_value="page")
+
+    def test_page_is_rendered_with_an_etag(self):
+        with self.app.test_request_context('/'):
+            response = conditional_response('page', 'a', self.render, headers={'X-Frame-Options': 'sameorigin'})
+
+        assert response.status_code == 200
+        assert response.get_data(as_text=True) == "page"
+        assert response.headers['ETag'] == '"a"'
+        assert response.headers['X-Frame-Options'] == 'sameorigin'
+        assert response.cache_control.private and response.cache_control.no_cache
+
+    def test_page_is_not_rendered_if_the_browser_has_it(self):
+        with self.app.test_request_context('/', headers={'If-None-Match': '"b", "a"'}):
+            response = conditional_response('page', 'a', self.render)
+
+        assert response.status_code == 304
+        assert response.headers['ETag'] == '"a"'
+        assert self.render.called is False
+
+    def test_page_with_flashed_messages_is_always_rendered_without_an_etag(self):
+        with self.app.test_request_context('/', headers={'If-None-Match': '"a"'}):
+            flash("Done")
+            response = conditional_response('page', 'a', self.render)
+
+        assert response.status_code == 200
+        assert 'ETag' not in response.headers
+        assert self.render.call_count == 1
+
+
+class TestBriefPageKey(object):
+
+    def setup_method(self, method):
+        self.app = Flask(__name__)
+        self.app.config['VERSION'] = '1.0'
+        self.brief = {'id': 1234, 'status': 'live', 'updatedAt': '2016-03-29T10:11:13.000000Z'}
+
+    def key(self, url='/brief', user_id=123, brief=None, *parts):
+        with self.app.test_request_context(url), mock.patch('app.main.helpers.page_cache.current_user') as user:
+            user.id = user_id
+            return brief_page_key(brief or self.brief, *parts)
+
+    def test_key_is_the_same_for_the_same_page(self):
+        assert self.key() == self.key()
+
+    @pytest.mark.parametrize('kwargs', (
+        {'url': '/brief?confirm_remove=1'},
+        {'url': '/other-brief-page'},
+        {'user_id': 124},
+        {'brief': {'id': 1234, 'status': 'closed', 'updatedAt': '2016-03-29T10:11:13.000000Z'}},
+        {'brief': {'id': 1234, 'status': 'live', 'updatedAt': '2016-03-30T10:11:13.000000Z'}},
+    ))
+    def test_key_differs_for_other_pages_users_and_brief_changes(self, kwargs):
+        assert self.key(**kwargs) != self.key()
+
+    def test_key_covers_extra_parts(self):
+        assert self.key('/brief', 123, None, 5) != self.key('/brief', 123, None, 6)
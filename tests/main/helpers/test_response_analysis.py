@@ -0,0 +1,74 @@
+from app.main.helpers.response_analysis import BriefResponses, iter_eligible_responses
+
+
+class TestBriefResponses(object):
+
+    brief = {"id": 1, "niceToHaveRequirements": ["Nice", "to", "have"]}
+
+    def test_responses_are_sorted_by_nice_to_haves_met_keeping_order_of_ties(self):
+        responses = BriefResponses(self.brief, [
+            {"id": 1, "essentialRequirements": [True], "niceToHaveRequirements": [False, True, False]},
+            {"id": 2, "essentialRequirements": [True], "niceToHaveRequirements": [True, True, True]},
+            {"id": 3, "essentialRequirements": [False], "niceToHaveRequirements": [True, False, False]},
+            {"id": 4, "essentialRequirements": [True], "niceToHaveRequirements": [False, False, False]},
+        ])
+
+        assert [response["id"] for response in responses] == [2, 1, 3, 4]
+        assert responses.nice_to_have_counts == [3, 1, 1, 0]
+        assert responses.eligibility == [True, True, False, True]
+
+    def test_responses_keep_their_order_if_brief_has_no_nice_to_haves(self):
+        responses = BriefResponses({"id": 1, "niceToHaveRequirements": []}, [{"id": 2}, {"id": 1}, {"id": 3}])
+
+        assert responses == [{"id": 2}, {"id": 1}, {"id": 3}]
+        assert responses.nice_to_have_counts == [0, 0, 0]
+
+    def test_evidence_answers_are_not_counted_as_nice_to_haves_met(self):
+        responses = BriefResponses(self.brief, [
+            {"id": 1, "niceToHaveRequirements": [{"yesNo": False}]},
+            {"id": 2, "niceToHaveRequirements": [{"yesNo": True, "evidence": "Yes"}]},
+        ])
+
+        assert [response["id"] for response in responses] == [1, 2]
+        assert responses.eligibility == [True, True]
+
+    def test_counts_and_eligible_responses(self):
+        responses = BriefResponses(self.brief, [
+            {"id": 1, "essentialRequirements": [True, False], "niceToHaveRequirements": [True, True, True]},
+            {"id": 2, "essentialRequirements": [True, True], "niceToHaveRequirements": [False, False, True]},
+            {"id": 3, "essentialRequirements": [True, True], "niceToHaveRequirements": [False, True, True]},
+        ])
+
+        assert [response["id"] for response in responses.eligible_responses] == [3, 2]
+        assert responses.counts == {"eligible": 2, "failed": 1}
+
+    def test_by_supplier_name(self):
+        responses = BriefResponses(self.brief, [
+            {"id": 1, "supplierName": "Kev's Pies", "niceToHaveRequirements": [True, True, True]},
+            {"id": 2, "supplierName": "Kev's Butties", "niceToHaveRequirements": [False, False, False]},
+        ])
+
+        assert [response["id"] for response in responses.by_supplier_name] == [2, 1]
+
+
+class TestIterEligibleResponses(object):
+
+    def test_eligible_responses_of_brief_responses(self):
+        responses = BriefResponses({"id": 1}, [
+            {"id": 1, "essentialRequirements": [True, False]},
+            {"id": 2, "essentialRequirements": [True, True]},
+        ])
+
+        assert list(iter_eligible_responses(responses)) == [{"id": 2, "essentialRequirements": [True, True]}]
+
+    def test_eligible_responses_of_any_iterable_are_found_as_they_are_needed(self):
+        responses = iter([
+            {"id": 1, "essentialRequirements": [True, False]},
+            {"id": 2, "essentialRequirements": [True, True]},
+            {"id": 3, "essentialRequirements": [True]},
+        ])
+
+        eligible = iter_eligible_responses(responses)
+
+        assert next(eligible)["id"] == 2
+        assert next(responses)["id"] == 3
@@ -0,0 +1,151 @@
+import os
+import threading
+import time
+
+import pytest
+
+from app.main.helpers.response_exports import ExportArtifactStore, ResponseExports
+
+
+class TestExportArtifactStore(object):
+
+    def test_key_depends_on_every_part(self):
+        key = ExportArtifactStore.key_for('1.0', 1234, '2020-01-01T00:00:00.000000Z')
+
+        assert key == ExportArtifactStore.key_for('1.0', 1234, '2020-01-01T00:00:00.000000Z')
+        assert key != ExportArtifactStore.key_for('1.1', 1234, '2020-01-01T00:00:00.000000Z')
+        assert key != ExportArtifactStore.key_for('1.0', 1235, '2020-01-01T00:00:00.000000Z')
+        assert key != ExportArtifactStore.key_for('1.0', 1234, '2020-01-02T00:00:00.000000Z')
+
+    def test_stored_file_is_found_by_key_and_extension(self, tmpdir):
+        store = ExportArtifactStore(str(tmpdir))
+
+        assert store.get('abc', 'ods') is None
+        path = store.put('abc', 'ods', lambda file: file.write(b'spreadsheet'))
+
+        assert store.get('abc', 'ods') == path
+        assert store.get('abc', 'csv') is None
+        with open(path, 'rb') as stored_file:
+            assert stored_file.read() == b'spreadsheet'
+        # nothing left behind from writing the file
+        assert os.listdir(str(tmpdir)) == ['abc.ods']
+
+    def test_temporary_directory_is_made_when_the_first_file_is_stored(self):
+        store = ExportArtifactStore()
+
+        assert store.get('abc', 'ods') is None
+        path = store.put('abc', 'ods', lambda file: file.write(b'spreadsheet'))
+
+        assert os.path.dirname(path) == store.directory
+        assert store.get('abc', 'ods') == path
+
+    def test_files_older_than_max_age_are_not_served_and_deleted_when_another_is_stored(self, tmpdir):
+        store = ExportArtifactStore(str(tmpdir), max_age=60)
+        old_path = store.put('abc', 'ods', lambda file: file.write(b'spreadsheet'))
+        an_hour_ago = time.time() - 60 * 60
+        os.utime(old_path, (an_hour_ago, an_hour_ago))
+        # left behind by a build which never finished
+        tmpdir.join('.def.part').write('half a spreadsheet')
+        os.utime(str(tmpdir.join('.def.part')), (an_hour_ago, an_hour_ago))
+
+        assert store.get('abc', 'ods') is None
+
+        new_path = store.put('def', 'csv', lambda file: file.write(b'csv'))
+
+        assert store.get('def', 'csv') == new_path
+        assert os.listdir(str(tmpdir)) == ['def.csv']
+
+    def test_files_are_kept_forever_with_no_max_age(self, tmpdir):
+        store = ExportArtifactStore(str(tmpdir))
+        old_path = store.put('abc', 'ods', lambda file: file.write(b'spreadsheet'))
+        os.utime(old_path, (0, 0))
+
+        store.put('def', 'csv', lambda file: file.write(b'csv'))
+
+        assert store.get('abc', 'ods') == old_path
+
+
+class TestResponseExports(object):
+
+    def setup_method(self, method):
+        self.response_exports = ResponseExports(max_workers=2, wait=5)
+
+    def teardown_method(self, method):
+        self.response_exports.shutdown()
+
+    def test_file_is_built_in_the_background_and_stored(self, tmpdir):
+        self.response_exports.store = ExportArtifactStore(str(tmpdir))
+        built_by = []
+
+        def build(file):
+            built_by.append(threading.current_thread().name)
+            file.write(b'spreadsheet')
+
+        job = self.response_exports.submit('abc', 'ods', build)
+
+        assert self.response_exports.wait_for(job)
+        assert job.result() == (str(tmpdir.join('abc.ods')), 'ods')
+        assert self.response_exports.find('abc', ['csv', 'ods']) == job.result()
+        assert built_by[0].startswith('response-export')
+        # finished jobs are forgotten as their files are in the store
+        assert self.response_exports.get_job('abc') is None
+
+    def test_file_being_built_is_not_queued_again(self):
+        release = threading.Event()
+        builds = []
+
+        def build(file):
+            builds.append(True)
+            release.wait(5)
+            file.write(b'spreadsheet')
+
+        job = self.response_exports.submit('abc', 'ods', build)
+
+        assert self.response_exports.submit('abc', 'ods', build) is job
+        assert self.response_exports.get_job('abc') is job
+        assert self.response_exports.job_status(job) == ResponseExports.PENDING
+
+        release.set()
+        assert self.response_exports.wait_for(job)
+        assert builds == [True]
+        assert self.response_exports.job_status(job) == ResponseExports.READY
+
+    def test_wait_for_gives_up_after_wait_seconds(self):
+        release = threading.Event()
+        self.response_exports.wait = 0.01
+
+        job = self.response_exports.submit('abc', 'ods', lambda file: release.wait(5) and file.write(b'spreadsheet'))
+
+        assert not self.response_exports.wait_for(job)
+        release.set()
+
+    def test_failed_build_is_reported_and_retried_when_resubmitted(self):
+        def fail(file):
+            raise ValueError('broken')
+
+        job = self.response_exports.submit('abc', 'ods', fail)
+        self.response_exports.wait_for(job)
+
+        with pytest.raises(ValueError):
+            job.result()
+        assert self.response_exports.get_job('abc') is job
+        assert self.response_exports.job_status(job) == ResponseExports.FAILED
+        assert self.response_exports.find('abc', ['ods']) is None
+
+        retry = self.response_exports.submit('abc', 'ods', lambda file: file.write(b'spreadsheet'))
+
+        assert retry is not job
+        assert self.response_exports.wait_for(retry)
+        assert self.response_exports.find('abc', ['ods']) == retry.result()
+
+    def test_no_workers_builds_in_this_thread(self):
+        self.response_exports.max_workers = 0
+
+        def build(file):
+            file.write(threading.current_thread().name.encode('utf-8'))
+
+        job = self.response_exports.submit('abc', 'ods', build)
+
+        assert job.done()
+        with open(job.result()[0], 'rb') as stored_file:
+            assert stored_file.read() == threading.current_thread().name.encode('utf-8')
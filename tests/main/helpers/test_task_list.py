@@ -0,0 +1,100 @@
+import itertools
+
+import mock
+import pytest
+
+from dmcontent.content_loader import ContentLoader
+from dmcontent.errors import ContentNotFoundError
+
+from app.main.helpers.buyers_helpers import count_unanswered_questions
+from app.main.helpers.task_list import FrameworkUrls, TaskListStatus, task_list_status
+
+content_loader = ContentLoader('tests/fixtures/content')
+content_loader.load_manifest('dos', 'data', 'edit_brief')
+
+
+def _section_by_section_status(sections):
+    """The task list status as `view_brief_overview` used to work it out"""
+    statuses = {}
+    previewable = publishable = True
+    for section in sections:
+        required, optional = count_unanswered_questions([section])
+        if section.is_empty:
+            if required > 0:
+                statuses[section.slug] = 'to_do'
+                previewable = publishable = False
+            elif optional > 0:
+                statuses[section.slug] = 'optional'
+        else:
+            if required > 0:
+                statuses[section.slug] = 'in_progress'
+                previewable = publishable = False
+            else:
+                statuses[section.slug] = 'done'
+
+    return TaskListStatus(statuses, previewable, publishable)
+
+
+class TestTaskListStatus(object):
+
+    @pytest.mark.parametrize('lot', ('digital-specialists', 'digital-outcomes', 'user-research-participants'))
+    def test_same_status_as_checking_each_section(self, lot):
+        manifest = content_loader.get_manifest('dos', 'edit_brief').filter({'lot': lot})
+        answers = ('', None, 'An answer')
+        question_ids = ('required1', 'required2', 'required3_1', 'required3_2', 'optional1', 'optional2')
+
+        for brief_answers in itertools.product(answers, repeat=len(question_ids)):
+            sections = manifest.summary(dict(zip(question_ids, brief_answers)))
+            assert task_list_status(sections) == _section_by_section_status(sections), brief_answers
+
+    def test_statuses(self):
+        manifest = content_loader.get_manifest('dos', 'edit_brief').filter({'lot': 'digital-specialists'})
+        status = task_list_status(manifest.summary({'required1': 'An answer', 'required3_1': 'An answer'}))
+
+        assert status == TaskListStatus(
+            {'section-1': 'done', 'section-2': 'to_do', 'section-4': 'optional', 'section-5': 'in_progress'},
+            previewable=False,
+            publishable=False,
+        )
+
+    def test_brief_can_be_previewed_and_published_once_required_questions_are_answered(self):
+        manifest = content_loader.get_manifest('dos', 'edit_brief').filter({'lot': 'digital-specialists'})
+        brief = {'required1': 'An answer', 'required2': 'An answer', 'required3_1': 'One', 'required3_2': 'Two'}
+
+        status = task_list_status(manifest.summary(brief))
+
+        assert status.sections['section-4'] == 'optional'
+        assert status.previewable and status.publishable
+
+
+class TestFrameworkUrls(object):
+
+    def setup_method(self, method):
+        self.content_loader = mock.Mock()
+        self.content_loader.get_message.side_effect = lambda framework_slug, block, key: f"{framework_slug} {key}"
+        self.framework_urls = FrameworkUrls()
+
+    def test_preloaded_urls_are_used_without_the_content_loader(self):
+        self.framework_urls.preload(self.content_loader, ['dos'])
+        other_content_loader = mock.Mock()
+
+        assert self.framework_urls.get(other_content_loader, 'dos') == {
+            'call_off_contract_url': 'dos call_off_contract_url',
+            'framework_agreement_url': 'dos framework_agreement_url',
+        }
+        assert other_content_loader.mock_calls == []
+
+    def test_urls_of_other_frameworks_are_loaded_when_needed(self):
+        self.framework_urls.preload(self.content_loader, ['dos'])
+
+        assert self.framework_urls.get(self.content_loader, 'g9')['call_off_contract_url'] == 'g9 call_off_contract_url'
+        self.content_loader.load_messages.assert_called_once_with('g9', ['urls'])
+
+    def test_frameworks_without_urls_are_not_preloaded(self):
+        self.content_loader.get_message.side_effect = ContentNotFoundError
+
+        self.framework_urls.preload(self.content_loader, ['dos'])
+
+        with pytest.raises(ContentNotFoundError):
+            self.framework_urls.get(self.content_loader, 'dos')
+        self.content_loader.load_messages.assert_called_once_with('dos', ['urls'])
@@ -0,0 +1,159 @@
+import itertools
+import json
+import random
+
+import pytest
+
+from dmcontent.content_loader import ContentLoader, ContentManifest
+
+from app.main.helpers.buyers_helpers import count_unanswered_questions
+from app.main.helpers.unanswered_questions import RequiredQuestionChecker
+
+content_loader = ContentLoader('tests/fixtures/content')
+content_loader.load_manifest('dos', 'data', 'edit_brief')
+content_loader.load_manifest('g9', 'data', 'manifest')
+
+# a manifest using every kind of question the summary pages know about, to compare against beyond what the fixtures
+# content covers
+EVERY_QUESTION_TYPE_SECTIONS = [
+    {
+        'slug': 'section-1',
+        'name': 'Section 1',
+        'questions': [
+            {'id': 'text', 'type': 'text', 'question': 'Text'},
+            {'id': 'optionalText', 'type': 'text', 'question': 'Optional text', 'optional': True},
+            {'id': 'textarea', 'type': 'textbox_large', 'question': 'Textarea'},
+            {'id': 'boolean', 'type': 'boolean', 'question': 'Boolean'},
+            {
+                'id': 'radios', 'type': 'radios', 'question': 'Radios',
+                'options': [{'label': 'Yes please', 'value': 'yes'}, {'label': '', 'value': 'blank'}],
+            },
+            {'id': 'number', 'type': 'number', 'question': 'Number', 'unit': '%', 'unit_position': 'after'},
+            {'id': 'numberWithoutUnit', 'type': 'number', 'question': 'Number without unit'},
+            {'id': 'assured', 'type': 'text', 'question': 'Assured', 'assuranceApproach': '2answers-type1'},
+        ],
+    },
+    {
+        'slug': 'section-2',
+        'name': 'Section 2',
+        'questions': [
+            {
+                'id': 'checkboxes', 'type': 'checkboxes', 'question': 'Checkboxes',
+                'options': [{'label': 'One', 'value': 'one'}, {'label': 'Two'}],
+            },
+            {'id': 'list', 'type': 'list', 'question': 'List', 'optional': True},
+            {'id': 'beforeSummary', 'type': 'list', 'question': 'List', 'before_summary_value': ['Always']},
+            {'id': 'booleanList', 'type': 'boolean_list', 'question': 'Boolean list'},
+            {'id': 'date', 'type': 'date', 'question': 'Date'},
+            {
+                'id': 'tree', 'type': 'checkbox_tree', 'question': 'Tree',
+                'options': [{'label': 'Parent', 'options': [{'label': 'Child', 'value': 'child'}]}],
+            },
+            {
+                'id': 'pricing', 'type': 'pricing', 'question': 'Pricing',
+                'fields': {'minimum_price': 'priceMin', 'maximum_price': 'priceMax'},
+            },
+        ],
+    },
+    {
+        'slug': 'section-3',
+        'name': 'Section 3',
+        'questions': [
+            {
+                'id': 'multi', 'type': 'multiquestion', 'question': 'Multiquestion',
+                'questions': [
+                    {'id': 'multiText', 'type': 'text', 'question': 'Multi text'},
+                    {'id': 'multiOptional', 'type': 'text', 'question': 'Multi optional', 'optional': True},
+                ],
+            },
+            {
+                'id': 'optionalMulti', 'type': 'multiquestion', 'question': 'Optional multiquestion', 'optional': True,
+                'questions': [{'id': 'optionalMultiText', 'type': 'text', 'question': 'Optional multi text'}],
+            },
+            {
+                'id': 'followups', 'type': 'multiquestion', 'question': 'Followups',
+                'questions': [
+                    {
+                        'id': 'hasFollowup', 'type': 'boolean', 'question': 'Has followup',
+                        'followup': {'followupText': [True]},
+                    },
+                    {'id': 'followupText', 'type': 'text', 'question': 'Followup text'},
+                ],
+            },
+        ],
+    },
+]
+
+VALUES = {
+    'text': ('', None, 'Some text'),
+    'optionalText': ('', 'Some text'),
+    'textarea': ('', 'Lots of text'),
+    'boolean': (None, True, False),
+    'radios': (None, 'yes', 'blank', 'no'),
+    'number': ('', None, 0, 12),
+    'numberWithoutUnit': ('', None, 0),
+    'assured': ({}, {'value': ''}, {'value': 'Assured text', 'assurance': 'Service provider assertion'}),
+    'checkboxes': ([], None, ['one'], ['two']),
+    'list': ([], ['Item']),
+    'beforeSummary': ([], ['Item']),
+    'booleanList': ([], [True, False]),
+    'date': ('', '2019-01-31', 'ASAP'),
+    'tree': ([], ['child'], ['Parent'], ['unknown']),
+    'priceMin': (None, '', '100'),
+    'priceMax': (None, '200'),
+    'multiText': ('', 'Multi text'),
+    'multiOptional': ('', 'Multi optional'),
+    'optionalMultiText': ('', 'Optional multi text'),
+    'hasFollowup': (None, True, False),
+    'followupText': ('', 'Followed up'),
+}
+
+
+def _random_briefs(count, seed=1234):
+    rng = random.Random(seed)
+    for _ in range(count):
+        # leave some answers out of the brief entirely
+        yield {key: rng.choice(values) for key, values in VALUES.items() if rng.random() > 0.2}
+
+
+def _assert_same_counts(manifest, brief):
+    assert RequiredQuestionChecker(manifest).count_unanswered(brief) == (
+        count_unanswered_questions(manifest.summary(brief))
+    ), brief
+
+
+class TestRequiredQuestionChecker(object):
+
+    @pytest.mark.parametrize('lot', ('digital-specialists', 'digital-outcomes', 'user-research-participants'))
+    def test_same_counts_as_summary_for_fixtures_content(self, lot):
+        manifest = content_loader.get_manifest('dos', 'edit_brief').filter({'lot': lot})
+        answers = ('', None, 'An answer')
+        question_ids = ('required1', 'required2', 'required3_1', 'required3_2', 'optional1', 'optional2')
+
+        for brief_answers in itertools.product(answers, repeat=len(question_ids)):
+            _assert_same_counts(manifest, dict(zip(question_ids, brief_answers)))
+
+    def test_same_counts_as_summary_for_dos_brief_fixture(self):
+        with open('tests/fixtures/dos_brief_fixture.json') as brief_fixture:
+            brief = json.load(brief_fixture)['briefs']
+
+        _assert_same_counts(content_loader.get_manifest('dos', 'edit_brief').filter({'lot': brief['lotSlug']}), brief)
+
+    @pytest.mark.parametrize('brief', ({}, {'checkboxTreeExample': ['Option 2.1']}, {'checkboxTreeExample': ['x']}))
+    def test_same_counts_as_summary_for_checkbox_tree(self, brief):
+        _assert_same_counts(content_loader.get_manifest('g9', 'manifest').filter({'lot': 'cloud-software'}), brief)
+
+    @pytest.mark.parametrize('dynamic', (True, False))
+    def test_same_counts_as_summary_for_every_question_type(self, dynamic):
+        manifest = ContentManifest(EVERY_QUESTION_TYPE_SECTIONS).filter({}, dynamic=dynamic)
+
+        for brief in _random_briefs(500):
+            _assert_same_counts(manifest, brief)
+
+    def test_checker_is_compiled_once_per_manifest(self):
+        manifest = content_loader.get_manifest('dos', 'edit_brief').filter({'lot': 'digital-specialists'})
+
+        assert RequiredQuestionChecker.for_manifest(manifest) is RequiredQuestionChecker.for_manifest(manifest)
+        assert RequiredQuestionChecker.for_manifest(manifest) is not RequiredQuestionChecker.for_manifest(
+            content_loader.get_manifest('dos', 'edit_brief').filter({'lot': 'digital-specialists'})
+        )
@@ -345,6 +345,68 @@ class TestPreviewBrief(BaseApplicationTest):
                               "digital-specialists/1234/preview-source")
         assert res.headers['X-Frame-Options'] == 'sameorigin'
 
+    PREVIEW_SOURCE_URL = (
+        "/buyers/frameworks/digital-outcomes-and-specialists-4/requirements/digital-specialists/1234/preview-source"
+    )
+
+    @mock.patch('app.main.views.create_a_brief.publish.render_template', autospec=True)
+    def test_preview_source_page_is_only_rendered_once_for_each_revision_of_the_brief(self, render_template):
+        render_template.side_effect = lambda template_name, **kwargs: "{} preview".format(kwargs['brief']['title'])
+        brief_json = self._setup_brief()
+        self.data_api_client.get_brief.return_value = brief_json
+
+        first = self.client.get(self.PREVIEW_SOURCE_URL)
+        second = self.client.get(self.PREVIEW_SOURCE_URL)
+
+        assert first.status_code == second.status_code == 200
+        assert first.get_data(as_text=True) == second.get_data(as_text=True) == "I need a thing to do a thing preview"
+        assert first.headers['ETag'] == second.headers['ETag']
+        assert render_template.call_count == 1
+
+        brief_json['briefs']['updatedAt'] = "2016-03-30T10:11:12.000000Z"
+        third = self.client.get(self.PREVIEW_SOURCE_URL)
+
+        assert third.headers['ETag'] != first.headers['ETag']
+        assert render_template.call_count == 2
+
+    @mock.patch('app.main.views.create_a_brief.publish.render_template', autospec=True)
+    def test_preview_source_page_is_not_sent_again_if_the_browser_has_it(self, render_template):
+        render_template.return_value = "preview"
+        self.data_api_client.get_brief.return_value = self._setup_brief()
+
+        etag = self.client.get(self.PREVIEW_SOURCE_URL).headers['ETag']
+        res = self.client.get(self.PREVIEW_SOURCE_URL, headers={'If-None-Match': etag})
+
+        assert res.status_code == 304
+        assert res.get_data() == b''
+        assert res.headers['ETag'] == etag
+        assert res.headers['X-Frame-Options'] == 'sameorigin'
+        assert 'no-cache' in res.headers['Cache-Control']
+
+    @mock.patch('app.main.views.create_a_brief.publish.render_template', autospec=True)
+    def test_preview_source_page_changes_each_day(self, render_template):
+        render_template.return_value = "preview"
+        self.data_api_client.get_brief.return_value = self._setup_brief()
+
+        with freeze_time('2019-01-01 23:59:59'):
+            etag = self.client.get(self.PREVIEW_SOURCE_URL).headers['ETag']
+        with freeze_time('2019-01-02 00:00:00'):
+            res = self.client.get(self.PREVIEW_SOURCE_URL, headers={'If-None-Match': etag})
+
+        assert res.status_code == 200
+        assert render_template.call_count == 2
+
+    @mock.patch('app.main.views.create_a_brief.publish.render_template', autospec=True)
+    def test_preview_source_page_is_not_sent_for_brief_belonging_to_another_user(self, render_template):
+        render_template.return_value = "preview"
+        self.data_api_client.get_brief.return_value = self._setup_brief()
+        etag = self.client.get(self.PREVIEW_SOURCE_URL).headers['ETag']
+
+        self.data_api_client.get_brief.return_value = self._setup_brief(user_id=234)
+        res = self.client.get(self.PREVIEW_SOURCE_URL, headers={'If-None-Match': etag})
+
+        assert res.status_code == 404
+
 
 class TestPublishBrief(BaseApplicationTest):
 
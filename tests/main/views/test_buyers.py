@@ -221,6 +221,36 @@ class TestBuyerDashboard(BaseApplicationTest):
         assert "View responses" not in unsuccessful_row_cells[2]
         assert "Let suppliers know the outcome" not in unsuccessful_row_cells[2]
 
+    def test_lists_are_paginated(self):
+        self.app.config['DM_REQUIREMENTS_PAGE_SIZE'] = 2
+
+        res = self.client.get(self.briefs_dashboard_url + "?closed_page=2")
+
+        assert res.status_code == 200
+        document = html.fromstring(res.get_data(as_text=True))
+        tables = document.xpath('//table')
+        closed_titles = [row.xpath('.//td')[0].text_content().strip() for row in tables[2].xpath('.//tbody/tr')]
+
+        assert closed_titles == ["An awarded brief", "A closed brief with no brief responses"]
+        assert document.xpath('//nav[@aria-label="Closed requirements pages"]//a/@href') == [
+            self.briefs_dashboard_url,
+            self.briefs_dashboard_url + "?closed_page=3",
+        ]
+
+    def test_unanswered_questions_are_only_counted_for_the_page_of_drafts_shown(self):
+        self.app.config['DM_REQUIREMENTS_PAGE_SIZE'] = 1
+        briefs = find_briefs_mock()
+        briefs['briefs'].append(dict(briefs['briefs'][0], id=28, createdAt="2016-02-02T00:00:00.000000Z"))
+        self.data_api_client.find_briefs.return_value = briefs
+
+        with mock.patch.object(
+            buyers, 'add_unanswered_counts_to_briefs', wraps=buyers.add_unanswered_counts_to_briefs,
+        ) as add_unanswered_counts_to_briefs:
+            res = self.client.get(self.briefs_dashboard_url + "?draft_page=2")
+
+        assert res.status_code == 200
+        assert [brief['id'] for brief in add_unanswered_counts_to_briefs.call_args[0][0]] == [20]
+
 
 class TestBuyerRoleRequired(BaseApplicationTest):
 
@@ -350,6 +380,32 @@ class AbstractViewBriefResponsesPage(BaseApplicationTest):
         assert "1 supplier" in page
         assert "responded to your requirements and meets all your essential skills and experience." in page
 
+    def test_page_is_not_modified_when_reloaded_with_its_etag(self):
+        url = f"/buyers/frameworks/{self.framework_slug}/requirements/digital-outcomes/1234/responses"
+        self.login_as_buyer()
+        res = self.client.get(url)
+        assert res.status_code == 200
+        assert 'private' in res.headers['Cache-Control']
+
+        with mock.patch('app.main.views.buyers.render_template') as render_template:
+            res = self.client.get(url, headers={'If-None-Match': res.headers['ETag']})
+
+        assert res.status_code == 304
+        assert render_template.called is False
+
+    def test_page_etag_changes_when_there_are_more_responses(self):
+        url = f"/buyers/frameworks/{self.framework_slug}/requirements/digital-outcomes/1234/responses"
+        self.login_as_buyer()
+        etag = self.client.get(url).headers['ETag']
+
+        self.data_api_client.find_brief_responses.return_value = {
+            "briefResponses": [self.brief_responses["briefResponses"][0]]
+        }
+        res = self.client.get(url, headers={'If-None-Match': etag})
+
+        assert res.status_code == 200
+        assert res.headers['ETag'] != etag
+
     def test_404_if_brief_does_not_belong_to_buyer(self):
         self.data_api_client.get_brief.return_value = BriefStub(
             framework_slug=self.framework_slug,
@@ -648,3 +704,8 @@ class TestBuyerAccountOverview(BaseApplicationTest):
         )) == (not all_projects)
 
         assert self.data_api_client.find_direct_award_projects.called is True
+        # all of the user's projects are only looked up if they have none awaiting outcomes
+        assert self.data_api_client.find_direct_award_projects.call_args_list == [
+            mock.call(123, having_outcome=False, locked=True),
+        ] + ([mock.call(123)] if not projects_awaiting_outcomes else [])
+        assert self.data_api_client.find_briefs.call_args_list == [mock.call(123)]
@@ -6,12 +6,13 @@ from dmcontent.content_loader import ContentLoader
 from dmcontent.questions import Question
 from dmtestutils.api_model_stubs import BriefStub, FrameworkStub, LotStub
 import mock
-from lxml import etree
+from lxml import etree, html
 import pytest
 
 from zipfile import ZipFile
 from io import BytesIO
 
+from app.main.helpers import buyers_helpers
 from app.main.views import download_responses
 from dmapiclient import DataAPIClient
 import functools
@@ -145,6 +146,95 @@ class TestDownloadBriefResponsesView(BaseApplicationTest):
 
             self._check_xml_files_in_zip_are_well_formed(res.data)
 
+    def _set_up_closed_brief(self):
+        self.data_api_client.find_brief_responses.return_value = {'briefResponses': self.responses}
+        self.data_api_client.get_framework.return_value = FrameworkStub(
+            framework_slug='digital-outcomes-and-specialists-4',
+            status='live',
+            lots=[
+                LotStub(slug='digital-specialists', allows_brief=True).response(),
+            ]
+        ).single_result_response()
+        self.data_api_client.get_brief.return_value = {'briefs': self.brief}
+
+    def test_file_is_only_built_once(self):
+        self._set_up_closed_brief()
+
+        with mock.patch.object(download_responses, 'data_api_client', self.data_api_client):
+            self.login_as_buyer()
+            first = self.client.get(
+                "/buyers/frameworks/digital-outcomes-and-specialists-4"
+                "/requirements/digital-specialists/1234/responses/download"
+            )
+            second = self.client.get(
+                "/buyers/frameworks/digital-outcomes-and-specialists-4"
+                "/requirements/digital-specialists/1234/responses/download"
+            )
+
+        assert first.status_code == second.status_code == 200
+        assert first.data == second.data
+        assert second.headers['Content-Disposition'] == 'attachment;filename=supplier-responses-{}.ods'.format(
+            inflection.parameterize(str(self.brief['title']))
+        )
+        assert self.data_api_client.find_brief_responses.call_count == 1
+
+    def test_browser_is_asked_to_come_back_if_file_is_not_built_in_time(self):
+        self._set_up_closed_brief()
+
+        with mock.patch.object(download_responses, 'data_api_client', self.data_api_client),\
+                mock.patch.object(download_responses.response_exports, 'wait_for', return_value=False):
+            self.login_as_buyer()
+            res = self.client.get(
+                "/buyers/frameworks/digital-outcomes-and-specialists-4"
+                "/requirements/digital-specialists/1234/responses/download"
+            )
+
+        assert res.status_code == 202
+        assert res.headers['Retry-After'] == '5'
+        document = html.fromstring(res.get_data(as_text=True))
+        assert document.xpath('normalize-space(//h1)') == 'Your file is being prepared'
+        assert document.xpath('//meta[@http-equiv="refresh"]/@content') == ['5']
+        download_url = (
+            "/buyers/frameworks/digital-outcomes-and-specialists-4"
+            "/requirements/digital-specialists/1234/responses/download"
+        )
+        assert document.xpath('//a[normalize-space()="try downloading the responses again"]/@href') == [download_url]
+        assert document.xpath('//@data-download-status-url') == [download_url + '/status']
+
+    def test_status_reports_file_is_ready(self):
+        self._set_up_closed_brief()
+
+        with mock.patch.object(download_responses, 'data_api_client', self.data_api_client):
+            self.login_as_buyer()
+            res = self.client.get(
+                "/buyers/frameworks/digital-outcomes-and-specialists-4"
+                "/requirements/digital-specialists/1234/responses/download/status"
+            )
+
+        assert res.status_code == 200
+        assert res.json == {
+            'status': 'ready',
+            'downloadUrl': "/buyers/frameworks/digital-outcomes-and-specialists-4"
+                           "/requirements/digital-specialists/1234/responses/download",
+        }
+
+    def test_status_does_not_retry_a_failed_file(self):
+        self._set_up_closed_brief()
+        status_url = (
+            "/buyers/frameworks/digital-outcomes-and-specialists-4"
+            "/requirements/digital-specialists/1234/responses/download/status"
+        )
+
+        with mock.patch.object(download_responses, 'data_api_client', self.data_api_client),\
+                po(download_responses.DownloadBriefResponsesView, 'render_file',
+                   side_effect=ValueError('broken')) as render_file:
+            self.login_as_buyer()
+            first = self.client.get(status_url)
+            second = self.client.get(status_url)
+
+        assert first.json['status'] == second.json['status'] == 'failed'
+        assert render_file.call_count == 1
+
     def _check_xml_files_in_zip_are_well_formed(self, raw_bytes):
         with BytesIO(raw_bytes) as buffer, ZipFile(buffer) as ods_as_zip:
             xml_files = (f for f in ods_as_zip.namelist() if f.endswith('.xml'))
@@ -239,8 +329,8 @@ class TestDownloadBriefResponsesView(BaseApplicationTest):
 
         self.instance.data_api_client.get_brief.return_value = brief
 
-        with po(download_responses, 'get_framework_and_lot'),\
-                po(download_responses, 'is_brief_correct') as is_brief_correct,\
+        with po(buyers_helpers, 'get_framework_and_lot', return_value=(mock.Mock(), mock.Mock())),\
+                po(buyers_helpers, 'is_brief_correct') as is_brief_correct,\
                 mock.patch.object(download_responses, 'current_user') as current_user:
 
             result = self.instance.get_file_context(**kwargs)
@@ -248,7 +338,8 @@ class TestDownloadBriefResponsesView(BaseApplicationTest):
         is_brief_correct.assert_called_once_with(brief['briefs'],
                                                  kwargs['framework_slug'],
                                                  kwargs['lot_slug'],
-                                                 current_user.id)
+                                                 current_user.id,
+                                                 allowed_statuses=download_responses.CLOSED_PUBLISHED_BRIEF_STATUSES)
 
         self.instance.data_api_client.get_brief\
             .assert_called_once_with(kwargs['brief_id'])
@@ -274,8 +365,8 @@ class TestDownloadBriefResponsesView(BaseApplicationTest):
 
         self.instance.data_api_client.get_brief.return_value = brief
 
-        with po(download_responses, 'get_framework_and_lot'),\
-                po(download_responses, 'is_brief_correct') as is_brief_correct,\
+        with po(buyers_helpers, 'get_framework_and_lot', return_value=(mock.Mock(), mock.Mock())),\
+                po(buyers_helpers, 'is_brief_correct') as is_brief_correct,\
                 mock.patch.object(download_responses, 'current_user'):
 
             is_brief_correct.return_value = False
@@ -287,25 +378,46 @@ class TestDownloadBriefResponsesView(BaseApplicationTest):
 
         brief = BriefStub(
             framework_slug="digital-outcomes-and-specialists-4",
+            user_id=123,
             status="live",
         ).single_result_response()
 
         kwargs = {
             'brief_id': mock.Mock(),
-            'framework_slug': mock.Mock(),
-            'lot_slug': mock.Mock()
+            'framework_slug': "digital-outcomes-and-specialists-4",
+            'lot_slug': "digital-specialists",
         }
 
         self.instance.data_api_client.get_brief.return_value = brief
 
-        with po(download_responses, 'get_framework_and_lot'),\
-                po(download_responses, 'is_brief_correct') as is_brief_correct,\
-                mock.patch.object(download_responses, 'current_user'):
+        with po(buyers_helpers, 'get_framework_and_lot', return_value=(mock.Mock(), mock.Mock())),\
+                mock.patch.object(download_responses, 'current_user') as current_user:
 
-            is_brief_correct.return_value = True
+            current_user.id = 123
             with pytest.raises(NotFound):
                 self.instance.get_file_context(**kwargs)
 
+    def test_generate_csv_rows_only_reads_responses_as_rows_are_needed(self):
+        read = []
+
+        def responses():
+            for name in ("Kev's Butties", "Kev's Pies"):
+                read.append(name)
+                yield {"supplierName": name, "essentialRequirements": [True], "niceToHaveRequirements": [True, False]}
+
+        self.instance.get_questions = mock.Mock(return_value=[
+            Question({'id': 'supplierName', 'name': 'Supplier', 'type': 'text'}),
+            Question({'id': 'niceToHaveRequirements', 'name': 'Nice-to-haves', 'type': 'boolean_list'}),
+        ])
+
+        rows = self.instance.generate_csv_rows({'brief': self.brief, 'responses': responses()})
+
+        assert next(rows) == ['Supplier', 'Able to bake', 'Able to perform the tea ceremony']
+        assert read == []
+        assert next(rows) == ["Kev's Butties", True, False]
+        assert read == ["Kev's Butties"]
+        assert list(rows) == [["Kev's Pies", True, False]]
+
     def test_populate_styled_ods_with_data(self):
         questions = [
             {'id': 'supplierName', 'name': 'Supplier', 'type': 'text'},
@@ -419,6 +531,38 @@ class TestDownloadBriefResponsesView(BaseApplicationTest):
             for j, response in enumerate(self.responses):
                 assert sheet.read_cell(j + 2, k) == response['essentialRequirements'][l].get('evidence', '')
 
+    def test_populate_styled_ods_with_data_writes_each_row_in_full(self):
+        questions = [
+            {'id': 'supplierName', 'name': 'Supplier', 'type': 'text'},
+            {'id': 'blah', 'name': 'Blah Blah', 'type': 'boolean_list'},
+            {'id': 'essentialRequirements', 'name': 'Essential skills & evidence', 'type': 'dynamic_list'},
+        ]
+
+        self.instance.get_questions = mock.Mock(return_value=[
+            Question(question) for question in questions
+        ])
+
+        doc = self.instance.populate_styled_ods_with_data(self.instance.create_blank_ods_with_styles(),
+                                                          {'brief': self.brief, 'responses': self.responses})
+
+        sheet = doc.sheet("Supplier evidence")
+
+        assert [sheet.get_row(name)._row for name in (
+            "header", "supplierName", "blah[0]", "blah[1]",
+            "essentialRequirements[0]", "essentialRequirements[1]", "essentialRequirements[2]",
+        )] == [element for element in sheet._table.childNodes if element.qname[1] == 'table-row']
+        # the response columns follow the rows in the document
+        assert [element.qname[1] for element in sheet._table.childNodes] == (
+            ['table-column'] * 2 + ['table-row'] * 7 + ['table-column'] * len(self.responses)
+        )
+        assert [sheet.read_cell(x, 3) for x in range(4)] == ['', 'Negative', 'false', 'true']
+        assert [sheet.read_cell(x, 6) for x in range(4)] == [
+            '',
+            'Knowledgable about tea',
+            'Here is a bad character >\u001e<',
+            'Have visited the Flagstaff House Museum of Tea Ware in Hong Kong',
+        ]
+
 
 @mock.patch("app.main.views.download_responses.data_api_client", autospec=True)
 class TestDownloadBriefResponsesCsv(BaseApplicationTest):
@@ -134,7 +134,7 @@ class TestAwardBrief(BaseApplicationTest):
         res = self.client.get(self.url.format(brief_id=1234))
         assert res.status_code == 404
 
-    @mock.patch('app.main.views.outcome.is_brief_correct')
+    @mock.patch('app.main.helpers.buyers_helpers.is_brief_correct')
     def test_award_brief_get_returns_404_if_brief_not_correct(self, is_brief_correct):
         is_brief_correct.return_value = False
 
@@ -305,7 +305,7 @@ class TestAwardBriefDetails(BaseApplicationTest):
         self.assert_flashes(expected_message, expected_category)
         self.assert_flashes_with_dm_alert(expected_message, expected_category)
 
-    @mock.patch('app.main.views.outcome.is_brief_correct')
+    @mock.patch('app.main.helpers.buyers_helpers.is_brief_correct')
     def test_award_brief_details_raises_400_if_brief_not_correct(self, is_brief_correct):
         is_brief_correct.return_value = False
         self.login_as_buyer()
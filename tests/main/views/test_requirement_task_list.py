@@ -86,6 +86,20 @@ class BaseRequirementsTaskListPageTest:
         for tag in tags:
             assert tag.text in allowed_tags
 
+    def test_requirements_task_list_page_is_not_modified_until_the_brief_is_updated(self, brief):
+        url = f"/buyers/frameworks/{brief['framework']['slug']}/requirements/{brief['lotSlug']}/{brief['id']}"
+        etag = self.client.get(url).headers['ETag']
+
+        with mock.patch("app.main.views.requirement_task_list.render_template") as render_template:
+            res = self.client.get(url, headers={"If-None-Match": etag})
+        assert res.status_code == 304
+        assert render_template.called is False
+
+        brief["updatedAt"] = "2020-01-01T00:00:00.000000Z"
+        res = self.client.get(url, headers={"If-None-Match": etag})
+        assert res.status_code == 200
+        assert res.headers["ETag"] != etag
+
 
 class TestRequirementsTaskListPageDraftBrief(BaseRequirementsTaskListPageTest, BaseApplicationTest):
     """Test the requirements task list page when a brief is being drafted
@@ -104,6 +104,29 @@ class TestClarificationQuestionsPage(BaseApplicationTest):
         assert "Answer a supplier question" in page_html
         assert "No questions or answers have been published" not in page_html
 
+    def test_clarification_questions_page_is_not_modified_until_a_question_is_published(self):
+        url = "/buyers/frameworks/digital-outcomes-and-specialists-4/requirements/digital-specialists/1234/supplier-questions"  # noqa
+        brief_json = BriefStub(
+            framework_slug="digital-outcomes-and-specialists-4",
+            status="live",
+        ).single_result_response()
+        self.data_api_client.get_brief.return_value = brief_json
+
+        etag = self.client.get(url).headers['ETag']
+        with mock.patch('app.main.views.supplier_questions.render_template') as render_template:
+            res = self.client.get(url, headers={'If-None-Match': etag})
+        assert res.status_code == 304
+        assert render_template.called is False
+
+        brief_json['briefs']['clarificationQuestions'] = [
+            {"question": "Why is my question a question?",
+             "answer": "Because",
+             "publishedAt": "2016-01-01T00:00:00.000000Z"}
+        ]
+        res = self.client.get(url, headers={'If-None-Match': etag})
+        assert res.status_code == 200
+        assert "Why is my question a question?" in res.get_data(as_text=True)
+
     def test_clarification_questions_page_returns_404_if_not_live_brief(self):
         self.data_api_client.get_brief.return_value = BriefStub(
             framework_slug="digital-outcomes-and-specialists-4",
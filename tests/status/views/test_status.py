@@ -56,3 +56,50 @@ class TestStatus(BaseApplicationTest):
 
         assert "{}".format(json_data['status']) == "error"
         assert json_data.get('api_status') == {'status': 'n/a'}
+
+
+class TestInvalidateFrameworkCache(BaseApplicationTest):
+
+    def setup_method(self, method):
+        super().setup_method(method)
+        self.app.config['DM_FRAMEWORK_CACHE_INVALIDATION_TOKEN'] = 'invalidation-token'
+
+        self.framework_cache_patch = mock.patch('app.status.views.framework_cache', autospec=True)
+        self.framework_cache = self.framework_cache_patch.start()
+
+    def teardown_method(self, method):
+        self.framework_cache_patch.stop()
+        super().teardown_method(method)
+
+    def test_invalidates_every_framework(self):
+        response = self.client.delete(
+            '/buyers/_framework-cache', headers={'Authorization': 'Bearer invalidation-token'}
+        )
+
+        assert response.status_code == 200
+        assert self.framework_cache.invalidate.call_args_list == [mock.call(None)]
+
+    def test_invalidates_a_single_framework(self):
+        response = self.client.delete(
+            '/buyers/_framework-cache?framework=digital-outcomes-and-specialists-4',
+            headers={'Authorization': 'Bearer invalidation-token'},
+        )
+
+        assert response.status_code == 200
+        assert self.framework_cache.invalidate.call_args_list == [mock.call('digital-outcomes-and-specialists-4')]
+
+    def test_403_for_wrong_token(self):
+        response = self.client.delete('/buyers/_framework-cache', headers={'Authorization': 'Bearer wrong-token'})
+
+        assert response.status_code == 403
+        assert self.framework_cache.invalidate.called is False
+
+    def test_404_when_no_token_configured(self):
+        self.app.config['DM_FRAMEWORK_CACHE_INVALIDATION_TOKEN'] = None
+
+        response = self.client.delete(
+            '/buyers/_framework-cache', headers={'Authorization': 'Bearer invalidation-token'}
+        )
+
+        assert response.status_code == 404
+        assert self.framework_cache.invalidate.called is False
@@ -0,0 +1,96 @@
+import mock
+import pytest
+
+from dmapiclient.audit import AuditTypes
+
+from app.api_client import RequestMemoizingDataAPIClient
+
+from .helpers import BaseApplicationTest
+
+
+class TestRequestMemoizingDataAPIClient(BaseApplicationTest):
+
+    def setup_method(self, method):
+        super().setup_method(method)
+        self.request_patch = mock.patch('dmapiclient.base.BaseAPIClient._request', autospec=True)
+        self.base_request = self.request_patch.start()
+        self.base_request.side_effect = lambda client, method, url, **kwargs: {"url": url, "method": method}
+
+        self.client_under_test = RequestMemoizingDataAPIClient()
+        self.client_under_test.init_app(self.app)
+
+    def teardown_method(self, method):
+        self.request_patch.stop()
+        super().teardown_method(method)
+
+    def _api_urls_requested(self):
+        return [call[0][2] for call in self.base_request.call_args_list]
+
+    def test_identical_reads_are_only_requested_once_per_request(self):
+        with self.app.test_request_context('/'):
+            first = self.client_under_test.get_brief(1234)
+            second = self.client_under_test.get_brief(1234)
+            self.client_under_test.get_framework('digital-outcomes-and-specialists-4')
+
+            assert first == second
+            assert self._api_urls_requested() == ["/briefs/1234", "/frameworks/digital-outcomes-and-specialists-4"]
+            assert self.client_under_test.calls_saved() == 1
+
+    def test_memoized_results_are_independent_copies(self):
+        with self.app.test_request_context('/'):
+            self.client_under_test.get_brief(1234)["mutated"] = True
+
+            assert "mutated" not in self.client_under_test.get_brief(1234)
+
+    def test_reads_with_different_params_are_requested_separately(self):
+        with self.app.test_request_context('/'):
+            self.client_under_test.find_direct_award_projects(123, locked=True, having_outcome=False)
+            self.client_under_test.find_direct_award_projects(123)
+
+            assert len(self.base_request.call_args_list) == 2
+
+    def test_memo_does_not_outlive_the_request(self):
+        for _ in range(2):
+            with self.app.test_request_context('/'):
+                self.client_under_test.get_brief(1234)
+
+        assert self._api_urls_requested() == ["/briefs/1234", "/briefs/1234"]
+
+    @pytest.mark.parametrize("write", (
+        lambda client: client.publish_brief(1234, "user@example.com"),
+        lambda client: client.withdraw_brief(1234, "user@example.com"),
+        lambda client: client.update_brief(1234, {"title": "Title"}, updated_by="user@example.com"),
+        lambda client: client.update_brief_award_brief_response(1234, 5678, "user@example.com"),
+    ))
+    def test_writes_to_a_brief_drop_its_memoized_reads(self, write):
+        with self.app.test_request_context('/'):
+            self.client_under_test.get_brief(1234)
+            self.client_under_test.get_brief(9999)
+            self.client_under_test.find_brief_responses(1234)
+            self.client_under_test.get_framework('digital-outcomes-and-specialists-4')
+
+            write(self.client_under_test)
+            self.base_request.reset_mock()
+
+            self.client_under_test.get_brief(1234)
+            self.client_under_test.get_brief(9999)
+            self.client_under_test.find_brief_responses(1234)
+            self.client_under_test.get_framework('digital-outcomes-and-specialists-4')
+
+            assert self._api_urls_requested() == ["/briefs/1234", "/brief-responses"]
+
+    def test_other_writes_drop_every_memoized_read(self):
+        with self.app.test_request_context('/'):
+            self.client_under_test.get_brief(1234)
+            self.client_under_test.create_audit_event(audit_type=AuditTypes.invite_user, data={})
+            self.base_request.reset_mock()
+
+            self.client_under_test.get_brief(1234)
+
+            assert self._api_urls_requested() == ["/briefs/1234"]
+
+    def test_nothing_is_memoized_outside_a_request(self):
+        self.client_under_test.get_brief(1234)
+        self.client_under_test.get_brief(1234)
+
+        assert len(self.base_request.call_args_list) == 2
@@ -0,0 +1,130 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import mock
+import pytest
+
+from dmapiclient import DataAPIClient, HTTPError
+
+from app.api_client import RequestMemoizingDataAPIClient
+from app.api_transport import PooledTransport
+from app.metrics import DATA_API_CONNECTIONS_IN_USE, DATA_API_CONNECTIONS_OPENED_TOTAL
+
+from .helpers import BaseApplicationTest
+
+
+class StubAPIHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def _respond(self):
+        self.server.requests.append((self.command, self.path))
+        if 'Content-Length' in self.headers:
+            self.rfile.read(int(self.headers['Content-Length']))
+
+        status = self.server.statuses.pop(0) if self.server.statuses else 200
+        body = json.dumps({'path': self.path}).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = _respond
+
+    def log_message(self, *args):
+        pass
+
+
+class TestPooledTransport(BaseApplicationTest):
+
+    def setup_method(self, method):
+        super().setup_method(method)
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), StubAPIHandler)
+        self.server.daemon_threads = True
+        self.server.connections = 0
+        self.server.requests = []
+        self.server.statuses = []
+        threading.Thread(target=self.server.serve_forever, kwargs={'poll_interval': 0.01}, daemon=True).start()
+
+        self.app.config['DM_DATA_API_URL'] = 'http://127.0.0.1:{}'.format(self.server.server_address[1])
+        self.app.config['DM_DATA_API_RETRY_BACKOFF_FACTOR'] = 0
+        self.client_under_test = RequestMemoizingDataAPIClient()
+        self.client_under_test.init_app(self.app)
+        # a request of our own, so API calls are never answered from the memo of one left over from another test
+        self.request_context = self.app.test_request_context('/')
+        self.request_context.push()
+
+    def teardown_method(self, method):
+        self.request_context.pop()
+        self.client_under_test.transport.close()
+        self.server.shutdown()
+        self.server.server_close()
+        super().teardown_method(method)
+
+    def test_init_app_configures_transport_and_timeouts(self):
+        self.app.config.update({
+            'DM_DATA_API_POOL_SIZE': 3,
+            'DM_DATA_API_POOL_BLOCK': True,
+            'DM_DATA_API_CONNECT_TIMEOUT': 2,
+            'DM_DATA_API_READ_TIMEOUT': 5,
+        })
+        self.client_under_test.init_app(self.app)
+
+        assert self.client_under_test.timeout == (2, 5)
+        adapter = self.client_under_test.transport.session().get_adapter('http://127.0.0.1')
+        assert adapter._pool_maxsize == 3
+        assert adapter._pool_block is True
+
+    def test_connection_is_reused_between_calls(self):
+        opened_before = DATA_API_CONNECTIONS_OPENED_TOTAL._value.get()
+
+        for brief_id in range(5):
+            assert self.client_under_test.get_brief(brief_id) == {'path': '/briefs/{}'.format(brief_id)}
+
+        assert self.server.connections == 1
+        assert DATA_API_CONNECTIONS_OPENED_TOTAL._value.get() == opened_before + 1
+
+    def test_plain_client_opens_a_connection_for_each_call(self):
+        client = DataAPIClient(self.app.config['DM_DATA_API_URL'], 'myToken')
+
+        for brief_id in range(5):
+            client.get_brief(brief_id)
+
+        assert self.server.connections == 5
+
+    def test_connections_are_returned_to_the_pool(self):
+        in_use_before = DATA_API_CONNECTIONS_IN_USE._value.get()
+
+        self.client_under_test.get_brief(1234)
+
+        assert DATA_API_CONNECTIONS_IN_USE._value.get() == in_use_before
+
+    def test_gets_are_retried_after_server_errors(self):
+        self.server.statuses = [503, 502]
+
+        assert self.client_under_test.get_brief(1234) == {'path': '/briefs/1234'}
+        assert self.server.requests == [('GET', '/briefs/1234')] * 3
+
+    def test_posts_are_not_retried_after_server_errors(self):
+        self.server.statuses = [503]
+
+        with pytest.raises(HTTPError):
+            self.client_under_test.create_brief(
+                'digital-outcomes-and-specialists-4', 'digital-specialists', 123, {}, updated_by='user@example.com',
+            )
+        assert len(self.server.requests) == 1
+
+    def test_sessions_are_not_shared_with_forked_processes(self):
+        transport = PooledTransport()
+        session = transport.session()
+        assert transport.session() is session
+        assert transport.session(retry_read_timeouts=False) is not session
+
+        with mock.patch('app.api_transport.os.getpid', return_value=-1):
+            assert transport.session() is not session
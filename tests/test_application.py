@@ -3,6 +3,8 @@ from lxml import html
 from wtforms import ValidationError
 
 from .helpers import BaseApplicationTest
+from app import create_app
+from config import configs
 from dmapiclient.errors import HTTPError
 
 
@@ -82,3 +84,19 @@ class TestApplication(BaseApplicationTest):
         document = html.fromstring(res.get_data(as_text=True))
         cookie_banner = document.xpath('//div[@id="dm-cookie-banner"]')
         assert cookie_banner[0].xpath('//h2//text()')[0].strip() == "Can we store analytics cookies on your device?"
+
+
+class TestPreforkWarmUp(BaseApplicationTest):
+
+    @mock.patch('app.gc', autospec=True)
+    def test_app_is_not_warmed_up_by_default(self, gc):
+        create_app('test')
+
+        assert gc.freeze.called is False
+
+    @mock.patch('app.gc', autospec=True)
+    def test_warm_up_freezes_garbage_collector(self, gc):
+        with mock.patch.object(configs['test'], 'DM_PREFORK_WARM_UP', True):
+            create_app('test')
+
+        assert gc.mock_calls == [mock.call.collect(), mock.call.freeze()]
@@ -0,0 +1,116 @@
+import threading
+
+import pytest
+from flask import g, request
+
+from app.concurrent_fetch import ConcurrentFetcher
+
+from .helpers import BaseApplicationTest
+
+
+class TestConcurrentFetcher(BaseApplicationTest):
+
+    def setup_method(self, method):
+        super().setup_method(method)
+        self.concurrent_fetcher = ConcurrentFetcher(max_workers=4)
+
+    def teardown_method(self, method):
+        self.concurrent_fetcher.shutdown()
+        super().teardown_method(method)
+
+    def test_results_are_returned_in_order(self):
+        with self.app.test_request_context('/'):
+            assert self.concurrent_fetcher.fetch_all(lambda: 1, lambda: 2, lambda: 3) == [1, 2, 3]
+
+    def test_fetches_are_made_concurrently(self):
+        # would time out if the fetches were made one after the other
+        barrier = threading.Barrier(3, timeout=5)
+
+        with self.app.test_request_context('/'):
+            thread_names = self.concurrent_fetcher.fetch_all(*(
+                lambda: barrier.wait() is not None and threading.current_thread().name for _ in range(3)
+            ))
+
+        assert len(set(thread_names)) == 3
+        assert all(name.startswith('concurrent-fetch') for name in thread_names)
+
+    def test_fetches_which_find_the_pool_busy_are_made_in_this_thread(self):
+        self.concurrent_fetcher.max_workers = 1
+        # would time out if the second fetch waited for the first to finish
+        barrier = threading.Barrier(2, timeout=5)
+
+        with self.app.test_request_context('/'):
+            thread_names = self.concurrent_fetcher.fetch_all(*(
+                lambda: barrier.wait() is not None and threading.current_thread().name for _ in range(2)
+            ))
+
+        assert thread_names[0].startswith('concurrent-fetch')
+        assert thread_names[1] == threading.current_thread().name
+
+    def test_busy_workers_are_free_again_once_their_fetches_finish(self):
+        self.concurrent_fetcher.max_workers = 1
+
+        with self.app.test_request_context('/'):
+            for _ in range(3):
+                [thread_name] = self.concurrent_fetcher.fetch_all(lambda: threading.current_thread().name)
+                assert thread_name.startswith('concurrent-fetch')
+
+    def test_fetches_share_the_request_and_g(self):
+        def fetch():
+            g.fetched_from = threading.current_thread().name
+            return request.path, request.args['q']
+
+        with self.app.test_request_context('/buyers?q=thing'):
+            assert self.concurrent_fetcher.fetch_all(fetch) == [('/buyers', 'thing')]
+            assert g.fetched_from.startswith('concurrent-fetch')
+
+    def test_fetches_share_one_data_api_memo_made_before_they_start(self):
+        with self.app.test_request_context('/'):
+            memos = self.concurrent_fetcher.fetch_all(*(lambda: g._data_api_memo for _ in range(3)))
+
+            assert all(memo is g._data_api_memo for memo in memos)
+
+    def test_first_exception_is_raised_after_all_fetches_finish(self):
+        finished = []
+
+        def fail(message):
+            raise ValueError(message)
+
+        with self.app.test_request_context('/'):
+            with pytest.raises(ValueError, match='first'):
+                self.concurrent_fetcher.fetch_all(
+                    lambda: 1,
+                    lambda: fail('first'),
+                    lambda: fail('second'),
+                    lambda: finished.append(True),
+                )
+
+        assert finished == [True]
+
+    def test_fetches_outside_a_request_are_made_in_this_thread(self):
+        with self.app.app_context():
+            assert self.concurrent_fetcher.fetch_all(lambda: threading.current_thread().name) == [
+                threading.current_thread().name
+            ]
+
+    def test_no_workers_makes_fetches_in_this_thread(self):
+        self.concurrent_fetcher.max_workers = 0
+
+        with self.app.test_request_context('/'):
+            assert self.concurrent_fetcher.fetch_all(lambda: threading.current_thread().name) == [
+                threading.current_thread().name
+            ]
+
+    def test_nested_fetches_do_not_wait_for_the_pool(self):
+        self.concurrent_fetcher.max_workers = 1
+
+        with self.app.test_request_context('/'):
+            assert self.concurrent_fetcher.fetch_all(
+                lambda: self.concurrent_fetcher.fetch_all(lambda: 1, lambda: 2)
+            ) == [[1, 2]]
+
+    def test_init_app_sets_max_workers_from_config(self):
+        self.app.config['DM_CONCURRENT_FETCH_MAX_WORKERS'] = 2
+        self.concurrent_fetcher.init_app(self.app)
+
+        assert self.concurrent_fetcher.max_workers == 2
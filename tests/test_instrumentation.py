@@ -0,0 +1,93 @@
+import mock
+from flask import render_template_string
+
+from app import data_api_client
+from app.instrumentation import RequestTimings, request_instrumentation
+from app.metrics import (
+    DATA_API_CALLS_PER_REQUEST,
+    DATA_API_METHOD_DURATION_SECONDS,
+    TEMPLATE_RENDER_DURATION_SECONDS,
+)
+
+from .helpers import BaseApplicationTest
+
+
+def observations(histogram):
+    return sum(bucket.get() for bucket in histogram._buckets)
+
+
+class TestRequestInstrumentation(BaseApplicationTest):
+
+    def setup_method(self, method):
+        super().setup_method(method)
+        self.request_patch = mock.patch('dmapiclient.base.BaseAPIClient._request', autospec=True)
+        self.base_request = self.request_patch.start()
+        self.base_request.side_effect = lambda client, method, url, **kwargs: {"briefs": {"id": 1234}}
+
+        self.app.add_url_rule('/buyers/instrumented', 'instrumented', self.instrumented_view)
+
+    def teardown_method(self, method):
+        self.request_patch.stop()
+        super().teardown_method(method)
+
+    @staticmethod
+    def instrumented_view():
+        data_api_client.get_brief(1234)
+        data_api_client.get_brief(1234)
+        data_api_client.find_briefs_iter(user_id=1)
+        data_api_client.get_framework('digital-outcomes-and-specialists-4')
+        return render_template_string("{{ brief_id }}", brief_id=1234)
+
+    def test_api_calls_and_render_time_are_recorded_for_the_endpoint(self):
+        calls = DATA_API_CALLS_PER_REQUEST.labels('instrumented')
+        get_brief = DATA_API_METHOD_DURATION_SECONDS.labels('instrumented', 'get_brief')
+        get_framework = DATA_API_METHOD_DURATION_SECONDS.labels('instrumented', 'get_framework')
+        render = TEMPLATE_RENDER_DURATION_SECONDS.labels('instrumented')
+        calls_before, get_brief_before, render_before = calls._sum.get(), observations(get_brief), observations(render)
+        get_framework_before = observations(get_framework)
+
+        response = self.client.get('/buyers/instrumented')
+
+        assert response.status_code == 200
+        # the second read of the brief is answered from the request's memo
+        assert calls._sum.get() == calls_before + 2
+        assert observations(get_brief) == get_brief_before + 2
+        assert observations(get_framework) == get_framework_before + 1
+        assert observations(render) == render_before + 1
+
+    def test_server_timing_header(self):
+        response = self.client.get('/buyers/instrumented')
+
+        api, render = response.headers['Server-Timing'].split(', ')
+        assert api.startswith('api;desc="2 data API calls";dur=')
+        assert render.startswith('render;dur=')
+
+    def test_no_server_timing_header_unless_configured(self):
+        with mock.patch('app.instrumentation.request_instrumentation.server_timing_header', False):
+            response = self.client.get('/buyers/instrumented')
+
+        assert 'Server-Timing' not in response.headers
+
+    def test_only_the_outermost_api_method_is_timed(self):
+        outer = DATA_API_METHOD_DURATION_SECONDS.labels('No endpoint', 'outer')
+        inner = DATA_API_METHOD_DURATION_SECONDS.labels('No endpoint', 'inner')
+        outer_before, inner_before = observations(outer), observations(inner)
+
+        with request_instrumentation.timed_api_method('outer'):
+            with request_instrumentation.timed_api_method('inner'):
+                pass
+
+        assert observations(outer) == outer_before + 1
+        assert observations(inner) == inner_before
+
+
+class TestRequestTimings(object):
+
+    def test_server_timing(self):
+        timings = RequestTimings()
+        timings.add_api_call()
+        timings.add_api_call()
+        timings.add_api_seconds(0.12345)
+        timings.add_render_seconds(0.01)
+
+        assert timings.server_timing() == 'api;desc="2 data API calls";dur=123.5, render;dur=10.0'
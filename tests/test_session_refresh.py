@@ -0,0 +1,88 @@
+import mock
+from flask import session
+
+from app.metrics import SESSION_WRITES_AVOIDED_TOTAL
+from app.session_refresh import SlidingSessionRefresh, session_refresh
+from .helpers import BaseApplicationTest
+
+
+class TestSlidingSessionRefresh(BaseApplicationTest):
+
+    def setup_method(self, method):
+        super().setup_method(method)
+        self.app.add_url_rule('/buyers/session-test', 'session_test', lambda: 'ok')
+        self.app.add_url_rule('/buyers/session-change', 'session_change', self.change_session)
+        session_refresh.refresh_fraction = 0.5
+        self.app.config['PERMANENT_SESSION_LIFETIME'] = 3600
+
+    @staticmethod
+    def change_session():
+        session['changed'] = True
+        return 'ok'
+
+    def session_cookie(self, response):
+        return self.get_cookie_by_name(response, self.app.config['SESSION_COOKIE_NAME'])
+
+    def test_logged_in_session_is_refreshed_when_it_has_not_been_yet(self):
+        self.login_as_buyer()
+        with self.client.session_transaction() as test_session:
+            test_session.permanent = False
+            test_session.pop(SlidingSessionRefresh.REFRESHED_AT_KEY, None)
+
+        with mock.patch('app.session_refresh.time', return_value=10000.5):
+            response = self.client.get('/buyers/session-test')
+
+        assert self.session_cookie(response) is not None
+        with self.client.session_transaction() as test_session:
+            assert test_session.permanent
+            assert test_session[SlidingSessionRefresh.REFRESHED_AT_KEY] == 10000
+
+    def test_session_is_not_saved_again_until_the_refresh_fraction_has_passed(self):
+        self.login_as_buyer()
+        with mock.patch('app.session_refresh.time', return_value=10000):
+            self.client.get('/buyers/session-test')
+
+        avoided = SESSION_WRITES_AVOIDED_TOTAL._value.get()
+        with mock.patch('app.session_refresh.time', return_value=10000 + 1799):
+            response = self.client.get('/buyers/session-test')
+
+        assert self.session_cookie(response) is None
+        assert SESSION_WRITES_AVOIDED_TOTAL._value.get() == avoided + 1
+
+        with mock.patch('app.session_refresh.time', return_value=10000 + 1800):
+            response = self.client.get('/buyers/session-test')
+
+        assert self.session_cookie(response) is not None
+        with self.client.session_transaction() as test_session:
+            assert test_session[SlidingSessionRefresh.REFRESHED_AT_KEY] == 11800
+
+    def test_refresh_fraction_of_zero_refreshes_on_every_request(self):
+        session_refresh.refresh_fraction = 0
+        self.login_as_buyer()
+        self.client.get('/buyers/session-test')
+
+        assert self.session_cookie(self.client.get('/buyers/session-test')) is not None
+
+    def test_session_is_not_refreshed_without_a_logged_in_user(self):
+        response = self.client.get('/buyers/session-test')
+
+        assert self.session_cookie(response) is None
+        with self.client.session_transaction() as test_session:
+            assert not test_session.permanent
+
+    def test_session_is_not_refreshed_by_healthchecks(self):
+        self.login_as_buyer()
+        with self.client.session_transaction() as test_session:
+            test_session.pop(SlidingSessionRefresh.REFRESHED_AT_KEY, None)
+
+        response = self.client.get('/healthcheck')
+
+        assert self.session_cookie(response) is None
+        with self.client.session_transaction() as test_session:
+            assert SlidingSessionRefresh.REFRESHED_AT_KEY not in test_session
+
+    def test_changed_session_is_always_saved(self):
+        self.login_as_buyer()
+        self.client.get('/buyers/session-test')
+
+        assert self.session_cookie(self.client.get('/buyers/session-change')) is not None
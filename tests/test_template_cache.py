@@ -0,0 +1,124 @@
+import os
+
+import jinja2
+import mock
+import pytest
+
+from app import template_cache
+from app.template_cache import (
+    IndexedFileSystemLoader,
+    TemplateBytecodeCache,
+    iter_page_templates,
+    precompile_templates,
+)
+from config import configs
+
+from .helpers import BaseApplicationTest
+
+
+class TestTemplateBytecodeCache(object):
+
+    def setup_method(self, method):
+        self.templates = {'page.html': '{% extends "base.html" %}{% block body %}{{ 1 + 1 }}{% endblock %}'}
+
+    def environment(self, directory):
+        return jinja2.Environment(
+            loader=jinja2.DictLoader(self.templates),
+            bytecode_cache=TemplateBytecodeCache(directory),
+        )
+
+    def test_compiled_template_is_stored_and_used_by_another_environment(self, tmpdir):
+        self.environment(str(tmpdir)).get_template('page.html')
+
+        # nothing left behind from writing the file
+        [filename] = os.listdir(str(tmpdir))
+        assert filename.startswith('__jinja2_')
+        with mock.patch.object(jinja2.Environment, '_compile') as compile_template:
+            self.environment(str(tmpdir)).get_template('page.html')
+        assert not compile_template.called
+
+    def test_failing_to_store_a_compiled_template_does_not_fail_the_page(self, tmpdir):
+        environment = self.environment(str(tmpdir.join('missing')))
+
+        assert environment.get_template('page.html') is not None
+        assert not tmpdir.join('missing').exists()
+
+
+class TestIndexedFileSystemLoader(object):
+
+    def setup_method(self, method):
+        self.environment = jinja2.Environment()
+
+    @pytest.fixture
+    def search_paths(self, tmpdir):
+        tmpdir.join('first', 'page.html').write('first page', ensure=True)
+        tmpdir.join('second', 'page.html').write('second page', ensure=True)
+        tmpdir.join('second', 'components', 'button', 'macro.njk').write('button', ensure=True)
+        return [str(tmpdir.join('first')), str(tmpdir.join('second'))]
+
+    def test_templates_are_found_in_the_first_search_path_they_are_in(self, search_paths):
+        loader = IndexedFileSystemLoader(search_paths)
+
+        assert loader.get_source(self.environment, 'page.html') == (
+            'first page', os.path.join(search_paths[0], 'page.html'), None
+        )
+        assert loader.get_source(self.environment, './components/button/macro.njk') == (
+            'button', os.path.join(search_paths[1], 'components', 'button', 'macro.njk'), None
+        )
+        assert loader.list_templates() == ['components/button/macro.njk', 'page.html']
+
+    def test_search_paths_are_not_probed_once_indexed(self, search_paths):
+        loader = IndexedFileSystemLoader(search_paths)
+
+        with mock.patch('os.path.getmtime') as getmtime, mock.patch('jinja2.loaders.open_if_exists') as open_if_exists:
+            template = loader.load(self.environment, 'components/button/macro.njk')
+
+        assert template.render() == 'button'
+        assert template.is_up_to_date
+        assert not getmtime.called
+        assert not open_if_exists.called
+
+    @pytest.mark.parametrize('name', ['missing.html', 'components/../page.html', '../first/page.html'])
+    def test_missing_or_unsafe_templates_are_not_found(self, search_paths, name):
+        with pytest.raises(jinja2.TemplateNotFound):
+            IndexedFileSystemLoader(search_paths).get_source(self.environment, name)
+
+    def test_used_unless_templates_are_reloaded(self):
+        app = mock.Mock(debug=False, config={})
+        configs['test'].init_app(app)
+        assert isinstance(app.jinja_loader, IndexedFileSystemLoader)
+
+        app = mock.Mock(debug=True, config={})
+        configs['test'].init_app(app)
+        assert type(app.jinja_loader) is jinja2.FileSystemLoader
+
+
+class TestPrecompileTemplates(BaseApplicationTest):
+
+    def test_page_templates_are_found(self):
+        names = list(iter_page_templates(self.app))
+
+        assert 'buyers/dashboard.html' in names
+        assert 'create_buyer/create_buyer_account.html' in names
+        assert not any(name.startswith('macros/') for name in names)
+
+    def test_page_templates_and_the_templates_they_use_are_compiled(self):
+        compiled = precompile_templates(self.app)
+
+        assert 'buyers/dashboard.html' in compiled
+        # extended by the page templates
+        assert '_base_page.html' in compiled
+        # imported by the page templates
+        assert 'macros/brief_links.html' in compiled
+        with mock.patch.object(self.app.jinja_env, '_compile') as compile_template:
+            self.app.jinja_env.get_template('buyers/dashboard.html')
+        assert not compile_template.called
+
+    def test_bytecode_cache_is_only_used_if_configured(self, tmpdir):
+        assert self.app.jinja_env.bytecode_cache is None
+
+        self.app.config['DM_TEMPLATE_BYTECODE_CACHE_DIRECTORY'] = str(tmpdir.join('templates'))
+        template_cache.init_app(self.app)
+
+        assert isinstance(self.app.jinja_env.bytecode_cache, TemplateBytecodeCache)
+        assert tmpdir.join('templates').isdir()
@@ -0,0 +1,85 @@
+import mock
+from flask import Flask, session
+
+from app.metrics import USER_CACHE_TOTAL
+from app.user_cache import UserCache
+from .helpers import BaseApplicationTest
+
+
+class TestUserCache(object):
+
+    def setup_method(self, method):
+        self.now = 1000.0
+        self.user_cache = UserCache(ttl=30, max_size=2, clock=lambda: self.now)
+        self.data_api_client = mock.Mock()
+        self.user_json = BaseApplicationTest.user(123, "buyer@email.com", None, None, "Ā Buyer", role='buyer')
+        self.data_api_client.get_user.side_effect = lambda user_id: self.user_json
+        self.app = Flask(__name__)
+        self.app.secret_key = 'KEY'
+
+    def load_user(self, user_id='123'):
+        with self.app.test_request_context('/'):
+            return self.user_cache.load_user(self.data_api_client, user_id)
+
+    def test_user_is_loaded_once_within_ttl(self):
+        misses = USER_CACHE_TOTAL.labels(result='miss')._value.get()
+        hits = USER_CACHE_TOTAL.labels(result='hit')._value.get()
+
+        first = self.load_user()
+        self.now += 29
+        second = self.load_user()
+
+        assert first.id == second.id == 123
+        assert first.email_address == "buyer@email.com"
+        assert self.data_api_client.get_user.call_args_list == [mock.call(user_id=123)]
+        assert USER_CACHE_TOTAL.labels(result='miss')._value.get() == misses + 1
+        assert USER_CACHE_TOTAL.labels(result='hit')._value.get() == hits + 1
+
+    def test_user_is_loaded_again_after_ttl(self):
+        self.load_user()
+        self.now += 30
+        self.load_user()
+
+        assert self.data_api_client.get_user.call_count == 2
+
+    def test_locked_user_is_not_returned_but_is_cached(self):
+        self.user_json['users']['locked'] = True
+
+        assert self.load_user() is None
+        assert self.load_user() is None
+        assert self.data_api_client.get_user.call_count == 1
+
+    def test_missing_user_is_not_cached(self):
+        self.data_api_client.get_user.side_effect = lambda user_id: None
+
+        assert self.load_user() is None
+        assert self.load_user() is None
+        assert self.data_api_client.get_user.call_count == 2
+
+    def test_session_is_not_modified(self):
+        with self.app.test_request_context('/'):
+            self.user_cache.load_user(self.data_api_client, '123')
+            self.user_cache.load_user(self.data_api_client, '123')
+
+            assert not session.modified
+
+    def test_longest_cached_user_is_dropped_when_full(self):
+        for user_id in ('1', '2', '3', '1'):
+            self.load_user(user_id)
+
+        assert [call[1]['user_id'] for call in self.data_api_client.get_user.call_args_list] == [1, 2, 3, 1]
+
+    def test_invalidate(self):
+        self.load_user()
+        self.user_cache.invalidate(123)
+        self.load_user()
+
+        assert self.data_api_client.get_user.call_count == 2
+
+    def test_ttl_of_zero_disables_cache(self):
+        self.user_cache.ttl = 0
+
+        self.load_user()
+        self.load_user()
+
+        assert self.data_api_client.get_user.call_count == 2